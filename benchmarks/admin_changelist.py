@@ -0,0 +1,119 @@
+"""
+Admin changelist benchmark: the users changelist on a big table.
+
+Seeds ``--users`` users with SQL, analyzes the table, then times
+``/admin/users/user/`` through the full middleware stack, in process: the first
+page, a page deep in the list, and searches. Each is timed with ``UserAdmin``
+as it is, and as Django's defaults had it: an exact ``COUNT(*)`` of the
+results and another of the whole table, a contains search on ``name``, and
+every column of every user listed::
+
+    $ python -m benchmarks.admin_changelist --users 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+URL = "/admin/users/user/"
+FIRST_NAMES = ["Alice", "Bruno", "Chen", "Dana", "Emeka", "Farah", "Goran", "Hana"]
+LAST_NAMES = ["Smith", "Okafor", "Novak", "Silva", "Tanaka", "Haddad", "Kowalski"]
+
+
+def _seed(users: int) -> None:
+    from django.contrib.auth.hashers import make_password
+    from django.db import connection
+
+    sys.stderr.write(f"Seeding {users:,} users...\n")
+    with connection.cursor() as cursor:
+        # Names cycle through every first and last name pair.
+        cursor.execute(
+            f"""
+            INSERT INTO users_user (
+                password, is_superuser, username, email, is_staff, is_active,
+                date_joined, name, updated
+            )
+            SELECT
+                %s, false, 'user' || n, 'user' || n || '@example.com', false,
+                true, now(),
+                (%s::text[])[1 + n %% {len(FIRST_NAMES)}] || ' '
+                    || (%s::text[])[1 + n / {len(FIRST_NAMES)} %% {len(LAST_NAMES)}],
+                now()
+            FROM generate_series(1, %s) AS n
+            """,
+            [make_password(None), FIRST_NAMES, LAST_NAMES, users],
+        )
+        cursor.execute("ANALYZE users_user")
+
+
+def _stock(user_admin) -> None:
+    """Django's defaults, and the search this project started with."""
+    from django.contrib.admin.views.main import ChangeList
+    from django.core.paginator import Paginator
+
+    user_admin.paginator = Paginator
+    user_admin.show_full_result_count = True
+    user_admin.search_fields = ["name"]
+    user_admin.get_changelist = lambda request, **kwargs: ChangeList
+
+
+def _time(client, params: dict, requests: int) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get(URL, params)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:  # noqa: PLR2004
+            msg = f"Request failed with {response.status_code}"
+            raise RuntimeError(msg)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib import admin
+    from django.test import Client
+
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+    # Halfway through, at the changelist's 100 users a page.
+    middle = max(args.users // 200, 1)
+    pages = {
+        "first page": {},
+        f"page {middle:,}": {"p": middle},
+        "search 'user12345'": {"q": "user12345"},
+        # An eighth of the users.
+        "search 'hana'": {"q": "hana"},
+    }
+    rows = []
+    with benchmark_database():
+        _seed(args.users)
+        client = Client()
+        client.force_login(User.objects.create_superuser("benchmark"))
+        for label in ["as is", "Django's defaults"]:
+            user_admin = admin.site._registry[User]  # noqa: SLF001
+            if label != "as is":
+                _stock(user_admin)
+            for page, params in pages.items():
+                _time(client, params, 1)
+                summary = summarize_latencies(_time(client, params, args.requests))
+                rows.append([label, page, summary["p50_ms"], summary["p99_ms"]])
+    print_table(["UserAdmin", "changelist", "p50 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
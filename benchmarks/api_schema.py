@@ -0,0 +1,89 @@
+"""
+API schema benchmark: generating the OpenAPI schema per request vs serving it.
+
+Sends ``GET /api/schema/`` (YAML) and ``GET /api/schema/?format=json`` as an
+admin through the full middleware stack, in process. "generated" has no
+``API_SCHEMA_FILE``, so every request introspects the API and renders the
+result, as ``SpectacularAPIView`` does; "stored" serves a file written by
+``generate_schema()``, and "revalidated" sends its ETag back and gets a 304.
+Reports the median of each::
+
+    $ python -m benchmarks.api_schema --requests 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+FORMATS = [("yaml", {}), ("json", {"format": "json"})]
+
+
+def _run(client, params: dict, requests: int, headers: dict) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get("/api/schema/", params, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code not in (200, 304):
+            msg = f"Request failed with {response.status_code}"
+            raise RuntimeError(msg)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test import Client
+
+    from restaurant_app.core.api.schema import generate_schema
+    from restaurant_app.core.api.schema import stored_schema
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+    rows = []
+    with benchmark_database(), tempfile.TemporaryDirectory() as directory:
+        client = Client()
+        client.force_login(User.objects.create_superuser("benchmark"))
+        path = Path(directory) / "openapi.yaml"
+        path.write_bytes(generate_schema())
+        for label, params in FORMATS:
+            settings.API_SCHEMA_FILE = ""
+            stored_schema.cache_clear()
+            _run(client, params, 1, {})
+            generated = summarize_latencies(_run(client, params, args.requests, {}))
+
+            settings.API_SCHEMA_FILE = str(path)
+            stored_schema.cache_clear()
+            etag = client.get("/api/schema/", params)["ETag"]
+            stored = summarize_latencies(_run(client, params, args.requests, {}))
+            revalidated = summarize_latencies(
+                _run(client, params, args.requests, {"if-none-match": etag}),
+            )
+            rows.append(
+                [
+                    label,
+                    generated["p50_ms"],
+                    stored["p50_ms"],
+                    revalidated["p50_ms"],
+                ],
+            )
+    print_table(
+        ["format", "generated p50 ms", "stored p50 ms", "revalidated p50 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
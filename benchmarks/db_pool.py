@@ -0,0 +1,200 @@
+"""
+Database connection benchmark: pooled vs persistent connections under load.
+
+Runs ``--threads`` threads against one WSGI handler, like a gunicorn worker
+with that many threads, each sending ``GET /api/restaurants/`` (two queries)
+as a logged-in user. Compares connecting per request (``CONN_MAX_AGE=0``),
+persistent connections (``CONN_MAX_AGE=60``, the production default) and a
+psycopg_pool pool of ``--pool-size`` connections. Reports requests/sec, latency
+percentiles, connections opened, the peak number of server connections, and
+the pool's wait time and timeouts::
+
+    $ python -m benchmarks.db_pool --threads 32 --requests 200 --pool-size 8
+
+Persistent connections keep one server connection per thread; the pool keeps
+``--pool-size`` whatever the thread count, at the cost of waiting for one when
+all are busy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+ENDPOINT = "/api/restaurants/"
+
+
+class ServerConnections(threading.Thread):
+    """Sample how many connections the database has open, from the server."""
+
+    def __init__(self, settings_dict: dict, interval: float = 0.005):
+        super().__init__(daemon=True)
+        self.settings_dict = settings_dict
+        self.interval = interval
+        self.peak = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        import psycopg
+
+        with psycopg.connect(
+            dbname=self.settings_dict["NAME"],
+            user=self.settings_dict["USER"],
+            password=self.settings_dict["PASSWORD"],
+            host=self.settings_dict["HOST"],
+            port=self.settings_dict["PORT"] or None,
+            autocommit=True,
+        ) as connection:
+            while not self._stop_event.is_set():
+                (count,) = connection.execute(
+                    "SELECT count(*) FROM pg_stat_activity "
+                    "WHERE datname = current_database() AND pid <> pg_backend_pid()",
+                ).fetchone()
+                self.peak = max(self.peak, count)
+                time.sleep(self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def _worker(handler, environ: dict, requests: int, latencies: list[float]) -> None:
+    from django.db import connections
+
+    def start_response(status, headers):
+        pass
+
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = handler(dict(environ), start_response)
+            response.close()
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:  # noqa: PLR2004
+                msg = f"Request failed with {response.status_code}"
+                raise RuntimeError(msg)
+    finally:
+        connections.close_all()
+
+
+def _run(environ: dict, threads: int, requests: int) -> dict:
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connection
+    from django.db.backends.signals import connection_created
+
+    handler = WSGIHandler()
+    opened = []
+
+    def count(sender, **kwargs):
+        opened.append(1)
+
+    connection_created.connect(count)
+    monitor = ServerConnections(connection.settings_dict)
+    monitor.start()
+    latencies: list[float] = []
+    workers = [
+        threading.Thread(target=_worker, args=(handler, environ, requests, latencies))
+        for _ in range(threads)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    monitor.stop()
+    connection_created.disconnect(count)
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "checkouts": len(opened),
+        "peak": monitor.peak,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=100, help="per thread")
+    parser.add_argument("--pool-size", type=int, default=8)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+    from django.test import Client
+    from django.test import RequestFactory
+
+    from restaurant_app.core.pooled_postgresql.base import close_pools
+    from restaurant_app.core.pooled_postgresql.base import pool_stats
+    from restaurant_app.menu.tests.factories import RestaurantFactory
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+    total = args.threads * args.requests
+
+    rows = []
+    with benchmark_database():
+        RestaurantFactory.create_batch(10)
+        client = Client()
+        client.force_login(User.objects.create_user("benchmark"))
+        session = client.cookies[settings.SESSION_COOKIE_NAME].value
+        cookie = f"{settings.SESSION_COOKIE_NAME}={session}"
+        environ = RequestFactory().get(ENDPOINT, HTTP_COOKIE=cookie).environ
+        connection.close()
+
+        settings_dict = connection.settings_dict
+        modes = [
+            ("connect per request", 0, None),
+            ("persistent (CONN_MAX_AGE=60)", 60, None),
+            (
+                f"pool (max_size={args.pool_size})",
+                0,
+                {"min_size": args.pool_size, "max_size": args.pool_size},
+            ),
+        ]
+        for label, conn_max_age, pool in modes:
+            settings_dict["CONN_MAX_AGE"] = conn_max_age
+            settings_dict["OPTIONS"].pop("pool", None)
+            if pool is not None:
+                settings_dict["OPTIONS"]["pool"] = pool
+            result = _run(environ, args.threads, args.requests)
+            stats = pool_stats().get("default", {})
+            summary = summarize_latencies(result["latencies"])
+            rows.append(
+                [
+                    label,
+                    total / result["elapsed"],
+                    summary["p50_ms"],
+                    summary["p99_ms"],
+                    stats.get("connections", result["checkouts"]),
+                    result["peak"],
+                    stats.get("wait_ms", 0) / max(stats.get("requests", 0), 1),
+                    stats.get("timeouts", 0),
+                ],
+            )
+            close_pools()
+        settings_dict["OPTIONS"].pop("pool", None)
+    print_table(
+        [
+            "connections",
+            "requests/s",
+            "p50 ms",
+            "p99 ms",
+            "opened",
+            "peak on server",
+            "mean wait ms",
+            "timeouts",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
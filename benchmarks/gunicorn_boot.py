@@ -0,0 +1,176 @@
+"""
+Gunicorn startup benchmark: each worker loading the app vs preloading it.
+
+Starts gunicorn the way ``compose/production/django/start`` used to, each
+worker importing ``config.wsgi`` itself, and then with ``config/gunicorn.py``,
+which loads and warms up the app in the master and forks the workers from it.
+Reports the time until the first response, the slowest of a first wave of
+concurrent requests (some land on workers that are still starting), and the
+memory per worker once they have all served requests: RSS, PSS (shared pages
+split between the processes sharing them) and USS (pages only that worker
+has)::
+
+    $ python -m benchmarks.gunicorn_boot --workers 4
+
+Memory comes from ``/proc/<pid>/smaps_rollup``, so this needs Linux.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.utils import SETTINGS_MODULE
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import database_url_for
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import wait_for_port
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+PATHS = ["/", "/about/", "/accounts/login/", "/accounts/signup/"]
+MODES = {
+    "each worker loads the app": (
+        ["config.wsgi"],
+        {"DJANGO_TEMPLATE_PRELOAD": "False"},
+    ),
+    "config/gunicorn.py (preload)": (
+        ["--config", str(BASE_DIR / "config" / "gunicorn.py")],
+        {"DJANGO_TEMPLATE_PRELOAD": "True"},
+    ),
+}
+
+
+def _get(port: int, path: str) -> tuple[int, float]:
+    started = time.perf_counter()
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        connection.request("GET", path)
+        response = connection.getresponse()
+        response.read()
+    finally:
+        connection.close()
+    return response.status, time.perf_counter() - started
+
+
+def _first_wave(port: int, requests: int) -> list[float]:
+    latencies: list[float] = []
+
+    def send(path: str) -> None:
+        status, elapsed = _get(port, path)
+        if status != 200:  # noqa: PLR2004
+            msg = f"GET {path} failed with {status}"
+            raise RuntimeError(msg)
+        latencies.append(elapsed)
+
+    threads = [
+        threading.Thread(target=send, args=(PATHS[i % len(PATHS)],))
+        for i in range(requests)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def _workers(master: int) -> list[int]:
+    children = Path(f"/proc/{master}/task/{master}/children").read_text()
+    return [int(pid) for pid in children.split()]
+
+
+def _memory_mb(pid: int) -> dict[str, float]:
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        fields[name.rstrip(":")] = int(value) / 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _run(mode: str, port: int, workers: int, database_url: str) -> list[object]:
+    arguments, environment = MODES[mode]
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        *arguments,
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--workers",
+        str(workers),
+        "--chdir",
+        str(BASE_DIR),
+        "--log-level",
+        "warning",
+    ]
+    env = {
+        **os.environ,
+        **environment,
+        "DJANGO_SETTINGS_MODULE": SETTINGS_MODULE,
+        "DATABASE_URL": database_url,
+    }
+    started = time.perf_counter()
+    server = subprocess.Popen(command, env=env)  # noqa: S603
+    try:
+        wait_for_port(port, timeout=60)
+        _get(port, PATHS[0])
+        boot = time.perf_counter() - started
+        wave = _first_wave(port, workers * 4)
+        # Give every worker some traffic before reading its memory.
+        _first_wave(port, workers * 20)
+        memory = [_memory_mb(pid) for pid in _workers(server.pid)]
+        master = _memory_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+    return [
+        mode,
+        boot * 1000,
+        max(wave) * 1000,
+        statistics.mean(m["rss"] for m in memory),
+        statistics.mean(m["pss"] for m in memory),
+        statistics.mean(m["uss"] for m in memory),
+        master["rss"],
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    with benchmark_database():
+        database_url = database_url_for(connection.settings_dict["NAME"])
+        connection.close()
+        rows = [_run(mode, args.port, args.workers, database_url) for mode in MODES]
+    print_table(
+        [
+            "mode",
+            "first response ms",
+            "first wave max ms",
+            "worker RSS MB",
+            "worker PSS MB",
+            "worker USS MB",
+            "master RSS MB",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+JSON benchmark: DRF's ``JSONRenderer``/``JSONParser`` vs the orjson ones.
+
+Renders and parses a menu-shaped payload of ``--restaurants`` restaurants
+(a few hundred KB with the defaults) with prices as ``Decimal`` and strings,
+datetimes, UUIDs and lazy translation strings, as serializers hand them to the
+renderer. Checks both renderers give the same bytes and reports MB/sec and
+milliseconds per payload::
+
+    $ python -m benchmarks.json_renderers --restaurants 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+import uuid
+from decimal import Decimal
+
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+
+
+def _payload(restaurants: int) -> list[dict]:
+    from django.utils import timezone
+    from django.utils.translation import gettext_lazy as _
+
+    now = timezone.now()
+    return [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Restaurant {r}",
+            "updated": now,
+            "categories": [
+                {
+                    "id": c,
+                    "name": f"Category {c}",
+                    "status": _("Ready"),
+                    "items": [
+                        {
+                            "id": i,
+                            "name": f"Item {i} — crème brûlée",
+                            "description": "Served with a side of seasonal greens.",
+                            "price": Decimal("12.50"),
+                            "unit_price": "12.50",
+                            "is_available": True,
+                            "created": now,
+                            "modifiers": [
+                                {"id": m, "name": f"Extra {m}", "price": "1.00"}
+                                for m in range(3)
+                            ],
+                        }
+                        for i in range(12)
+                    ],
+                }
+                for c in range(6)
+            ],
+        }
+        for r in range(restaurants)
+    ]
+
+
+def _best_of(repeat: int, func) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--restaurants", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from restaurant_app.core.api.parsers import FastJSONParser
+    from restaurant_app.core.api.renderers import FastJSONRenderer
+
+    data = _payload(args.restaurants)
+    rows = []
+    outputs = []
+    for renderer, json_parser in [
+        (JSONRenderer(), JSONParser()),
+        (FastJSONRenderer(), FastJSONParser()),
+    ]:
+        elapsed, body = _best_of(args.repeat, lambda r=renderer: r.render(data))
+        assert isinstance(body, bytes)
+        outputs.append(body)
+        megabytes = len(body) / 1_000_000
+        rows.append(
+            [
+                type(renderer).__name__,
+                len(body) // 1000,
+                megabytes / elapsed,
+                elapsed * 1000,
+            ],
+        )
+        elapsed, _ = _best_of(
+            args.repeat,
+            lambda p=json_parser, b=body: p.parse(io.BytesIO(b)),
+        )
+        rows.append(
+            [
+                type(json_parser).__name__,
+                len(body) // 1000,
+                megabytes / elapsed,
+                elapsed * 1000,
+            ],
+        )
+    if outputs[0] != outputs[1]:
+        msg = "FastJSONRenderer output differs from JSONRenderer's."
+        raise RuntimeError(msg)
+    print_table(["", "KB", "MB/s", "ms per payload"], rows)
+
+
+if __name__ == "__main__":
+    main()
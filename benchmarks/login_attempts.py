@@ -0,0 +1,94 @@
+"""
+Login attempts benchmark: what ``POST /api/auth-token/`` costs with Argon2.
+
+Posts credentials through the full middleware and DRF stack, in process, with
+``ARGON2_*`` at their settings or at ``--time-cost`` and ``--memory-cost``: the
+right password, a wrong one, and a wrong one once the ``login_failed`` rate
+limit is used up, which is answered before any password is hashed. A wrong
+password is hashed once per authentication backend::
+
+    $ python -m benchmarks.login_attempts --requests 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+ENDPOINT = "/api/auth-token/"
+PASSWORD = "a-long-enough-password"  # noqa: S105
+
+
+def _attempts(client, password: str, status: int, requests: int) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.post(ENDPOINT, {"username": "cook", "password": password})
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != status:
+            msg = f"Expected {status}, got {response.status_code}"
+            raise RuntimeError(msg)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--time-cost", type=int)
+    parser.add_argument("--memory-cost", type=int, help="KiB")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test import Client
+
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+    # Every 429 would be logged.
+    logging.getLogger("django.request").setLevel(logging.ERROR)
+    settings.PASSWORD_HASHERS = ["restaurant_app.users.hashers.Argon2PasswordHasher"]
+    if args.time_cost:
+        settings.ARGON2_TIME_COST = args.time_cost
+    if args.memory_cost:
+        settings.ARGON2_MEMORY_COST = args.memory_cost
+
+    rows = []
+    with benchmark_database():
+        User.objects.create_user("cook", "cook@example.com", PASSWORD)
+        client = Client()
+        settings.ACCOUNT_RATE_LIMITS = False
+        for label, password, status in [
+            ("right password", PASSWORD, 200),
+            ("wrong password", "wrong", 400),
+        ]:
+            _attempts(client, password, status, 1)
+            summary = summarize_latencies(
+                _attempts(client, password, status, args.requests),
+            )
+            rows.append([label, status, summary["p50_ms"], summary["p99_ms"]])
+
+        cache.clear()
+        settings.ACCOUNT_RATE_LIMITS = {"login_failed": "1/h/key"}
+        _attempts(client, "wrong", 400, 1)
+        summary = summarize_latencies(_attempts(client, "wrong", 429, args.requests))
+        rows.append(["rate limited", 429, summary["p50_ms"], summary["p99_ms"]])
+
+    sys.stdout.write(
+        f"Argon2 time cost {settings.ARGON2_TIME_COST}, memory cost "
+        f"{settings.ARGON2_MEMORY_COST} KiB, parallelism "
+        f"{settings.ARGON2_PARALLELISM}\n\n",
+    )
+    print_table(["attempt", "status", "p50 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Mail queue benchmark: signing up with the confirmation mail sent inline vs queued.
+
+Posts the allauth signup form through the full middleware stack, in process,
+with an email backend that takes ``--send-ms`` per message, standing in for
+the SES API (``EMAIL_TIMEOUT`` lets it take up to 5 s). "inline" is allauth's
+``DefaultAccountAdapter``, which sends the mail in the request; "queued" is
+``AccountAdapter``, which hands it to Celery. Tasks go to Celery's in-memory
+transport and no worker runs, so "queued" doesn't include a Redis round trip
+(well under a millisecond on a local network)::
+
+    $ python -m benchmarks.mail_queue --requests 50 --send-ms 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from django.core.mail.backends.locmem import EmailBackend
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+ADAPTERS = [
+    ("inline", "allauth.account.adapter.DefaultAccountAdapter"),
+    ("queued", "restaurant_app.users.adapters.AccountAdapter"),
+]
+# Set from --send-ms.
+SEND_SECONDS = 0.3
+
+
+class SlowBackend(EmailBackend):
+    def send_messages(self, messages):
+        time.sleep(SEND_SECONDS)
+        return super().send_messages(messages)
+
+
+def _signups(client, label: str, requests: int) -> list[float]:
+    latencies = []
+    for number in range(requests):
+        started = time.perf_counter()
+        response = client.post(
+            "/accounts/signup/",
+            {
+                "username": f"{label}{number}",
+                "email": f"{label}{number}@example.com",
+                "password1": "a-long-enough-password",
+                "password2": "a-long-enough-password",
+            },
+        )
+        latencies.append(time.perf_counter() - started)
+        client.logout()
+        if response.status_code != 302:  # noqa: PLR2004
+            msg = f"Signup failed with {response.status_code}"
+            raise RuntimeError(msg)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--send-ms", type=float, default=300.0)
+    args = parser.parse_args()
+
+    global SEND_SECONDS  # noqa: PLW0603
+    SEND_SECONDS = args.send_ms / 1000
+
+    setup_django()
+    from django.conf import settings
+    from django.test import Client
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+    # One client signs up over and over.
+    settings.ACCOUNT_RATE_LIMITS = False
+    # Queue the tasks instead of running them. Celery reads its configuration
+    # from the settings when a task is first sent.
+    settings.CELERY_TASK_ALWAYS_EAGER = False
+
+    rows = []
+    with benchmark_database():
+        # After the test environment has swapped in the locmem backend.
+        settings.EMAIL_BACKEND = f"{__name__}.SlowBackend"
+        for label, adapter in ADAPTERS:
+            settings.ACCOUNT_ADAPTER = adapter
+            client = Client()
+            _signups(client, f"warmup{label}", 1)
+            summary = summarize_latencies(_signups(client, label, args.requests))
+            rows.append([label, summary["p50_ms"], summary["p99_ms"]])
+    print_table(["mail", "signup p50 ms", "signup p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
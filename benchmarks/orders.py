@@ -0,0 +1,147 @@
+"""
+Order placement benchmark: ``POST /api/orders/`` under a lunch-rush burst.
+
+Builds a menu in a throwaway database, then submits orders of random size
+through the full middleware and DRF stack, in process. Each order is then
+retried with the same ``Idempotency-Key``. Reports orders/sec, latency
+percentiles and database round trips per order::
+
+    $ python -m benchmarks.orders --orders 5000 --min-lines 10 --max-lines 30
+
+Authentication is bypassed so that the numbers cover placing the order only.
+Round trips are the statements Django sends; a write transaction adds its
+BEGIN and COMMIT on top.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+
+from benchmarks.utils import StatementCounter
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+
+def _build_menu(items: int, modifiers_per_item: int):
+    from restaurant_app.menu.models import Category
+    from restaurant_app.menu.models import Item
+    from restaurant_app.menu.models import Modifier
+    from restaurant_app.menu.models import Restaurant
+
+    restaurant = Restaurant.objects.create(name="Benchmark", slug="benchmark")
+    category = Category.objects.create(restaurant=restaurant, name="Everything")
+    menu_items = Item.objects.bulk_create(
+        Item(category=category, name=f"Item {n}", price=f"{5 + n % 20}.50")
+        for n in range(items)
+    )
+    modifiers = Modifier.objects.bulk_create(
+        Modifier(item=item, name=f"Extra {n}", price="0.75")
+        for item in menu_items
+        for n in range(modifiers_per_item)
+    )
+    by_item: dict[int, list[int]] = {}
+    for modifier in modifiers:
+        by_item.setdefault(modifier.item_id, []).append(modifier.pk)
+    return restaurant, by_item
+
+
+def _payload(slug: str, by_item: dict[int, list[int]], lines: int, rng) -> dict:
+    item_ids = list(by_item)
+    return {
+        "restaurant": slug,
+        "lines": [
+            {
+                "item": (item := rng.choice(item_ids)),
+                "quantity": rng.randint(1, 3),
+                "modifiers": rng.sample(by_item[item], rng.randint(0, 2)),
+            }
+            for _ in range(lines)
+        ],
+    }
+
+
+def _run(client, requests) -> tuple[float, list[float], int]:
+    latencies = []
+    with StatementCounter() as queries:
+        started = time.perf_counter()
+        for payload, key in requests:
+            request_started = time.perf_counter()
+            response = client.post(
+                "/api/orders/",
+                payload,
+                format="json",
+                HTTP_IDEMPOTENCY_KEY=key,
+            )
+            latencies.append(time.perf_counter() - request_started)
+            if response.status_code != 201:  # noqa: PLR2004
+                msg = f"Order failed with {response.status_code}: {response.content}"
+                raise RuntimeError(msg)
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, queries.statements
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--min-lines", type=int, default=10)
+    parser.add_argument("--max-lines", type=int, default=30)
+    parser.add_argument("--menu-items", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.cache import cache
+    from rest_framework.test import APIClient
+
+    from restaurant_app.users.models import User
+
+    # Nothing to learn from logging every request.
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+
+    rng = random.Random(args.seed)  # noqa: S311
+    with benchmark_database():
+        restaurant, by_item = _build_menu(args.menu_items, modifiers_per_item=4)
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user("benchmark"))
+        requests = [
+            (
+                _payload(
+                    restaurant.slug,
+                    by_item,
+                    rng.randint(args.min_lines, args.max_lines),
+                    rng,
+                ),
+                str(uuid.uuid4()),
+            )
+            for _ in range(args.orders)
+        ]
+        cache.clear()
+
+        rows = []
+        for label in ["new", "retried"]:
+            elapsed, latencies, queries = _run(client, requests)
+            summary = summarize_latencies(latencies)
+            rows.append(
+                [
+                    label,
+                    args.orders,
+                    args.orders / elapsed,
+                    queries / args.orders,
+                    summary["p50_ms"],
+                    summary["p99_ms"],
+                ],
+            )
+    print_table(
+        ["orders", "count", "orders/s", "round trips/order", "p50 ms", "p99 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
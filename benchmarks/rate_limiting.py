@@ -0,0 +1,142 @@
+"""
+Rate limiting benchmark: what the limits add to each request.
+
+Times ``restaurant_app.core.ratelimit.hit()`` on its own, then
+``GET /api/users/me/`` with an API token through the full middleware and DRF
+stack, in process, with ``RATELIMIT_ENABLED`` on and off, alternating request
+by request. The user's rate is set high enough that every request is let
+through, which is what nearly all requests see. Runs on the local memory cache,
+and on Redis at ``--redis-url`` (``REDIS_URL`` by default) if it's reachable,
+which is where the limits are kept in production::
+
+    $ python -m benchmarks.rate_limiting --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+ENDPOINT = "/api/users/me/"
+
+
+def _reachable(url: str) -> bool:
+    parts = urlsplit(url)
+    with socket.socket() as sock:
+        sock.settimeout(0.5)
+        return sock.connect_ex((parts.hostname, parts.port or 6379)) == 0
+
+
+def _hits(requests: int) -> list[float]:
+    from restaurant_app.core import ratelimit
+
+    latencies = []
+    for number in range(requests):
+        started = time.perf_counter()
+        ratelimit.hit(f"benchmark_{number % 100}", 1_000_000, 60)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _requests(client, token: str, requests: int) -> dict[bool, list[float]]:
+    from django.conf import settings
+
+    latencies: dict[bool, list[float]] = {True: [], False: []}
+    for number in range(requests * 2):
+        enabled = bool(number % 2)
+        settings.RATELIMIT_ENABLED = enabled
+        started = time.perf_counter()
+        response = client.get(ENDPOINT, HTTP_AUTHORIZATION=f"Token {token}")
+        latencies[enabled].append(time.perf_counter() - started)
+        if response.status_code != 200:  # noqa: PLR2004
+            msg = f"Request failed with {response.status_code}"
+            raise RuntimeError(msg)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--redis-url",
+        default=os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
+    )
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test import Client
+    from django.test.utils import override_settings
+    from rest_framework.authtoken.models import Token
+
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+    rest_framework = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": {
+            **settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+            "user": "1000000/minute",
+        },
+    }
+    backends = [("locmem", settings.CACHES)]
+    if _reachable(args.redis_url):
+        redis_cache = {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": args.redis_url,
+            "OPTIONS": {"IGNORE_EXCEPTIONS": True},
+        }
+        backends.append(("redis", {"default": redis_cache}))
+    else:
+        sys.stderr.write(f"No Redis at {args.redis_url}, skipping it.\n")
+
+    rows = []
+    with benchmark_database():
+        token = Token.objects.create(user=User.objects.create_user("benchmark"))
+        client = Client()
+        for label, caches in backends:
+            with override_settings(CACHES=caches, REST_FRAMEWORK=rest_framework):
+                cache.clear()
+                settings.RATELIMIT_ENABLED = True
+                _hits(100)
+                hit = summarize_latencies(_hits(args.requests))
+                rows.append(
+                    [label, "hit()", hit["p50_ms"] * 1000, hit["p99_ms"] * 1000],
+                )
+                _requests(client, token.key, 100)
+                latencies = _requests(client, token.key, args.requests)
+                off = summarize_latencies(latencies[False])
+                on = summarize_latencies(latencies[True])
+                for mode, summary in [("limits off", off), ("limits on", on)]:
+                    rows.append(
+                        [
+                            label,
+                            f"{ENDPOINT}, {mode}",
+                            summary["p50_ms"] * 1000,
+                            summary["p99_ms"] * 1000,
+                        ],
+                    )
+                rows.append(
+                    [
+                        label,
+                        "added per request",
+                        (on["p50_ms"] - off["p50_ms"]) * 1000,
+                        (on["p99_ms"] - off["p99_ms"]) * 1000,
+                    ],
+                )
+                cache.clear()
+    print_table(["cache", "timed", "p50 µs", "p99 µs"], rows)
+
+
+if __name__ == "__main__":
+    main()
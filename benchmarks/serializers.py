@@ -0,0 +1,75 @@
+"""
+Serializer benchmark: ``UserSerializer`` vs ``ValuesSerializer`` on big lists.
+
+Serializes ``--rows`` users with absolute ``url``s, as a list response would:
+the DRF ``ModelSerializer`` over model instances, and ``ValuesSerializer`` over
+``.values()`` rows. Checks both give the same output and reports rows/sec,
+including the query::
+
+    $ python -m benchmarks.serializers --rows 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+
+
+def _best_of(repeat: int, serialize) -> tuple[float, list]:
+    best, data = float("inf"), []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = serialize()
+        best = min(best, time.perf_counter() - started)
+    return best, data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from restaurant_app.core.api.values import ValuesSerializer
+    from restaurant_app.users.api.serializers import UserSerializer
+    from restaurant_app.users.models import User
+
+    with benchmark_database():
+        User.objects.bulk_create(
+            User(username=f"user-{i}", name=f"User {i}") for i in range(args.rows)
+        )
+        queryset = User.objects.order_by("id")
+        context = {"request": Request(APIRequestFactory().get("/api/users/"))}
+
+        def model_serializer():
+            return UserSerializer(queryset.all(), many=True, context=context).data
+
+        def values_serializer():
+            serializer = ValuesSerializer(UserSerializer, context=context)
+            return serializer.serialize(queryset.values(*serializer.columns))
+
+        rows = []
+        results = []
+        for label, serialize in [
+            ("UserSerializer", model_serializer),
+            ("ValuesSerializer", values_serializer),
+        ]:
+            elapsed, data = _best_of(args.repeat, serialize)
+            results.append(data)
+            rows.append([label, args.rows / elapsed, elapsed * 1000])
+        if results[0] != results[1]:
+            msg = "ValuesSerializer output differs from UserSerializer's."
+            raise RuntimeError(msg)
+    print_table(["serializer", "rows/s", "ms per list"], rows)
+
+
+if __name__ == "__main__":
+    main()
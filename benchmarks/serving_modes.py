@@ -0,0 +1,141 @@
+"""
+Load benchmark: sync (WSGI) vs async (ASGI) serving of ``/api/users/me/``.
+
+gunicorn is started once per mode against a throwaway database, then the
+endpoint is hammered by concurrent keep-alive clients. Reports requests/sec
+and latency percentiles::
+
+    $ python -m benchmarks.serving_modes --workers 2 --concurrency 32 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.utils import SETTINGS_MODULE
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import database_url_for
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+from benchmarks.utils import wait_for_port
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+ENDPOINT = "/api/users/me/"
+MODES = {
+    "wsgi": ["config.wsgi"],
+    "asgi": ["config.asgi", "--worker-class", "uvicorn_worker.UvicornWorker"],
+}
+
+
+def _start_server(mode: str, port: int, workers: int, database_url: str):
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        *MODES[mode],
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--workers",
+        str(workers),
+        "--chdir",
+        str(BASE_DIR),
+        "--log-level",
+        "warning",
+    ]
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": SETTINGS_MODULE,
+        "DATABASE_URL": database_url,
+    }
+    process = subprocess.Popen(command, env=env)  # noqa: S603
+    wait_for_port(port)
+    return process
+
+
+def _client(port: int, token: str, deadline: float, latencies: list, errors: list):
+    headers = {"Authorization": f"Token {token}", "Accept": "application/json"}
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        try:
+            connection.request("GET", ENDPOINT, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(1)
+            connection.close()
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            continue
+        if response.status != 200:  # noqa: PLR2004
+            errors.append(response.status)
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+
+
+def run_load(port: int, token: str, concurrency: int, duration: float):
+    latencies: list[float] = []
+    errors: list[int] = []
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(
+            target=_client,
+            args=(port, token, deadline, latencies, errors),
+        )
+        for _ in range(concurrency)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    return len(latencies) / elapsed, summarize_latencies(latencies), len(errors)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    args = parser.parse_args(argv)
+
+    setup_django()
+    from django.db import connection
+    from rest_framework.authtoken.models import Token
+
+    from restaurant_app.users.tests.factories import UserFactory
+
+    with benchmark_database():
+        token = Token.objects.create(user=UserFactory()).key
+        database_url = database_url_for(connection.settings_dict["NAME"])
+        rows = []
+        for mode in args.modes:
+            server = _start_server(mode, args.port, args.workers, database_url)
+            try:
+                run_load(args.port, token, args.concurrency, args.warmup)
+                rps, latency, errors = run_load(
+                    args.port,
+                    token,
+                    args.concurrency,
+                    args.duration,
+                )
+            finally:
+                server.terminate()
+                server.wait()
+            rows.append((mode, rps, latency["p50_ms"], latency["p99_ms"], errors))
+        print_table(["mode", "req/s", "p50 ms", "p99 ms", "errors"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""
+Settings for benchmark runs: the test settings, served over loopback.
+"""
+
+from config.settings.test import *  # noqa: F403
+from config.settings.test import DATABASES
+
+# https://docs.djangoproject.com/en/dev/ref/settings/#allowed-hosts
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+# Keep clear of the database pytest-django reuses between test runs.
+DATABASES["default"]["TEST"] = {"NAME": f"benchmark_{DATABASES['default']['NAME']}"}
+# The default 300 entries would have the cache culling mid-run.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "OPTIONS": {"MAX_ENTRIES": 1_000_000},
+    },
+}
@@ -0,0 +1,151 @@
+"""
+Static files benchmark: what ``collectstatic`` does to the static storage.
+
+Runs ``collectstatic`` three times with Django's ``ManifestStaticFilesStorage``
+and with ``CompressedManifestStaticFilesStorage``, each on a temporary
+directory standing in for S3: a first deploy, a redeploy with nothing changed
+and one after ``css/project.css`` changed. Counts the storage operations each
+run makes, each of which is a request on S3, and the bytes it writes. Then
+compares the size of the compressible hashed files with their ``.gz`` and
+``.br`` variants::
+
+    $ python -m benchmarks.static_files
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+
+RUNS = ["first deploy", "unchanged", "project.css changed"]
+
+
+def _storages():
+    from django.contrib.staticfiles.storage import ManifestFilesMixin
+    from django.contrib.staticfiles.storage import StaticFilesStorage
+
+    from restaurant_app.core.staticfiles import CompressedManifestFilesMixin
+
+    class CountingStorage(StaticFilesStorage):
+        """Counts what would be requests to S3."""
+
+        def __init__(self, *args, **kwargs):
+            self.calls: Counter[str] = Counter()
+            super().__init__(*args, **kwargs)
+
+        def open(self, name, mode="rb"):
+            self.calls["open"] += 1
+            return super().open(name, mode)
+
+        def exists(self, name):
+            self.calls["exists"] += 1
+            return super().exists(name)
+
+        def delete(self, name):
+            self.calls["delete"] += 1
+            super().delete(name)
+
+        def _save(self, name, content):
+            self.calls["save"] += 1
+            self.calls["bytes"] += content.size
+            return super()._save(name, content)
+
+    class Manifest(ManifestFilesMixin, CountingStorage):
+        pass
+
+    class CompressedManifest(CompressedManifestFilesMixin, CountingStorage):
+        pass
+
+    return [
+        ("ManifestStaticFilesStorage", Manifest),
+        ("CompressedManifest...", CompressedManifest),
+    ]
+
+
+def _collect(storage) -> float:
+    from django.contrib.staticfiles.management.commands.collectstatic import Command
+    from django.core.management import call_command
+
+    command = Command()
+    command.storage = storage
+    started = time.perf_counter()
+    call_command(command, interactive=False, verbosity=0)
+    return time.perf_counter() - started
+
+
+def _variant_sizes(root: Path, manifest: dict[str, str]) -> list[list[object]]:
+    from restaurant_app.core.staticfiles import COMPRESSIBLE
+
+    sizes = Counter[str]()
+    for name in set(manifest.values()):
+        if not name.endswith(COMPRESSIBLE):
+            continue
+        sizes["files"] += 1
+        sizes["raw"] += (root / name).stat().st_size
+        for suffix in (".gz", ".br"):
+            variant = root / f"{name}{suffix}"
+            stored = variant if variant.exists() else root / name
+            sizes[suffix] += stored.stat().st_size
+    return [
+        ["uncompressed", sizes["files"], sizes["raw"]],
+        ["gzip", sizes["files"], sizes[".gz"]],
+        ["brotli", sizes["files"], sizes[".br"]],
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.staticfiles.finders import get_finder
+    from django.test.utils import override_settings
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "source"
+        shutil.copytree(settings.STATICFILES_DIRS[0], source)
+        with override_settings(STATICFILES_DIRS=[str(source)]):
+            get_finder.cache_clear()
+            for label, storage_class in _storages():
+                root = Path(directory) / label
+                for run in RUNS:
+                    if run == "project.css changed":
+                        with (source / "css" / "project.css").open("a") as css:
+                            css.write(f"/* {label} */\n")
+                    storage = storage_class(location=root)
+                    elapsed = _collect(storage)
+                    rows.append(
+                        [
+                            label,
+                            run,
+                            elapsed * 1000,
+                            storage.calls["open"],
+                            storage.calls["exists"],
+                            storage.calls["delete"],
+                            storage.calls["save"],
+                            storage.calls["bytes"],
+                        ],
+                    )
+            sizes = _variant_sizes(root, storage.hashed_files)
+        get_finder.cache_clear()
+
+    print_table(
+        ["storage", "run", "ms", "open", "exists", "delete", "save", "bytes"],
+        rows,
+    )
+    sys.stdout.write("\nCompressible hashed files:\n\n")
+    print_table(["encoding", "files", "bytes"], sizes)
+
+
+if __name__ == "__main__":
+    main()
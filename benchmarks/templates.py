@@ -0,0 +1,102 @@
+"""
+Template benchmark: the first render of a page after a deploy vs later ones.
+
+Sends ``GET /accounts/signup/`` (anonymous, allauth and crispy-forms
+templates) and ``GET /users/~update/`` (logged in, ``users/user_form.html``)
+through the full middleware stack, in process. "Cold" empties the cached
+template loader before each request, as in a freshly started worker; "warm"
+renders from it, as every request does after ``preload_templates()``. Reports
+the median of each, and how long preloading all templates takes::
+
+    $ python -m benchmarks.templates --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+PAGES = [
+    ("signup (anonymous)", "/accounts/signup/", False),
+    ("user_form.html (logged in)", "/users/~update/", True),
+]
+
+
+def _run(client, path: str, requests: int, reset) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        if reset is not None:
+            reset()
+        started = time.perf_counter()
+        response = client.get(path)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:  # noqa: PLR2004
+            msg = f"Request failed with {response.status_code}"
+            raise RuntimeError(msg)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.template import engines
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    from restaurant_app.core.template_preload import preload_templates
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+    # The test settings turn on template debugging, which production doesn't.
+    (template_settings,) = settings.TEMPLATES
+    production_templates = override_settings(
+        TEMPLATES=[
+            {
+                **template_settings,
+                "OPTIONS": {**template_settings["OPTIONS"], "debug": False},
+            },
+        ],
+    )
+
+    rows = []
+    with benchmark_database(), production_templates:
+        (backend,) = engines.all()
+        (loader,) = backend.engine.template_loaders
+        anonymous = Client()
+        logged_in = Client()
+        logged_in.force_login(User.objects.create_user("benchmark"))
+        for label, path, login in PAGES:
+            client = logged_in if login else anonymous
+            # Past the first request's URLconf, translation and DB setup.
+            _run(client, path, 1, None)
+            cold = summarize_latencies(_run(client, path, args.requests, loader.reset))
+            warm = summarize_latencies(_run(client, path, args.requests, None))
+            rows.append(
+                [
+                    label,
+                    cold["p50_ms"],
+                    warm["p50_ms"],
+                    cold["p50_ms"] - warm["p50_ms"],
+                ],
+            )
+        loader.reset()
+        preload = preload_templates()
+    print_table(["page", "cold p50 ms", "warm p50 ms", "compile ms"], rows)
+    sys.stdout.write(
+        f"\npreload_templates(): {preload.loaded} templates in "
+        f"{preload.elapsed * 1000:.0f} ms\n",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Token authentication benchmark: ``GET /api/users/me/`` with an API token.
+
+Sends the same token-authenticated request through the full middleware and DRF
+stack, in process, with DRF's ``TokenAuthentication`` and with
+``CachedTokenAuthentication``. Reports requests/sec, latency percentiles and
+database queries per request::
+
+    $ python -m benchmarks.token_auth --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.utils import StatementCounter
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+ENDPOINT = "/api/users/me/"
+
+
+def _run(client, token: str, requests: int) -> tuple[float, list[float], int]:
+    latencies = []
+    with StatementCounter() as queries:
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started = time.perf_counter()
+            response = client.get(ENDPOINT, HTTP_AUTHORIZATION=f"Token {token}")
+            latencies.append(time.perf_counter() - request_started)
+            if response.status_code != 200:  # noqa: PLR2004
+                msg = f"Request failed with {response.status_code}"
+                raise RuntimeError(msg)
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, queries.statements
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test import Client
+    from rest_framework.authentication import SessionAuthentication
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.authtoken.models import Token
+
+    from restaurant_app.users.api.views import UserViewSet
+    from restaurant_app.users.authentication import CachedTokenAuthentication
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+
+    rows = []
+    with benchmark_database():
+        token = Token.objects.create(user=User.objects.create_user("benchmark"))
+        client = Client()
+        for authentication in [TokenAuthentication, CachedTokenAuthentication]:
+            UserViewSet.authentication_classes = [SessionAuthentication, authentication]
+            cache.clear()
+            elapsed, latencies, queries = _run(client, token.key, args.requests)
+            summary = summarize_latencies(latencies)
+            rows.append(
+                [
+                    authentication.__name__,
+                    args.requests / elapsed,
+                    queries / args.requests,
+                    summary["p50_ms"],
+                    summary["p99_ms"],
+                ],
+            )
+    print_table(
+        ["authentication", "requests/s", "queries/request", "p50 ms", "p99 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Request transaction benchmark: read endpoints with and without ATOMIC_REQUESTS.
+
+Sends GETs through the full middleware stack, in process, once with every
+request wrapped in a transaction (``ATOMIC_REQUESTS``) and once with
+``TransactionURLResolver``, which leaves reads in autocommit. Reports
+requests/sec, latency percentiles and database round trips per request::
+
+    $ python -m benchmarks.transactions --requests 2000
+
+Round trips are the statements Django sends plus the BEGIN and COMMIT of every
+transaction that ran one. The test client keeps the connection open between
+requests, as ``CONN_MAX_AGE`` does; without it ``ATOMIC_REQUESTS`` also costs
+a new connection on pages that never query.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Self
+
+from benchmarks.utils import StatementCounter
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+from benchmarks.utils import summarize_latencies
+
+
+class RoundTrips(StatementCounter):
+    """Count statements and transactions on the default database."""
+
+    def __init__(self):
+        super().__init__()
+        self.transactions = 0
+        self._commit = self.connection.commit
+
+    def _counting_commit(self) -> None:
+        from psycopg.pq import TransactionStatus
+
+        # psycopg only sends BEGIN (and so COMMIT) once a statement runs.
+        if self.connection.connection.info.transaction_status != TransactionStatus.IDLE:
+            self.transactions += 1
+        self._commit()
+
+    def __enter__(self) -> Self:
+        self.connection.commit = self._counting_commit
+        return super().__enter__()
+
+    def __exit__(self, *exc_info) -> None:
+        super().__exit__(*exc_info)
+        del self.connection.commit
+
+    @property
+    def total(self) -> int:
+        return self.statements + 2 * self.transactions
+
+
+def _run(client, url: str, requests: int) -> tuple[float, list[float], RoundTrips]:
+    latencies = []
+    with RoundTrips() as round_trips:
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started = time.perf_counter()
+            response = client.get(url)
+            latencies.append(time.perf_counter() - request_started)
+            if response.status_code != 200:  # noqa: PLR2004
+                msg = f"{url} failed with {response.status_code}"
+                raise RuntimeError(msg)
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, round_trips
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+    from django.test import Client
+    from django.urls import reverse
+
+    from restaurant_app.menu.tests.factories import ItemFactory
+    from restaurant_app.users.models import User
+
+    settings.PERFORMANCE_SAMPLE_RATE = 0.0
+
+    rows = []
+    with benchmark_database():
+        user = User.objects.create_user("benchmark")
+        slug = ItemFactory().category.restaurant.slug
+        urls = [
+            reverse("home"),
+            reverse("users:update"),
+            reverse("api:restaurant-list"),
+            reverse("api:restaurant-menu", kwargs={"slug": slug}),
+        ]
+        # TransactionURLResolver stands aside when ATOMIC_REQUESTS is on.
+        modes = [("ATOMIC_REQUESTS", True), ("TransactionURLResolver", False)]
+        for url in urls:
+            for label, atomic_requests in modes:
+                connection.settings_dict["ATOMIC_REQUESTS"] = atomic_requests
+                client = Client()
+                client.force_login(user)
+                elapsed, latencies, round_trips = _run(client, url, args.requests)
+                summary = summarize_latencies(latencies)
+                rows.append(
+                    [
+                        url,
+                        label,
+                        args.requests / elapsed,
+                        round_trips.total / args.requests,
+                        summary["p50_ms"],
+                        summary["p99_ms"],
+                    ],
+                )
+    print_table(
+        [
+            "endpoint",
+            "transactions",
+            "requests/s",
+            "round trips/request",
+            "p50 ms",
+            "p99 ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+User import benchmark: ``import_users`` and ``export_users`` throughput.
+
+Imports ``--passwords`` users with raw passwords, hashed with Argon2 at the
+``ARGON2_*`` settings, in process and on ``--workers`` processes; then
+``--users`` users with hashes already made, which is all database work. Then
+exports them all, with the peak memory it allocated, which stays flat as the
+user count grows::
+
+    $ python -m benchmarks.user_import --users 100000 --passwords 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tracemalloc
+
+from benchmarks.utils import benchmark_database
+from benchmarks.utils import print_table
+from benchmarks.utils import setup_django
+
+PASSWORD = "a-long-enough-password"  # noqa: S105
+
+
+def _rows(prefix: str, count: int, **columns):
+    for number in range(count):
+        yield (
+            number,
+            {
+                "username": f"{prefix}{number}",
+                "email": f"{prefix}{number}@example.com",
+                **columns,
+            },
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--passwords", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password
+
+    from restaurant_app.users import bulk
+
+    settings.PASSWORD_HASHERS = ["restaurant_app.users.hashers.Argon2PasswordHasher"]
+    rows = []
+    with benchmark_database():
+        for label, workers in [
+            ("in process", 0),
+            (f"{args.workers} workers", args.workers),
+        ]:
+            report = bulk.UserImporter(
+                batch_size=args.batch_size,
+                workers=workers,
+                verified=False,
+            ).run(_rows(f"{workers}-", args.passwords, password=PASSWORD))
+            rows.append(
+                [f"import, passwords hashed {label}", report.users, report.per_second],
+            )
+
+        password_hash = make_password(PASSWORD)
+        report = bulk.UserImporter(
+            batch_size=args.batch_size,
+            workers=0,
+            verified=True,
+        ).run(_rows("hashed-", args.users, password_hash=password_hash))
+        rows.append(["import, password hashes", report.users, report.per_second])
+
+        for fmt in bulk.FORMATS:
+            with open(os.devnull, "w") as stream:  # noqa: PTH123
+                tracemalloc.start()
+                report = bulk.export_users(stream, fmt, chunk_size=2000)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            rows.append(
+                [
+                    f"export, {fmt}, peak {peak / 2**20:.1f} MiB",
+                    report.users,
+                    report.per_second,
+                ],
+            )
+    print_table(["timed", "users", "users/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Helpers shared by the benchmark scripts in this package.
+
+Every benchmark runs against a throwaway database created from the configured
+``DATABASE_URL`` the same way the test suite does, so no real data is touched.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from typing import Self
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+SETTINGS_MODULE = "benchmarks.settings"
+
+
+def setup_django(settings_module: str = SETTINGS_MODULE) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def benchmark_database() -> Iterator[None]:
+    """Create the test database(s) for the duration of the block."""
+    from django.test.utils import setup_databases
+    from django.test.utils import setup_test_environment
+    from django.test.utils import teardown_databases
+    from django.test.utils import teardown_test_environment
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def database_url_for(test_name: str) -> str:
+    """``DATABASE_URL`` pointing at the throwaway database, for a server process."""
+    parts = urlsplit(os.environ["DATABASE_URL"])
+    return urlunsplit(parts._replace(path=f"/{test_name}"))
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    msg = f"Server did not start listening on port {port}"
+    raise RuntimeError(msg)
+
+
+class StatementCounter:
+    """
+    Count the statements sent on the default database inside the block.
+
+    Unlike ``CaptureQueriesContext`` it doesn't stop counting once Django's
+    query log holds its 9000 entries.
+    """
+
+    def __init__(self):
+        from django.db import connection
+
+        self.connection = connection
+        self.statements = 0
+        self._wrapper = connection.execute_wrapper(self._execute)
+
+    def _execute(self, execute, sql, params, many, context):
+        self.statements += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self) -> Self:
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._wrapper.__exit__(*exc_info)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``; ``pct`` is in ``[0, 100]``."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize_latencies(samples: Sequence[float]) -> dict[str, float]:
+    """Latency summary in milliseconds."""
+    return {
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    """Write a plain-text table to stdout."""
+    cells = [[str(h) for h in headers]] + [
+        [f"{c:,.2f}" if isinstance(c, float) else str(c) for c in row] for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    lines = [
+        "  ".join(c.rjust(w) for c, w in zip(row, widths, strict=True)) for row in cells
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    sys.stdout.write("\n".join(lines) + "\n")
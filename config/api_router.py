@@ -2,11 +2,15 @@ from django.conf import settings
 from rest_framework.routers import DefaultRouter
 from rest_framework.routers import SimpleRouter
 
+from restaurant_app.menu.api.views import RestaurantViewSet
+from restaurant_app.orders.api.views import OrderViewSet
 from restaurant_app.users.api.views import UserViewSet
 
 router = DefaultRouter() if settings.DEBUG else SimpleRouter()
 
 router.register("users", UserViewSet)
+router.register("restaurants", RestaurantViewSet)
+router.register("orders", OrderViewSet)
 
 
 app_name = "api"
@@ -0,0 +1,52 @@
+# ruff: noqa
+"""
+ASGI config for restaurant_app project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Gunicorn serves it through ``uvicorn_worker.UvicornWorker`` when the
+production container is started with ``DJANGO_ASGI=True``; otherwise the
+classic sync workers keep serving ``config.wsgi``.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/dev/howto/deployment/asgi/
+
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# restaurant_app directory.
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / "restaurant_app"))
+# We defer to a DJANGO_SETTINGS_MODULE already in the environment, exactly like
+# config.wsgi does.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+# This application object is used by any ASGI server configured to use this
+# file, such as uvicorn workers under gunicorn.
+django_application = get_asgi_application()
+
+# Compile the templates now rather than on the first requests; with gunicorn's
+# --preload this happens once, before the workers fork.
+from django.conf import settings
+
+if settings.TEMPLATE_PRELOAD:
+    from restaurant_app.core.template_preload import preload_templates
+
+    preload_templates()
+# Apply ASGI middleware here.
+# from helloworld.asgi import HelloWorldApplication
+# application = HelloWorldApplication(application)
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "http":
+        await django_application(scope, receive, send)
+    else:
+        # uvicorn treats this as "lifespan unsupported" and carries on.
+        msg = f"Unknown scope type {scope['type']}"
+        raise NotImplementedError(msg)
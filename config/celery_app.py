@@ -0,0 +1,26 @@
+"""
+The Celery app; start a worker with ``celery -A config.celery_app worker``.
+
+Unlike the usual Django setup, ``config/__init__.py`` doesn't import it: Celery
+takes about 150 ms to import, and only the modules that send tasks need it.
+Tasks are declared with ``@app.task`` from here rather than ``@shared_task``,
+so that sending one always loads this configuration.
+"""
+
+import os
+
+from celery import Celery
+
+# set the default Django settings module for the 'celery' program.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+
+app = Celery("restaurant_app")
+
+# Using a string here means the worker doesn't have to serialize
+# the configuration object to child processes.
+# - namespace='CELERY' means all celery-related configuration keys
+#   should have a `CELERY_` prefix.
+app.config_from_object("django.conf:settings", namespace="CELERY")
+
+# Load task modules from all registered Django app configs.
+app.autodiscover_tasks()
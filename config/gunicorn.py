@@ -0,0 +1,61 @@
+"""
+Gunicorn configuration for the production container.
+
+    $ gunicorn --config config/gunicorn.py
+
+Serves ``config.wsgi`` with sync workers, or ``config.asgi`` with uvicorn
+workers when ``DJANGO_ASGI=True``. The app is loaded once, in the master,
+which then warms it up (see ``restaurant_app.core.warmup``) and forks the
+workers: they start serving straight away and share the master's memory
+copy-on-write instead of each importing Django and the project themselves.
+
+Tune it from the environment:
+
+- ``GUNICORN_WORKERS``: worker processes, 2 * CPUs + 1 by default.
+- ``GUNICORN_WORKER_CLASS``: overrides the class picked from ``DJANGO_ASGI``.
+- ``GUNICORN_THREADS``: threads per sync worker, 1 by default.
+- ``GUNICORN_TIMEOUT``: seconds before a silent worker is restarted.
+- ``GUNICORN_PRELOAD``: set to ``False`` to load the app in each worker
+  instead, which each then warms up for itself.
+
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import gc
+import multiprocessing
+
+import environ
+
+env = environ.Env()
+
+ASGI = env.bool("DJANGO_ASGI", default=False)
+
+wsgi_app = "config.asgi:application" if ASGI else "config.wsgi:application"
+bind = env("GUNICORN_BIND", default="0.0.0.0:5000")
+workers = env.int("GUNICORN_WORKERS", default=multiprocessing.cpu_count() * 2 + 1)
+worker_class = env(
+    "GUNICORN_WORKER_CLASS",
+    default="uvicorn_worker.UvicornWorker" if ASGI else "sync",
+)
+threads = env.int("GUNICORN_THREADS", default=1)
+timeout = env.int("GUNICORN_TIMEOUT", default=30)
+preload_app = env.bool("GUNICORN_PRELOAD", default=True)
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+    from restaurant_app.core.warmup import warm_up
+
+    warm_up()
+    # Keep the collector from writing to everything loaded so far, and so
+    # from copying the pages the workers share with the master.
+    gc.freeze()
+
+
+def post_worker_init(worker):
+    if worker.cfg.preload_app:
+        return
+    from restaurant_app.core.warmup import warm_up
+
+    warm_up()
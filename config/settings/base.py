@@ -1,6 +1,7 @@
 # ruff: noqa: ERA001, E501
 """Base settings to build other settings files upon."""
 
+import ssl
 from pathlib import Path
 
 import environ
@@ -46,7 +47,40 @@ LOCALE_PATHS = [str(BASE_DIR / "locale")]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db("DATABASE_URL")}
-DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# No ATOMIC_REQUESTS: the URLconf only opens transactions for requests that may
+# write, see restaurant_app.core.transactions.
+# Read replicas, as a comma-separated list of database URLs. Requests read the
+# models of REPLICA_APPS from them, see restaurant_app.core.routers.
+DATABASE_REPLICAS = []
+for number, url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[]), start=1):
+    DATABASE_REPLICAS.append(f"replica_{number}")
+    DATABASES[f"replica_{number}"] = {
+        **env.db_url_config(url),
+        "TEST": {"MIRROR": "default"},
+    }
+# Connection pooling: one psycopg_pool pool per process and database, in place of
+# persistent connections. See restaurant_app.core.pooled_postgresql.
+DATABASE_POOL = env.bool("DATABASE_POOL", default=False)
+for database in DATABASES.values():
+    if database["ENGINE"] != "django.db.backends.postgresql":
+        continue
+    database["ENGINE"] = "restaurant_app.core.pooled_postgresql"
+    if DATABASE_POOL:
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=10),
+            # Seconds to wait for a connection before giving up with an error.
+            "timeout": env.float("DATABASE_POOL_TIMEOUT", default=10.0),
+            "max_idle": env.float("DATABASE_POOL_MAX_IDLE", default=600.0),
+            "max_lifetime": env.float("DATABASE_POOL_MAX_LIFETIME", default=3600.0),
+        }
+# Seconds between the pool stats log lines of each process; 0 turns them off.
+DATABASE_POOL_STATS_INTERVAL = env.int("DATABASE_POOL_STATS_INTERVAL", default=60)
+DATABASE_ROUTERS = ["restaurant_app.core.routers.ReplicaRouter"]
+REPLICA_APPS = ["menu", "users"]
+# How long a client that wrote keeps reading from the primary; above the
+# replicas' usual replication lag.
+REPLICA_PIN_SECONDS = env.float("REPLICA_PIN_SECONDS", default=5.0)
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -56,6 +90,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ROOT_URLCONF = "config.urls"
 # https://docs.djangoproject.com/en/dev/ref/settings/#wsgi-application
 WSGI_APPLICATION = "config.wsgi.application"
+# https://docs.djangoproject.com/en/dev/howto/deployment/asgi/
+ASGI_APPLICATION = "config.asgi.application"
 
 # APPS
 # ------------------------------------------------------------------------------
@@ -84,7 +120,11 @@ THIRD_PARTY_APPS = [
 ]
 
 LOCAL_APPS = [
+    "restaurant_app.core",
     "restaurant_app.users",
+    "restaurant_app.menu",
+    "restaurant_app.orders",
+    "restaurant_app.kitchen",
     # Your stuff: custom apps go here
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
@@ -114,11 +154,17 @@ LOGIN_URL = "account_login"
 # https://docs.djangoproject.com/en/dev/ref/settings/#password-hashers
 PASSWORD_HASHERS = [
     # https://docs.djangoproject.com/en/dev/topics/auth/passwords/#using-argon2-with-django
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "restaurant_app.users.hashers.Argon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
     "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
 ]
+# https://argon2-cffi.readthedocs.io/en/stable/parameters.html
+# Django's defaults; "manage.py tune_argon2" suggests values for the hardware.
+# Memory is in KiB. Passwords are rehashed when their users next log in.
+ARGON2_TIME_COST = env.int("DJANGO_ARGON2_TIME_COST", default=2)
+ARGON2_MEMORY_COST = env.int("DJANGO_ARGON2_MEMORY_COST", default=102400)
+ARGON2_PARALLELISM = env.int("DJANGO_ARGON2_PARALLELISM", default=8)
 # https://docs.djangoproject.com/en/dev/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -133,6 +179,7 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "restaurant_app.core.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -143,6 +190,8 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
+    "restaurant_app.core.middleware.RateLimitMiddleware",
+    "restaurant_app.core.middleware.ReplicaPinMiddleware",
 ]
 
 # STATIC
@@ -172,7 +221,8 @@ MEDIA_URL = "/media/"
 TEMPLATES = [
     {
         # https://docs.djangoproject.com/en/dev/ref/settings/#std:setting-TEMPLATES-BACKEND
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # Django's own backend, with render times reported by ServerTimingMiddleware
+        "BACKEND": "restaurant_app.core.instrumentation.DjangoTemplates",
         # https://docs.djangoproject.com/en/dev/ref/settings/#dirs
         "DIRS": [str(APPS_DIR / "templates")],
         # https://docs.djangoproject.com/en/dev/ref/settings/#app-dirs
@@ -208,6 +258,8 @@ FIXTURE_DIRS = (str(APPS_DIR / "fixtures"),)
 
 # SECURITY
 # ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#session-engine
+SESSION_ENGINE = "restaurant_app.core.sessions"
 # https://docs.djangoproject.com/en/dev/ref/settings/#session-cookie-httponly
 SESSION_COOKIE_HTTPONLY = True
 # https://docs.djangoproject.com/en/dev/ref/settings/#csrf-cookie-httponly
@@ -224,6 +276,9 @@ EMAIL_BACKEND = env(
 )
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-timeout
 EMAIL_TIMEOUT = 5
+# Mail sent with restaurant_app.core.mail.send_later() goes out from a Celery
+# worker, up to this many messages per task and backend connection.
+EMAIL_BATCH_SIZE = env.int("DJANGO_EMAIL_BATCH_SIZE", default=50)
 
 # ADMIN
 # ------------------------------------------------------------------------------
@@ -263,6 +318,42 @@ LOGGING = {
 REDIS_URL = env("REDIS_URL", default="redis://redis:6379/0")
 REDIS_SSL = REDIS_URL.startswith("rediss://")
 
+# Celery
+# ------------------------------------------------------------------------------
+if USE_TZ:
+    # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-timezone
+    CELERY_TIMEZONE = TIME_ZONE
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-broker_url
+CELERY_BROKER_URL = REDIS_URL
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#redis-backend-use-ssl
+CELERY_BROKER_USE_SSL = {"ssl_cert_reqs": ssl.CERT_NONE} if REDIS_SSL else None
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-accept_content
+CELERY_ACCEPT_CONTENT = ["json"]
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-task_serializer
+CELERY_TASK_SERIALIZER = "json"
+# Nothing waits for task results, so there is no result backend.
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-task_ignore_result
+CELERY_TASK_IGNORE_RESULT = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-time-limit
+CELERY_TASK_TIME_LIMIT = 5 * 60
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-soft-time-limit
+CELERY_TASK_SOFT_TIME_LIMIT = 60
+# Acknowledge a task once it has run, so that a worker dying mid-task doesn't
+# lose it; tasks must be safe to run twice.
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-acks-late
+CELERY_TASK_ACKS_LATE = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-reject-on-worker-lost
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-prefetch-multiplier
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-hijack-root-logger
+CELERY_WORKER_HIJACK_ROOT_LOGGER = False
+# Run tasks in the process that sends them, without a broker or a worker. They
+# are retried there too, and their errors aren't raised to the sender, as with
+# a worker (task_eager_propagates would raise retries as well).
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-always-eager
+CELERY_TASK_ALWAYS_EAGER = env.bool("CELERY_TASK_ALWAYS_EAGER", default=False)
+
 
 # django-allauth
 # ------------------------------------------------------------------------------
@@ -288,10 +379,41 @@ SOCIALACCOUNT_FORMS = {"signup": "restaurant_app.users.forms.UserSocialSignupFor
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
+        "restaurant_app.users.authentication.CachedTokenAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "restaurant_app.core.api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "restaurant_app.core.api.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": "restaurant_app.core.api.pagination.CursorPagination",
+    "PAGE_SIZE": 50,
+    "EXCEPTION_HANDLER": "restaurant_app.core.transactions.api_exception_handler",
+    # Proxies in front of Django, each appending to X-Forwarded-For. Client IPs,
+    # for DRF's throttles and allauth's rate limits, are read from the entry
+    # the furthest of them appended; anything before it is up to the client.
+    "NUM_PROXIES": env.int("DJANGO_NUM_PROXIES", default=0),
+    # Per client IP for anonymous requests, per user otherwise. Views with a
+    # throttle_scope get that rate on top. See restaurant_app.core.ratelimit.
+    "DEFAULT_THROTTLE_CLASSES": (
+        "restaurant_app.core.api.throttling.AnonRateThrottle",
+        "restaurant_app.core.api.throttling.UserRateThrottle",
+        "restaurant_app.core.api.throttling.ScopedRateThrottle",
+    ),
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": env("DJANGO_THROTTLE_ANON", default="60/minute"),
+        "user": env("DJANGO_THROTTLE_USER", default="600/minute"),
+        # api/auth-token/
+        "auth": env("DJANGO_THROTTLE_AUTH", default="10/minute"),
+        # Placing orders.
+        "orders": env("DJANGO_THROTTLE_ORDERS", default="30/minute"),
+    },
 }
 
 # django-cors-headers - https://github.com/adamchainz/django-cors-headers#setup
@@ -306,5 +428,62 @@ SPECTACULAR_SETTINGS = {
     "SERVE_PERMISSIONS": ["rest_framework.permissions.IsAdminUser"],
     "SCHEMA_PATH_PREFIX": "/api/",
 }
+# The schema served at api/schema/, written by `manage.py openapi_schema`; see
+# restaurant_app.core.api.schema. Empty to generate it on every request.
+API_SCHEMA_FILE = env(
+    "API_SCHEMA_FILE",
+    default=str(BASE_DIR / "config" / "openapi.yaml"),
+)
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Identifies the deployed code in ETags, see restaurant_app.core.http. Set it to
+# the commit or image tag; without it each process hashes the file metadata.
+RELEASE_VERSION = env("RELEASE_VERSION", default="")
+# Pages and template fragments cached by restaurant_app.core.pages, and how long
+# each process reuses the cache generation (the delay before another process
+# sees invalidate_pages()).
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT", default=60 * 10)
+PAGE_CACHE_LOCAL_TTL = env.float("PAGE_CACHE_LOCAL_TTL", default=5.0)
+# Compile every template when config.wsgi or config.asgi is imported, see
+# restaurant_app.core.template_preload; the apps whose templates are included.
+TEMPLATE_PRELOAD = env.bool("DJANGO_TEMPLATE_PRELOAD", default=False)
+TEMPLATE_PRELOAD_APPS = ["allauth", "crispy_forms", "crispy_bootstrap5", "forms"]
+# Fraction of requests timed by restaurant_app.core.middleware.ServerTimingMiddleware
+PERFORMANCE_SAMPLE_RATE = env.float("DJANGO_PERFORMANCE_SAMPLE_RATE", default=1.0)
+# How long a menu snapshot version stays cached; writes store a fresh one anyway.
+MENU_SNAPSHOT_TIMEOUT = env.int("MENU_SNAPSHOT_TIMEOUT", default=60 * 60 * 24)
+# Seconds clients may reuse a menu without revalidating it.
+MENU_MAX_AGE = env.int("MENU_MAX_AGE", default=60)
+# How long a retried order POST with the same Idempotency-Key is answered from
+# the cache; later retries fall back to the unique constraint in the database.
+ORDER_IDEMPOTENCY_TIMEOUT = env.int("ORDER_IDEMPOTENCY_TIMEOUT", default=60 * 60 * 24)
+# Kitchen ticket feed: where ticket events go, and how many per restaurant are
+# kept for reconnecting screens to catch up from.
+KITCHEN_BROKER = env(
+    "KITCHEN_BROKER",
+    default="restaurant_app.kitchen.brokers.RedisBroker",
+)
+KITCHEN_LOG_LENGTH = env.int("KITCHEN_LOG_LENGTH", default=1000)
+# Events buffered per connection before a slow screen is dropped (it reconnects
+# and catches up from the log).
+KITCHEN_SUBSCRIBER_BUFFER = 100
+# Seconds between keep-alive comments on an idle feed, and the reconnect delay
+# suggested to clients.
+KITCHEN_HEARTBEAT_INTERVAL = env.float("KITCHEN_HEARTBEAT_INTERVAL", default=15.0)
+KITCHEN_RETRY_MS = 3000
+# API tokens resolved by restaurant_app.users.authentication.CachedTokenAuthentication
+# stay in the shared cache for TOKEN_AUTH_CACHE_TIMEOUT seconds, and in each
+# process for TOKEN_AUTH_LOCAL_TTL (the most a revoked token can outlive its
+# revocation in another process).
+TOKEN_AUTH_CACHE_TIMEOUT = env.int("TOKEN_AUTH_CACHE_TIMEOUT", default=60 * 5)
+TOKEN_AUTH_LOCAL_TTL = env.float("TOKEN_AUTH_LOCAL_TTL", default=5.0)
+TOKEN_AUTH_LOCAL_SIZE = 1024
+# Seconds each process reuses a session it has read, see restaurant_app.core.sessions.
+SESSION_LOCAL_CACHE_TTL = env.float("SESSION_LOCAL_CACHE_TTL", default=2.0)
+SESSION_LOCAL_CACHE_SIZE = 1024
+# Rate limits, see restaurant_app.core.ratelimit. The API's are in
+# REST_FRAMEWORK; these are per client IP on the HTML views under each path.
+RATELIMIT_ENABLED = env.bool("DJANGO_RATELIMIT_ENABLED", default=True)
+RATELIMIT_PATHS = {
+    "/accounts/": env("DJANGO_RATELIMIT_ACCOUNTS", default="30/minute"),
+}
@@ -62,5 +62,13 @@ if env("USE_DOCKER") == "yes":
 # https://django-extensions.readthedocs.io/en/latest/installation_instructions.html#configuration
 INSTALLED_APPS += ["django_extensions"]
 
+# CELERY
+# ------------------------------------------------------------------------------
+# Tasks run in the process that sends them; set CELERY_TASK_ALWAYS_EAGER=False
+# to send them to a worker instead.
+CELERY_TASK_ALWAYS_EAGER = env.bool("CELERY_TASK_ALWAYS_EAGER", default=True)
+
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Serve the API schema as the code stands, not as last written to the file.
+API_SCHEMA_FILE = ""
@@ -1,9 +1,12 @@
 # ruff: noqa: E501
 from .base import *  # noqa: F403
+from .base import DATABASE_POOL
 from .base import DATABASES
 from .base import INSTALLED_APPS
 from .base import REDIS_URL
+from .base import REST_FRAMEWORK
 from .base import SPECTACULAR_SETTINGS
+from .base import TEMPLATES
 from .base import env
 
 # GENERAL
@@ -15,7 +18,27 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["example.com"])
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+if not DATABASE_POOL:
+    for database in DATABASES.values():
+        database["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+
+# TEMPLATES
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/templates/api/#django.template.loaders.cached.Loader
+# Spelled out rather than left to APP_DIRS, so templates stay compiled for the
+# life of the process whatever DEBUG says.
+TEMPLATES[0]["APP_DIRS"] = False
+TEMPLATES[0]["OPTIONS"]["loaders"] = [  # type: ignore[index]
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    ),
+]
+# Compiled before gunicorn forks its workers, see config.wsgi.
+TEMPLATE_PRELOAD = env.bool("DJANGO_TEMPLATE_PRELOAD", default=True)
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -98,8 +121,10 @@ STORAGES = {
             "file_overwrite": False,
         },
     },
+    # Hashed, precompressed and cached for a year; see
+    # restaurant_app.core.staticfiles.
     "staticfiles": {
-        "BACKEND": "storages.backends.s3.S3Storage",
+        "BACKEND": "restaurant_app.core.s3.StaticS3Storage",
         "OPTIONS": {
             "location": "static",
             "default_acl": "public-read",
@@ -107,7 +132,6 @@ STORAGES = {
     },
 }
 MEDIA_URL = f"https://{aws_s3_domain}/media/"
-COLLECTFASTA_STRATEGY = "collectfasta.strategies.boto3.Boto3Strategy"
 STATIC_URL = f"https://{aws_s3_domain}/static/"
 
 # EMAIL
@@ -141,11 +165,6 @@ INSTALLED_APPS += ["anymail"]
 EMAIL_BACKEND = "anymail.backends.amazon_ses.EmailBackend"
 ANYMAIL = {}
 
-# Collectfasta
-# ------------------------------------------------------------------------------
-# https://github.com/jasongi/collectfasta#installation
-INSTALLED_APPS = ["collectfasta", *INSTALLED_APPS]
-
 # LOGGING
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#logging
@@ -187,6 +206,12 @@ LOGGING = {
             "handlers": ["console", "mail_admins"],
             "propagate": True,
         },
+        # Per-request timings from ServerTimingMiddleware
+        "restaurant_app.performance": {
+            "level": "INFO",
+            "handlers": ["console"],
+            "propagate": False,
+        },
     },
 }
 
@@ -196,5 +221,9 @@ LOGGING = {
 SPECTACULAR_SETTINGS["SERVERS"] = [
     {"url": "https://example.com", "description": "Production server"},
 ]
+# Traefik.
+REST_FRAMEWORK["NUM_PROXIES"] = env.int("DJANGO_NUM_PROXIES", default=1)
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Time a sample of production traffic rather than every request.
+PERFORMANCE_SAMPLE_RATE = env.float("DJANGO_PERFORMANCE_SAMPLE_RATE", default=0.1)
@@ -3,6 +3,7 @@ With these settings, tests run faster.
 """
 
 from .base import *  # noqa: F403
+from .base import DATABASES
 from .base import TEMPLATES
 from .base import env
 
@@ -34,5 +35,26 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "http://media.testserver"
+
+# DATABASES
+# ------------------------------------------------------------------------------
+# A stand-in replica on the test database, for the router tests; routing stays
+# off unless a test sets DATABASE_REPLICAS.
+DATABASES.setdefault(
+    "replica_1",
+    {**DATABASES["default"], "TEST": {"MIRROR": "default"}},
+)
+DATABASE_REPLICAS = []
+
+# CELERY
+# ------------------------------------------------------------------------------
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-always-eager
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_BROKER_URL = "memory://localhost/"
+
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Ticket events stay in the test process; no Redis needed.
+KITCHEN_BROKER = "restaurant_app.kitchen.brokers.InMemoryBroker"
+# The cache outlives each test; tests of the limits turn them on.
+RATELIMIT_ENABLED = False
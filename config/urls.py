@@ -4,17 +4,32 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include
 from django.urls import path
-from django.views import defaults as default_views
 from django.views.generic import TemplateView
-from drf_spectacular.views import SpectacularAPIView
-from drf_spectacular.views import SpectacularSwaggerView
-from rest_framework.authtoken.views import obtain_auth_token
+from rest_framework.parsers import FormParser
+from rest_framework.parsers import MultiPartParser
+
+from restaurant_app.core.api.parsers import FastJSONParser
+from restaurant_app.core.api.renderers import FastJSONRenderer
+from restaurant_app.core.http import conditional_page
+from restaurant_app.core.pages import anonymous_page_cache
+from restaurant_app.core.transactions import request_transactions
+from restaurant_app.core.views import lazy_view
 
 urlpatterns = [
-    path("", TemplateView.as_view(template_name="pages/home.html"), name="home"),
+    path(
+        "",
+        conditional_page(
+            anonymous_page_cache(TemplateView.as_view(template_name="pages/home.html")),
+        ),
+        name="home",
+    ),
     path(
         "about/",
-        TemplateView.as_view(template_name="pages/about.html"),
+        conditional_page(
+            anonymous_page_cache(
+                TemplateView.as_view(template_name="pages/about.html")
+            ),
+        ),
         name="about",
     ),
     # Django Admin, use {% url 'admin:index' %}
@@ -23,6 +38,7 @@ urlpatterns = [
     path("users/", include("restaurant_app.users.urls", namespace="users")),
     path("accounts/", include("allauth.urls")),
     # Your stuff: custom urls includes go here
+    path("kitchen/", include("restaurant_app.kitchen.urls", namespace="kitchen")),
     # ...
     # Media files
     *static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT),
@@ -32,17 +48,35 @@ urlpatterns = [
 urlpatterns += [
     # API base url
     path("api/", include("config.api_router")),
-    # DRF auth token
-    path("api/auth-token/", obtain_auth_token),
-    path("api/schema/", SpectacularAPIView.as_view(), name="api-schema"),
+    # DRF auth token, rate limited like the login form; it sets its own
+    # renderers and parsers. Imported on first use: DRF's view module brings in
+    # its schema generation and coreapi.
+    path(
+        "api/auth-token/",
+        lazy_view(
+            "restaurant_app.users.api.auth_token.ObtainAuthToken",
+            renderer_classes=[FastJSONRenderer],
+            parser_classes=[FormParser, MultiPartParser, FastJSONParser],
+        ),
+    ),
+    # Imported on first use: drf-spectacular brings its whole schema generator.
+    path(
+        "api/schema/",
+        lazy_view("restaurant_app.core.api.schema.SchemaView"),
+        name="api-schema",
+    ),
     path(
         "api/docs/",
-        SpectacularSwaggerView.as_view(url_name="api-schema"),
+        lazy_view(
+            "drf_spectacular.views.SpectacularSwaggerView", url_name="api-schema"
+        ),
         name="api-docs",
     ),
 ]
 
 if settings.DEBUG:
+    from django.views import defaults as default_views
+
     # This allows the error pages to be debugged during development, just visit
     # these url in browser to see how these error pages look like.
     urlpatterns += [
@@ -67,3 +101,6 @@ if settings.DEBUG:
         import debug_toolbar
 
         urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
+
+# Views that may write run in a transaction, see restaurant_app.core.transactions.
+urlpatterns = [request_transactions(urlpatterns)]
@@ -35,6 +35,15 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
 # file. This includes Django's development server, if the WSGI_APPLICATION
 # setting points here.
 application = get_wsgi_application()
+
+# Compile the templates now rather than on the first requests; with gunicorn's
+# --preload this happens once, before the workers fork.
+from django.conf import settings
+
+if settings.TEMPLATE_PRELOAD:
+    from restaurant_app.core.template_preload import preload_templates
+
+    preload_templates()
 # Apply WSGI middleware here.
 # from helloworld.wsgi import HelloWorldApplication
 # application = HelloWorldApplication(application)
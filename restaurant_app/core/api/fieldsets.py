@@ -0,0 +1,102 @@
+"""
+Sparse fieldsets: ``?fields=name,url`` returns only those fields.
+
+``SparseFieldsetSerializerMixin`` drops the other fields from the serializer,
+and ``SparseFieldsetMixin`` narrows the view's queryset to match: ``.only()``
+the columns the remaining fields read, and no joins or prefetches they don't
+need. Only for reads; writes always see every field.
+"""
+
+from __future__ import annotations
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from restaurant_app.core.api.pagination import ordering_columns
+
+FIELDS_PARAM = "fields"
+
+
+def requested_fields(request) -> set[str] | None:
+    """The fields asked for with ``?fields=``, or ``None`` for all of them."""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    value = request.GET.get(FIELDS_PARAM, "")
+    names = {name.strip() for name in value.split(",")} - {""}
+    return names or None
+
+
+def source_column(model, attrs: list[str]) -> str | None:
+    """The ``.only()`` path for a field source, if it's a model column."""
+    for index, attr in enumerate(attrs):
+        try:
+            field = model._meta.get_field(attr)  # noqa: SLF001
+        except FieldDoesNotExist:
+            return None
+        if field.many_to_many or field.one_to_many:
+            return None
+        if field.is_relation and index < len(attrs) - 1:
+            model = field.related_model
+        elif index < len(attrs) - 1:
+            return None
+    return "__".join(attrs)
+
+
+class SparseFieldsetSerializerMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        names = requested_fields(self.context.get("request"))  # type: ignore[attr-defined]
+        if names is None:
+            return
+        fields = self.fields  # type: ignore[attr-defined]
+        if unknown := names - set(fields):
+            msg = f"Unknown fields: {', '.join(sorted(unknown))}."
+            raise serializers.ValidationError({FIELDS_PARAM: [msg]})
+        for name in set(fields) - names:
+            fields.pop(name)
+
+    def model_columns(self) -> list[str] | None:
+        """
+        What to pass to ``.only()`` for the remaining fields.
+
+        ``None`` if any of them reads something other than columns (nested
+        serializers, properties, prefetched lists): the queryset is left alone.
+        """
+        model = self.Meta.model  # type: ignore[attr-defined]
+        columns = []
+        for field in self.fields.values():  # type: ignore[attr-defined]
+            if isinstance(field, serializers.HyperlinkedIdentityField):
+                columns.append(field.lookup_field)
+                continue
+            if isinstance(field, serializers.BaseSerializer) or field.source == "*":
+                return None
+            column = source_column(model, field.source_attrs)
+            if column is None:
+                return None
+            columns.append(column)
+        return columns
+
+
+class SparseFieldsetMixin:
+    """For viewsets whose serializer uses ``SparseFieldsetSerializerMixin``."""
+
+    sparse_fieldset_actions = ("list", "retrieve")
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)  # type: ignore[misc]
+        if (
+            self.action not in self.sparse_fieldset_actions  # type: ignore[attr-defined]
+            or requested_fields(self.request) is None  # type: ignore[attr-defined]
+        ):
+            return queryset
+        columns = self.get_serializer().model_columns()  # type: ignore[attr-defined]
+        if columns is None:
+            return queryset
+        # The paginator reads its cursor from the ordering fields.
+        columns = {*columns, *ordering_columns(self, queryset)}
+        related = {column.split("__")[0] for column in columns if "__" in column}
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*columns)
@@ -0,0 +1,32 @@
+from rest_framework import pagination
+
+
+def ordering_columns(view, queryset) -> list[str]:
+    """The columns a cursor paginator reads its position from, if any."""
+    paginator = view.paginator
+    if not isinstance(paginator, pagination.CursorPagination):
+        return []
+    ordering = paginator.get_ordering(view.request, queryset, view)
+    return [name.lstrip("-") for name in ordering]
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination on the view's ``ordering``.
+
+    Each page filters on the last row of the previous one (``WHERE id < ...``)
+    instead of skipping rows with ``OFFSET``, so page 1000 costs the same as
+    page 1. The first ordering field is the cursor position: it should be
+    unique and indexed, with the view's filters, e.g. ``(placed_by, id)`` for
+    ``ordering = ("-id",)`` on a user's orders.
+    """
+
+    ordering = ("-pk",)
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "ordering", None)
+        if ordering is None:
+            return super().get_ordering(request, queryset, view)
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
@@ -0,0 +1,38 @@
+"""
+``JSONParser`` on orjson.
+
+Parses UTF-8 request bodies with orjson and hands anything it rejects (bad
+JSON, a byte order mark, other encodings) to DRF's ``JSONParser``, so invalid
+input gets the same 400 and message as before. Unlike ``json``, orjson reads
+integers over 64 bits as floats. Falls back to ``JSONParser`` entirely when
+orjson isn't installed.
+"""
+
+from __future__ import annotations
+
+import codecs
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from restaurant_app.core.api.renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,104 @@
+"""
+The OpenAPI schema, generated ahead of time.
+
+Generating the schema introspects every view and serializer, and rendering it
+as YAML takes about as long again, so ``SchemaView`` doesn't do either per
+request. ``manage.py openapi_schema`` writes the schema to ``API_SCHEMA_FILE``,
+which is committed with the code; ``--check`` fails when it no longer matches
+what the code generates, and CI runs it. The view serves that file, rendered
+once per format and process, with an ETag from its content hash.
+
+Requests the file can't answer (``?lang=``, an API version) and deployments
+without ``API_SCHEMA_FILE`` get the schema generated as before.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+import yaml
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from drf_spectacular.renderers import OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+from restaurant_app.core.http import make_etag
+
+# libyaml's loader, when PyYAML was built with it.
+SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def generate_schema() -> bytes:
+    """The schema as ``SpectacularAPIView`` generates it, in YAML."""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(
+        request=None,
+        public=spectacular_settings.SERVE_PUBLIC,
+    )
+    return OpenApiYamlRenderer().render(schema, renderer_context={})
+
+
+@dataclass
+class StoredSchema:
+    data: dict[str, Any]
+    digest: str
+    # Renderer class -> rendered schema.
+    rendered: dict[type, bytes] = field(default_factory=dict)
+
+    def render(self, renderer) -> bytes:
+        cls = type(renderer)
+        if cls not in self.rendered:
+            self.rendered[cls] = renderer.render(
+                self.data,
+                renderer.media_type,
+                {},
+            )
+        return self.rendered[cls]
+
+
+@functools.cache
+def stored_schema() -> StoredSchema | None:
+    """``API_SCHEMA_FILE``, read once per process; None if there's none."""
+    if not settings.API_SCHEMA_FILE:
+        return None
+    try:
+        content = Path(settings.API_SCHEMA_FILE).read_bytes()
+    except FileNotFoundError:
+        return None
+    return StoredSchema(
+        data=yaml.load(content, Loader=SAFE_LOADER),  # noqa: S506
+        digest=hashlib.blake2b(content, digest_size=16).hexdigest(),
+    )
+
+
+class SchemaView(SpectacularAPIView):
+    def _get_schema_response(self, request):
+        schema = stored_schema()
+        if (
+            schema is None
+            or request.GET.get("lang")
+            or self.api_version
+            or request.version
+            or self._get_version_parameter(request)
+        ):
+            return super()._get_schema_response(request)
+        etag = make_etag(request, "schema", schema.digest)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            renderer = request.accepted_renderer
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+            response = HttpResponse(schema.render(renderer), content_type=content_type)
+            response.headers["Content-Disposition"] = (
+                f'inline; filename="{self._get_filename(request, None)}"'
+            )
+        response.headers["ETag"] = etag
+        return response
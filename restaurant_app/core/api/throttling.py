@@ -0,0 +1,46 @@
+from rest_framework import throttling
+from rest_framework.settings import api_settings
+
+from restaurant_app.core import ratelimit
+
+
+class RateThrottle(throttling.SimpleRateThrottle):
+    """
+    DRF's rate throttles on ``restaurant_app.core.ratelimit``.
+
+    DRF keeps a list of request times per client in the cache, read and
+    written back whole on every request, so concurrent requests overwrite
+    each other's. This makes one atomic call on Redis instead.
+    """
+
+    num_requests: int
+    duration: int
+
+    def get_rate(self):
+        # DRF reads the rates into a class attribute when it's imported.
+        self.THROTTLE_RATES = api_settings.DEFAULT_THROTTLE_RATES  # type: ignore[assignment]
+        return super().get_rate()
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        self.wait_seconds = ratelimit.hit(self.key, self.num_requests, self.duration)
+        return self.wait_seconds is None
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class AnonRateThrottle(throttling.AnonRateThrottle, RateThrottle):
+    pass
+
+
+class UserRateThrottle(throttling.UserRateThrottle, RateThrottle):
+    pass
+
+
+class ScopedRateThrottle(throttling.ScopedRateThrottle, RateThrottle):
+    pass
@@ -0,0 +1,115 @@
+"""
+Read-only fast path for list responses.
+
+``ValuesSerializer`` produces the same output as a ``ModelSerializer`` from
+``.values()`` rows: no model instances, no per-field ``get_attribute`` and,
+for the ``url`` field, one ``reverse()`` per response instead of one per row.
+It works for serializers whose fields read model columns: plain fields,
+dotted sources through foreign keys and ``HyperlinkedIdentityField``. Nested
+serializers and method fields need the full serializer.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.http import RFC3986_SUBDELIMS
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+from restaurant_app.core.api.fieldsets import source_column
+from restaurant_app.core.api.pagination import ordering_columns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+# Fields whose representation is the value the database driver returns.
+RAW_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ReadOnlyField,
+)
+LOOKUP_PLACEHOLDER = "__lookup__"
+
+
+def _url_template(field, context: dict) -> Callable[[object], str]:
+    """``field.to_representation()``'s URL, reversed once for every row."""
+    url = reverse(
+        field.view_name,
+        kwargs={field.lookup_url_kwarg: LOOKUP_PLACEHOLDER},
+        request=context.get("request"),
+        format=context.get("format"),
+    )
+    prefix, _, suffix = url.partition(LOOKUP_PLACEHOLDER)
+    # What reverse() does to the path.
+    safe = RFC3986_SUBDELIMS + "/~:@"
+    return lambda value: f"{prefix}{quote(str(value), safe=safe)}{suffix}"
+
+
+class ValuesSerializer:
+    """
+    Serialize ``.values()`` rows the way ``serializer_class`` serializes objects.
+
+    Takes the serializer's fields as built for ``context``, so sparse fieldsets
+    apply. ``columns`` is what to pass to ``.values()``.
+    """
+
+    def __init__(self, serializer_class, context: dict | None = None):
+        context = context or {}
+        serializer = serializer_class(context=context)
+        model = serializer.Meta.model
+        self.fields: list[tuple[str, str, Callable | None]] = []
+        for name, field in serializer.fields.items():
+            if isinstance(field, serializers.HyperlinkedIdentityField):
+                column = field.lookup_field
+                convert = _url_template(field, context)
+            elif isinstance(field, serializers.BaseSerializer) or field.source == "*":
+                column, convert = None, None
+            else:
+                column = source_column(model, field.source_attrs)
+                convert = (
+                    None if isinstance(field, RAW_FIELDS) else field.to_representation
+                )
+            if column is None:
+                msg = (
+                    f"{serializer_class.__name__}.{name} doesn't read a model "
+                    "column and can't be served from .values()."
+                )
+                raise ImproperlyConfigured(msg)
+            self.fields.append((name, column, convert))
+        self.columns = list(dict.fromkeys(column for _, column, _ in self.fields))
+
+    def to_representation(self, row: dict) -> dict:
+        data = {}
+        for name, column, convert in self.fields:
+            value = row[column]
+            data[name] = value if convert is None or value is None else convert(value)
+        return data
+
+    def serialize(self, rows: Iterable[dict]) -> list[dict]:
+        return [self.to_representation(row) for row in rows]
+
+
+class ValuesListMixin:
+    """Serve the ``list`` action with ``ValuesSerializer``."""
+
+    def list(self, request, *args, **kwargs):
+        serializer = ValuesSerializer(
+            self.get_serializer_class(),  # type: ignore[attr-defined]
+            context=self.get_serializer_context(),  # type: ignore[attr-defined]
+        )
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore[attr-defined]
+        # The paginator reads its cursor from the ordering fields.
+        ordering = ordering_columns(self, queryset)
+        columns = dict.fromkeys([*serializer.columns, *ordering])
+        rows = queryset.values(*columns)
+        page = self.paginate_queryset(rows)  # type: ignore[attr-defined]
+        if page is None:
+            return Response(serializer.serialize(rows))
+        data = serializer.serialize(page)
+        return self.get_paginated_response(data)  # type: ignore[attr-defined]
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class CoreConfig(AppConfig):
+    name = "restaurant_app.core"
+    verbose_name = _("Core")
+
+    def ready(self):
+        from restaurant_app.core import instrumentation
+
+        instrumentation.install()
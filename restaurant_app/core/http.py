@@ -0,0 +1,83 @@
+"""
+Conditional GET.
+
+Views get cheap validators, such as a row's ``updated`` timestamp or version
+number, from Django's ``condition`` decorator. It answers a matching
+``If-None-Match`` or ``If-Modified-Since`` with a 304 before the view runs, so
+nothing is rendered or serialized. Every ETag includes ``release_version()``,
+since a deploy may change the markup or the API output for the same data.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.utils.translation import get_language
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+
+@functools.cache
+def release_version() -> str:
+    """
+    ``RELEASE_VERSION``, or a digest of the code and templates when it's unset.
+
+    The digest covers the paths, sizes and modification times of the files
+    under ``restaurant_app`` (except uploads) and ``config``, read once per
+    process.
+    """
+    if settings.RELEASE_VERSION:
+        return settings.RELEASE_VERSION
+    digest = hashlib.blake2b(digest_size=8)
+    media = Path(settings.MEDIA_ROOT)
+    for root in (Path(settings.APPS_DIR), Path(settings.BASE_DIR) / "config"):
+        for path in sorted(root.rglob("*")):
+            if (
+                "__pycache__" in path.parts
+                or path.is_relative_to(media)
+                or not path.is_file()
+            ):
+                continue
+            stat = path.stat()
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def make_etag(request, *parts) -> str:
+    """
+    A strong ETag for the data identified by ``parts``, as this request gets it.
+
+    Adds what the body depends on besides the data: the release, the language,
+    the format DRF negotiated and the query string (``?fields=``, cursors).
+    """
+    renderer = getattr(request, "accepted_renderer", None)
+    key = (
+        release_version(),
+        get_language(),
+        renderer.format if renderer is not None else None,
+        request.META.get("QUERY_STRING", ""),
+        *parts,
+    )
+    return f'"{hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()}"'
+
+
+def page_etag(request, *args, **kwargs) -> str | None:
+    """For pages that only depend on the templates and who is looking."""
+    if len(get_messages(request)):
+        # They'd never be shown.
+        return None
+    user = request.user
+    if not user.is_authenticated:
+        return make_etag(request, request.path)
+    return make_etag(request, request.path, user.pk, user.updated)
+
+
+def conditional_page(view):
+    """Revalidate ``view``'s pages with ``page_etag`` on every use."""
+    return cache_control(private=True, no_cache=True)(
+        condition(etag_func=page_etag)(view),
+    )
@@ -0,0 +1,104 @@
+"""
+Where startup time goes, from ``python -X importtime``.
+
+``measure()`` starts a fresh interpreter that sets Django up (and by default
+loads the URLconf, as the first request or ``manage.py check`` does) and
+parses the import tree CPython reports on stderr. Each module appears once,
+under whichever module imported it first, with its own time and the time of
+everything it pulled in. ``manage.py import_report`` prints the heaviest
+modules of ``PROJECT_PACKAGES`` and the imports that make them heavy.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+PROJECT_PACKAGES = ("config", "restaurant_app")
+
+# -X importtime only times the import statement, not importlib.import_module(),
+# which Django loads settings, apps, admin modules and the URLconf with.
+TIME_IMPORT_MODULE = """
+import importlib
+import importlib.util
+import sys
+
+
+def import_module(name, package=None):
+    name = importlib.util.resolve_name(name, package) if package else name
+    __import__(name)
+    return sys.modules[name]
+
+
+importlib.import_module = import_module
+"""
+SETUP = "import django; django.setup()"
+LOAD_URLCONF = "from django.urls import get_resolver; get_resolver().url_patterns"
+
+# import time:       self [us] |  cumulative | imported package
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class Import:
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list[Import] = field(default_factory=list)
+
+    @property
+    def in_project(self) -> bool:
+        return self.name.partition(".")[0] in PROJECT_PACKAGES
+
+
+def parse(output: str) -> list[Import]:
+    """The top-level imports in ``-X importtime`` output, with their subtrees."""
+    # Modules are reported once they finish, after what they imported, one
+    # level of indentation deeper.
+    pending: dict[int, list[Import]] = {}
+    for line in output.splitlines():
+        match = LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        pending.setdefault(depth, []).append(
+            Import(
+                name,
+                int(self_us),
+                int(cumulative_us),
+                pending.pop(depth + 1, []),
+            ),
+        )
+    return pending.get(0, [])
+
+
+def walk(imports: Iterable[Import]) -> Iterator[Import]:
+    for module in imports:
+        yield module
+        yield from walk(module.children)
+
+
+def measure(*, urlconf: bool = True) -> list[Import]:
+    """Import what Django startup imports in a new interpreter, and parse it."""
+    code = "\n".join([TIME_IMPORT_MODULE, SETUP, LOAD_URLCONF if urlconf else ""])
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=os.environ,
+        check=False,
+    )
+    if result.returncode:
+        msg = f"Django failed to start:\n{result.stderr[-2000:]}"
+        raise RuntimeError(msg)
+    return parse(result.stderr)
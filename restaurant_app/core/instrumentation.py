@@ -0,0 +1,230 @@
+"""
+Per-request performance counters.
+
+``ServerTimingMiddleware`` activates a ``RequestMetrics`` for sampled requests;
+the hooks installed here only record into it while one is active, so the cost
+for unsampled requests is a context variable lookup per query, cache read or
+template render. Database connection pools are reported separately, as one log
+line per pool every ``DATABASE_POOL_STATS_INTERVAL`` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
+from django.template import TemplateDoesNotExist
+from django.template.backends import django as django_backend
+
+_current: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics",
+    default=None,
+)
+_MISS = object()
+
+logger = logging.getLogger("restaurant_app.performance")
+
+
+@dataclass
+class RequestMetrics:
+    db_queries: int = 0
+    db_time: float = 0.0
+    db_pool_checkouts: int = 0
+    db_pool_wait: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    template_time: float = 0.0
+    template_depth: int = field(default=0, repr=False)
+
+
+def start():
+    """Activate a fresh ``RequestMetrics``; returns it with the reset token."""
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def stop(token) -> None:
+    _current.reset(token)
+
+
+def current() -> RequestMetrics | None:
+    return _current.get()
+
+
+# DATABASE
+# ------------------------------------------------------------------------------
+def _execute_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+def _install_execute_wrapper(sender, connection, **kwargs):
+    # Connection objects outlive reconnects, so only add the wrapper once.
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute_wrapper)
+
+
+# DATABASE POOLS
+# ------------------------------------------------------------------------------
+_pool_report_lock = threading.Lock()
+_next_pool_report = 0.0
+
+
+def _report_pool_stats(sender, **kwargs):
+    global _next_pool_report  # noqa: PLW0603
+    interval = settings.DATABASE_POOL_STATS_INTERVAL
+    if interval <= 0 or time.monotonic() < _next_pool_report:
+        return
+    with _pool_report_lock:
+        if time.monotonic() < _next_pool_report:
+            return
+        _next_pool_report = time.monotonic() + interval
+    from restaurant_app.core.pooled_postgresql.base import pool_stats
+
+    for alias, stats in pool_stats().items():
+        logger.info(
+            "db_pool alias=%s size=%d max_size=%d checked_out=%d waiting=%d "
+            "requests=%d wait_ms=%d timeouts=%d connections=%d connections_lost=%d",
+            alias,
+            stats["size"],
+            stats["max_size"],
+            stats["checked_out"],
+            stats["waiting"],
+            stats["requests"],
+            stats["wait_ms"],
+            stats["timeouts"],
+            stats["connections"],
+            stats["connections_lost"],
+            extra={"db_pool": alias, **stats},
+        )
+
+
+# CACHES
+# ------------------------------------------------------------------------------
+def _record_get(value) -> None:
+    if (metrics := _current.get()) is not None:
+        if value is _MISS:
+            metrics.cache_misses += 1
+        else:
+            metrics.cache_hits += 1
+
+
+def _instrument_cache(cache):
+    # Extra arguments are passed through: django-redis takes a ``client``.
+    get = cache.get
+    get_many = cache.get_many
+
+    def instrumented_get(key, default=None, *args, **kwargs):
+        value = get(key, _MISS, *args, **kwargs)
+        _record_get(value)
+        return default if value is _MISS else value
+
+    def instrumented_get_many(keys, *args, **kwargs):
+        keys = list(keys)
+        metrics = _current.get()
+        if metrics is None:
+            return get_many(keys, *args, **kwargs)
+        # Some backends implement get_many() on top of get(); count each key
+        # once whatever the backend does internally.
+        hits, misses = metrics.cache_hits, metrics.cache_misses
+        values = get_many(keys, *args, **kwargs)
+        metrics.cache_hits = hits + len(values)
+        metrics.cache_misses = misses + len(keys) - len(values)
+        return values
+
+    cache.get = instrumented_get
+    cache.get_many = instrumented_get_many
+    # BaseCache's async methods run the sync ones, counted already.
+    if type(cache).aget is not BaseCache.aget:
+        aget = cache.aget
+
+        async def instrumented_aget(key, default=None, *args, **kwargs):
+            value = await aget(key, _MISS, *args, **kwargs)
+            _record_get(value)
+            return default if value is _MISS else value
+
+        cache.aget = instrumented_aget
+    if type(cache).aget_many is not BaseCache.aget_many:
+        aget_many = cache.aget_many
+
+        async def instrumented_aget_many(keys, *args, **kwargs):
+            keys = list(keys)
+            metrics = _current.get()
+            if metrics is None:
+                return await aget_many(keys, *args, **kwargs)
+            hits, misses = metrics.cache_hits, metrics.cache_misses
+            values = await aget_many(keys, *args, **kwargs)
+            metrics.cache_hits = hits + len(values)
+            metrics.cache_misses = misses + len(keys) - len(values)
+            return values
+
+        cache.aget_many = instrumented_aget_many
+    return cache
+
+
+def _instrument_caches() -> None:
+    create_connection = caches.create_connection
+
+    def instrumented_create_connection(alias):
+        return _instrument_cache(create_connection(alias))
+
+    caches.create_connection = instrumented_create_connection  # type: ignore[method-assign]
+
+
+# TEMPLATES
+# ------------------------------------------------------------------------------
+class Template(django_backend.Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        # Templates rendered from inside another one (form widgets, crispy
+        # layouts) are already covered by the outer render.
+        if metrics is None or metrics.template_depth:
+            return super().render(context, request)
+        metrics.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
+            metrics.template_depth -= 1
+
+
+class DjangoTemplates(django_backend.DjangoTemplates):
+    """The stock Django template backend, timing renders of its templates."""
+
+    def from_string(self, template_code):
+        return Template(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return Template(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            django_backend.reraise(exc, self)
+
+
+def install() -> None:
+    connection_created.connect(
+        _install_execute_wrapper,
+        dispatch_uid="restaurant_app.core.instrumentation",
+    )
+    request_finished.connect(
+        _report_pool_stats,
+        dispatch_uid="restaurant_app.core.instrumentation",
+    )
+    _instrument_caches()
@@ -0,0 +1,115 @@
+"""
+Mail sent from a Celery worker instead of the request.
+
+``send_later()`` serializes messages to JSON and queues them, up to
+``EMAIL_BATCH_SIZE`` per task, for ``restaurant_app.core.tasks.send_messages``,
+which sends each batch over one connection of ``EMAIL_BACKEND``: a single SMTP
+session, or a single API client for anymail. The request that sends mail then
+only pays for rendering it and for one Redis command per batch.
+
+Messages are held until the current transaction commits, and all those sent in
+it are queued together, however many ``send_later()`` calls they came from: a
+rolled back request sends nothing, and a worker never sends mail about rows it
+can't see yet. Outside transactions they are queued at once.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
+
+
+def _attachment_to_dict(attachment) -> dict[str, Any]:
+    if not isinstance(attachment, tuple):
+        msg = "Only (filename, content, mimetype) attachments can be queued."
+        raise TypeError(msg)
+    filename, content, mimetype = attachment
+    if isinstance(content, bytes):
+        return {
+            "filename": filename,
+            "base64": base64.b64encode(content).decode("ascii"),
+            "mimetype": mimetype,
+        }
+    return {"filename": filename, "content": content, "mimetype": mimetype}
+
+
+def _attachment_from_dict(data: dict[str, Any]) -> tuple:
+    content = data.get("content")
+    if "base64" in data:
+        content = base64.b64decode(data["base64"])
+    return data["filename"], content, data["mimetype"]
+
+
+def message_to_dict(message: EmailMessage) -> dict[str, Any]:
+    return {
+        "subject": message.subject,
+        "body": message.body,
+        "from_email": message.from_email,
+        "to": message.to,
+        "cc": message.cc,
+        "bcc": message.bcc,
+        "reply_to": message.reply_to,
+        "headers": message.extra_headers,
+        "content_subtype": message.content_subtype,
+        "alternatives": getattr(message, "alternatives", []),
+        "attachments": [_attachment_to_dict(a) for a in message.attachments],
+    }
+
+
+def message_from_dict(data: dict[str, Any]) -> EmailMultiAlternatives:
+    message = EmailMultiAlternatives(
+        subject=data["subject"],
+        body=data["body"],
+        from_email=data["from_email"],
+        to=data["to"],
+        cc=data["cc"],
+        bcc=data["bcc"],
+        reply_to=data["reply_to"],
+        headers=data["headers"],
+        alternatives=[tuple(a) for a in data["alternatives"]],
+        attachments=[_attachment_from_dict(a) for a in data["attachments"]],
+    )
+    message.content_subtype = data["content_subtype"]
+    return message
+
+
+class PendingMail:
+    """The on-commit hook queuing the messages sent in a transaction."""
+
+    def __init__(self, messages: list[dict[str, Any]]):
+        self.messages = messages
+
+    def __call__(self) -> None:
+        # Imported here: Celery is slow to import, see config.celery_app.
+        from restaurant_app.core.tasks import send_messages
+
+        size = settings.EMAIL_BATCH_SIZE
+        for start in range(0, len(self.messages), size):
+            send_messages.delay(self.messages[start : start + size])
+
+
+def _pending_mail(connection) -> PendingMail | None:
+    """The hook for mail sent at the current savepoint, if there's one yet."""
+    # Only reused at the same savepoint: rolling one back drops its hooks, and
+    # must drop its mail with them, but not the mail sent before it.
+    savepoint_ids = set(connection.savepoint_ids)
+    for hook_savepoint_ids, hook, _robust in reversed(connection.run_on_commit):
+        if isinstance(hook, PendingMail) and hook_savepoint_ids == savepoint_ids:
+            return hook
+    return None
+
+
+def send_later(*messages: EmailMessage) -> None:
+    """Queue ``messages`` for a worker to send, on commit."""
+    payload = [message_to_dict(message) for message in messages]
+    connection = transaction.get_connection()
+    pending = _pending_mail(connection) if connection.in_atomic_block else None
+    if pending is not None:
+        pending.messages.extend(payload)
+    else:
+        transaction.on_commit(PendingMail(payload), robust=True)
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+
+from restaurant_app.core.importtime import measure
+from restaurant_app.core.importtime import walk
+
+
+def _ms(microseconds: int) -> str:
+    return f"{microseconds / 1000:8.1f} ms"
+
+
+class Command(BaseCommand):
+    help = (
+        "Run `python -X importtime` on Django's startup and list the heaviest "
+        "config and restaurant_app modules, with the imports that make them "
+        "heavy. Times are for the first import of each module."
+    )
+    # It measures a new interpreter; loading the URLconf here would be wasted.
+    requires_system_checks: list[str] = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--no-urlconf",
+            action="store_false",
+            dest="urlconf",
+            help="Stop after django.setup(), as commands that skip checks do.",
+        )
+        parser.add_argument("--limit", type=int, default=15)
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=20.0,
+            help="Flag modules taking at least this many milliseconds.",
+        )
+        parser.add_argument(
+            "--children",
+            type=int,
+            default=3,
+            help="Third-party imports listed under each flagged module.",
+        )
+
+    def handle(self, *args, **options):
+        imports = measure(urlconf=options["urlconf"])
+        modules = list(walk(imports))
+        total = sum(module.cumulative_us for module in imports)
+        self.stdout.write(f"{len(modules)} modules imported in {_ms(total).strip()}.")
+        self.stdout.write("")
+
+        threshold = options["threshold"] * 1000
+        project = sorted(
+            (module for module in modules if module.in_project),
+            key=lambda module: module.cumulative_us,
+            reverse=True,
+        )
+        for module in project[: options["limit"]]:
+            heavy = module.cumulative_us >= threshold
+            self.stdout.write(
+                f"{'!' if heavy else ' '} {_ms(module.cumulative_us)}  {module.name}",
+            )
+            if not heavy:
+                continue
+            children = sorted(
+                (child for child in module.children if not child.in_project),
+                key=lambda child: child.cumulative_us,
+                reverse=True,
+            )
+            for child in children[: options["children"]]:
+                self.stdout.write(f"    {_ms(child.cumulative_us)}    {child.name}")
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from restaurant_app.core.pages import invalidate_pages
+
+
+class Command(BaseCommand):
+    help = (
+        "Drop every page and template fragment in the page cache, e.g. after "
+        "editing content outside a deploy. Deploys don't need it: a new "
+        "RELEASE_VERSION starts a new cache."
+    )
+
+    def handle(self, *args, **options):
+        invalidate_pages()
+        self.stdout.write("Page cache invalidated.")
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore as DatabaseSessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy unexpired sessions from the django_session table to the cache used "
+        "by SESSION_ENGINE, under the same keys, so that nobody is logged out. "
+        "Sessions already in the cache are left alone, which makes it safe to run "
+        "both before and after switching SESSION_ENGINE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete the copied sessions from the database.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, batch_size, delete, dry_run, **options):
+        store = import_string(f"{settings.SESSION_ENGINE}.SessionStore")
+        prefix = getattr(store, "cache_key_prefix", None)
+        if prefix is None:
+            msg = f"{settings.SESSION_ENGINE} does not keep sessions in a cache."
+            raise CommandError(msg)
+        self.cache = caches[settings.SESSION_CACHE_ALIAS]
+        self.prefix = prefix
+        decoder = DatabaseSessionStore()
+
+        now = timezone.now()
+        sessions = Session.objects.filter(expire_date__gt=now).values_list(
+            "session_key",
+            "session_data",
+            "expire_date",
+        )
+        copied = total = 0
+        batch: dict[str, tuple[dict, int]] = {}
+        for session_key, session_data, expire_date in sessions.iterator(batch_size):
+            timeout = int((expire_date - now).total_seconds())
+            batch[session_key] = (decoder.decode(session_data), timeout)
+            if len(batch) >= batch_size:
+                copied += self.copy(batch, delete=delete, dry_run=dry_run)
+                total += len(batch)
+                batch = {}
+        if batch:
+            copied += self.copy(batch, delete=delete, dry_run=dry_run)
+            total += len(batch)
+
+        verb = "Would copy" if dry_run else "Copied"
+        self.stdout.write(
+            f"{verb} {copied} sessions; {total - copied} were already in the cache.",
+        )
+
+    def copy(self, batch, *, delete, dry_run) -> int:
+        existing = self.cache.get_many([self.prefix + key for key in batch])
+        if dry_run:
+            return len(batch) - len(existing)
+        # set_many() takes one timeout for the whole batch, and add() keeps the
+        # sessions that changed in the cache since the switch.
+        copied = 0
+        for session_key, (data, timeout) in batch.items():
+            cache_key = self.prefix + session_key
+            if cache_key not in existing and self.cache.add(cache_key, data, timeout):
+                copied += 1
+        if delete:
+            Session.objects.filter(session_key__in=list(batch)).delete()
+        return copied
@@ -0,0 +1,61 @@
+import difflib
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from restaurant_app.core.api.schema import generate_schema
+
+# Lines of the diff shown when the schema has drifted.
+DIFF_LINES = 40
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the OpenAPI schema the code generates to API_SCHEMA_FILE, which "
+        "api/schema/ serves. With --check, fail if the file doesn't match it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Compare the file with the generated schema instead of writing it.",
+        )
+        parser.add_argument(
+            "--file",
+            default=settings.API_SCHEMA_FILE,
+            help="Defaults to the API_SCHEMA_FILE setting.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["file"]:
+            msg = "API_SCHEMA_FILE isn't set; pass --file."
+            raise CommandError(msg)
+        path = Path(options["file"])
+        schema = generate_schema()
+
+        if not options["check"]:
+            path.write_bytes(schema)
+            self.stdout.write(f"Wrote {path}.")
+            return
+
+        current = path.read_bytes() if path.exists() else b""
+        if current == schema:
+            self.stdout.write(f"{path} is up to date.")
+            return
+        diff = list(
+            difflib.unified_diff(
+                current.decode().splitlines(),
+                schema.decode().splitlines(),
+                fromfile=str(path),
+                tofile="generated",
+                lineterm="",
+            ),
+        )
+        self.stderr.write("\n".join(diff[:DIFF_LINES]))
+        if len(diff) > DIFF_LINES:
+            self.stderr.write(f"... {len(diff) - DIFF_LINES} more lines")
+        msg = f"{path} is out of date; run `manage.py openapi_schema` and commit it."
+        raise CommandError(msg)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from restaurant_app.core.template_preload import preload_templates
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every project, allauth and crispy-forms template, as "
+        "config.wsgi does at startup with TEMPLATE_PRELOAD, and report those "
+        "that don't compile."
+    )
+
+    def handle(self, *args, **options):
+        result = preload_templates()
+        self.stdout.write(
+            f"Compiled {result.loaded} templates in "
+            f"{result.elapsed * 1000:.0f} ms, {len(result.failed)} failed.",
+        )
+        if options["verbosity"] > 1:
+            for name, error in sorted(result.failed.items()):
+                self.stdout.write(f"  {name}: {error}")
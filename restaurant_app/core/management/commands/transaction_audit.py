@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.urls import URLResolver
+from django.urls import get_resolver
+
+from restaurant_app.core.transactions import transaction_mode
+
+
+def _route(pattern) -> str:
+    return str(pattern.pattern).removeprefix("^").removesuffix("$")
+
+
+def _patterns(patterns, prefix="", namespace=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            inner = (
+                f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace
+            )
+            yield from _patterns(pattern.url_patterns, prefix + _route(pattern), inner)
+        else:
+            name = f"{namespace}{pattern.name}" if pattern.name else ""
+            yield f"/{prefix}{_route(pattern)}", name, pattern.callback
+
+
+def _view_path(view) -> str:
+    view = getattr(view, "view_class", None) or getattr(view, "cls", None) or view
+    return f"{view.__module__}.{view.__qualname__}"
+
+
+class Command(BaseCommand):
+    help = (
+        "List every URL pattern with the transaction its view runs in for reads "
+        "(GET, HEAD, OPTIONS) and for writes (POST, PUT, PATCH, DELETE)."
+    )
+
+    def handle(self, *args, **options):
+        rows = [["URL", "NAME", "VIEW", "READS", "WRITES"]]
+        rows += [
+            [
+                route,
+                name,
+                _view_path(view),
+                transaction_mode(view, "GET"),
+                transaction_mode(view, "POST"),
+            ]
+            for route, name, view in _patterns(get_resolver().url_patterns)
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        for row in rows:
+            line = "  ".join(
+                cell.ljust(width) for cell, width in zip(row, widths, strict=True)
+            )
+            self.stdout.write(line.rstrip())
@@ -0,0 +1,211 @@
+import logging
+import math
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction
+from asgiref.sync import markcoroutinefunction
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.shortcuts import render
+from rest_framework.throttling import BaseThrottle
+
+from restaurant_app.core import instrumentation
+from restaurant_app.core import ratelimit
+from restaurant_app.core.routers import RequestState
+from restaurant_app.core.routers import request_state
+
+logger = logging.getLogger("restaurant_app.performance")
+
+
+class ServerTimingMiddleware:
+    """
+    Time a sample of requests and report where the time went.
+
+    Wall time, DB queries, time waiting for a pooled connection, cache
+    hits/misses and template render time are added as a ``Server-Timing``
+    header and logged as one logfmt line per request.
+    ``PERFORMANCE_SAMPLE_RATE`` controls the fraction of requests measured.
+    Put it first in ``MIDDLEWARE`` so the wall time covers the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.PERFORMANCE_SAMPLE_RATE
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+        started = time.perf_counter()
+        metrics, token = instrumentation.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.stop(token)
+        return self.report(request, response, metrics, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+        started = time.perf_counter()
+        metrics, token = instrumentation.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            instrumentation.stop(token)
+        return self.report(request, response, metrics, time.perf_counter() - started)
+
+    def sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate  # noqa: S311
+
+    def report(self, request, response, metrics, elapsed):
+        resolver_match = getattr(request, "resolver_match", None)
+        view = resolver_match.view_name if resolver_match else "-"
+        timings = [
+            f"total;dur={elapsed * 1000:.1f}",
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.db_queries} queries"',
+            f"tpl;dur={metrics.template_time * 1000:.1f}",
+            f'cache;desc="{metrics.cache_hits} hits/{metrics.cache_misses} misses"',
+        ]
+        if metrics.db_pool_checkouts:
+            timings.append(
+                f"pool;dur={metrics.db_pool_wait * 1000:.1f};"
+                f'desc="{metrics.db_pool_checkouts} checkouts"',
+            )
+        response.headers["Server-Timing"] = ", ".join(timings)
+        logger.info(
+            "method=%s path=%s view=%s status=%s total_ms=%.1f db_queries=%d "
+            "db_ms=%.1f db_pool_wait_ms=%.1f cache_hits=%d cache_misses=%d "
+            "template_ms=%.1f",
+            request.method,
+            request.path,
+            view,
+            response.status_code,
+            elapsed * 1000,
+            metrics.db_queries,
+            metrics.db_time * 1000,
+            metrics.db_pool_wait * 1000,
+            metrics.cache_hits,
+            metrics.cache_misses,
+            metrics.template_time * 1000,
+            extra={
+                "view": view,
+                "status": response.status_code,
+                "total_ms": elapsed * 1000,
+                "db_queries": metrics.db_queries,
+                "db_ms": metrics.db_time * 1000,
+                "db_pool_wait_ms": metrics.db_pool_wait * 1000,
+                "cache_hits": metrics.cache_hits,
+                "cache_misses": metrics.cache_misses,
+                "template_ms": metrics.template_time * 1000,
+            },
+        )
+        return response
+
+
+class ReplicaPinMiddleware:
+    """
+    Track the request for ``ReplicaRouter``, and pin clients that wrote.
+
+    Needs to come after ``SessionMiddleware``. Not loaded without replicas.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        state = RequestState(request)
+        token = request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_state.reset(token)
+        if state.wrote:
+            state.pin()
+        return response
+
+    async def __acall__(self, request):
+        state = RequestState(request)
+        token = request_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_state.reset(token)
+        if state.wrote:
+            # The cache is Redis in production, keep it off the event loop.
+            await sync_to_async(state.pin)()
+        return response
+
+
+class RateLimitMiddleware:
+    """
+    Limit requests per client IP to the views under ``RATELIMIT_PATHS``.
+
+    It maps path prefixes to rates, e.g. ``{"/accounts/": "30/minute"}``; the
+    first prefix that matches counts, see ``restaurant_app.core.ratelimit``.
+    Clients over a limit get the 429 page with ``Retry-After``. It's for the
+    HTML views: the API has DRF's throttles. Needs to come after
+    ``AuthenticationMiddleware``, for the page. Not loaded without paths.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.RATELIMIT_PATHS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.limits = [
+            (prefix, *ratelimit.parse_rate(rate))
+            for prefix, rate in settings.RATELIMIT_PATHS.items()
+        ]
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        limit = self.limit(request)
+        response = self.check(request, *limit) if limit else None
+        return response or self.get_response(request)
+
+    async def __acall__(self, request):
+        limit = self.limit(request)
+        # The cache is Redis in production, keep it off the event loop.
+        response = await sync_to_async(self.check)(request, *limit) if limit else None
+        return response or await self.get_response(request)
+
+    def limit(self, request) -> tuple[str, int, int] | None:
+        for limit in self.limits:
+            if request.path_info.startswith(limit[0]):
+                return limit
+        return None
+
+    def check(self, request, prefix, requests, period):
+        ident = BaseThrottle().get_ident(request)
+        wait = ratelimit.hit(f"ratelimit_{prefix}_{ident}", requests, period)
+        if wait is None:
+            return None
+        response = render(request, "429.html", status=429)
+        response.headers["Retry-After"] = str(math.ceil(wait))
+        return response
@@ -0,0 +1,120 @@
+"""
+Rendered HTML in the shared cache.
+
+``anonymous_page_cache`` stores whole pages for visitors who aren't logged in,
+so a hit skips the view, the template and its context processors. The
+``{% fragment_cache %}`` tag (``page_cache`` library) does the same for a piece
+of a template, such as the navbar, with the user or anything else it depends on
+in the key.
+
+Keys carry ``page_cache_version()``: the release, so a deploy never serves HTML
+from the previous one, and a generation that ``invalidate_pages()`` (or the
+``invalidate_page_cache`` command) bumps to drop everything after a content
+change. Pages are also keyed on the language and on ``PAGE_SETTINGS``, the
+settings templates read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.translation import get_language
+
+from restaurant_app.core.cache import LocalCache
+from restaurant_app.core.http import release_version
+
+GENERATION_KEY = "pages:generation"
+# Settings the cached templates depend on.
+PAGE_SETTINGS = ("ACCOUNT_ALLOW_REGISTRATION", "DEBUG", "STATIC_URL")
+
+_generation = LocalCache(max_size=1, ttl=settings.PAGE_CACHE_LOCAL_TTL)
+
+
+def _first_generation() -> int:
+    # Not 0: should the counter get evicted, restarting it mustn't bring back
+    # the pages of an earlier generation.
+    return time.time_ns() // 1000
+
+
+def page_cache_version() -> str:
+    generation = _generation.get(GENERATION_KEY)
+    if generation is None:
+        generation = cache.get_or_set(GENERATION_KEY, _first_generation, timeout=None)
+        _generation.set(GENERATION_KEY, generation)
+    return f"{release_version()}.{generation}"
+
+
+def invalidate_pages() -> None:
+    """
+    Drop every cached page and fragment.
+
+    Other processes notice within ``PAGE_CACHE_LOCAL_TTL`` seconds.
+    """
+    cache.add(GENERATION_KEY, _first_generation(), timeout=None)
+    cache.incr(GENERATION_KEY)
+    _generation.clear()
+
+
+def _digest(*parts) -> str:
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def page_key(request) -> str:
+    vary = [getattr(settings, name) for name in PAGE_SETTINGS]
+    digest = _digest(request.path, get_language(), *vary)
+    return f"pages:{page_cache_version()}:page:{digest}"
+
+
+def fragment_key(name: str, *vary_on) -> str:
+    digest = _digest(get_language(), *vary_on)
+    return f"pages:{page_cache_version()}:fragment:{name}:{digest}"
+
+
+def _cacheable(request) -> bool:
+    return (
+        request.method in ("GET", "HEAD")
+        and not request.META.get("QUERY_STRING")
+        and not request.user.is_authenticated
+        and not len(get_messages(request))
+    )
+
+
+def anonymous_page_cache(view):
+    """
+    Serve ``view``'s pages to anonymous visitors from the cache.
+
+    Only successful responses that don't set cookies are stored, for
+    ``PAGE_CACHE_TIMEOUT`` seconds. Requests with a query string, pending
+    messages or a logged-in user always reach the view.
+    """
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not _cacheable(request):
+            return view(request, *args, **kwargs)
+        key = page_key(request)
+        if (page := cache.get(key)) is not None:
+            return HttpResponse(page["content"], content_type=page["content_type"])
+
+        def store(response):
+            if response.status_code == 200 and not response.cookies:  # noqa: PLR2004
+                page = {
+                    "content": response.content,
+                    "content_type": response["Content-Type"],
+                }
+                cache.set(key, page, settings.PAGE_CACHE_TIMEOUT)
+
+        response = view(request, *args, **kwargs)
+        if hasattr(response, "add_post_render_callback"):
+            response.add_post_render_callback(store)
+        else:
+            store(response)
+        return response
+
+    return wrapper
@@ -0,0 +1,54 @@
+"""
+A paginator that doesn't count big tables.
+
+Django's ``Paginator`` runs ``SELECT COUNT(*)`` for every page, which on
+PostgreSQL reads the whole table: seconds, once there are millions of rows.
+``EstimatedCountPaginator`` takes the row count of an unfiltered queryset from
+the planner's statistics instead, kept up to date by autovacuum's ``ANALYZE``,
+and only counts exactly when there are fewer than ``exact_below`` rows, when
+the queryset is filtered, or on other databases. Use it where an approximate
+total is fine, such as admin changelists::
+
+    class UserAdmin(admin.ModelAdmin):
+        paginator = EstimatedCountPaginator
+        show_full_result_count = False
+"""
+
+from __future__ import annotations
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset: QuerySet) -> int | None:
+    """
+    The planner's row count for the queryset's table, or ``None`` if there
+    isn't one: on other databases, or before the table is first analyzed.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    table = queryset.model._meta.db_table  # noqa: SLF001
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(table)],
+        )
+        (reltuples,) = cursor.fetchone()
+    # -1 until the first ANALYZE.
+    return int(reltuples) if reltuples >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    exact_below = 10_000
+
+    @cached_property
+    def count(self) -> int:
+        object_list = self.object_list
+        if isinstance(object_list, QuerySet) and not object_list.query.where:
+            estimate = estimated_count(object_list)
+            if estimate is not None and estimate >= self.exact_below:
+                return estimate
+        return super().count
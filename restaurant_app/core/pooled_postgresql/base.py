@@ -0,0 +1,139 @@
+"""
+PostgreSQL backend with a psycopg_pool connection pool.
+
+Django 5.0 has no ``OPTIONS["pool"]``; this backports the 5.1 behaviour. With
+``OPTIONS["pool"]`` set (``True`` or ``psycopg_pool.ConnectionPool`` keyword
+arguments such as ``min_size``, ``max_size`` and ``timeout``) each process keeps
+one pool per database: opening a connection checks one out, closing it at the
+end of the request puts it back. Without it this is the stock backend.
+
+Pooling replaces persistent connections, so ``CONN_MAX_AGE`` must be 0.
+``pool_stats()`` reports how each pool is doing.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from psycopg import IsolationLevel
+
+from restaurant_app.core import instrumentation
+
+NO_DB_ALIAS = "__no_db__"
+
+# (alias, database name) -> pool; the name changes when tests switch to the
+# test database.
+_pools: dict[tuple[str, str], Any] = {}
+_pools_lock = threading.Lock()
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """
+    Counters of this process's pools, by database alias.
+
+    ``checked_out`` and ``waiting`` are current values; ``requests``,
+    ``wait_ms`` (total time spent waiting for a connection), ``timeouts``,
+    ``connections`` (opened) and ``connections_lost`` count since the pool
+    started.
+    """
+    stats = {}
+    for (alias, _name), pool in list(_pools.items()):
+        raw = pool.get_stats()
+        stats[alias] = {
+            "size": raw.get("pool_size", 0),
+            "max_size": raw.get("pool_max", 0),
+            "checked_out": raw.get("pool_size", 0) - raw.get("pool_available", 0),
+            "waiting": raw.get("requests_waiting", 0),
+            "requests": raw.get("requests_num", 0),
+            "wait_ms": raw.get("requests_wait_ms", 0),
+            "timeouts": raw.get("requests_errors", 0),
+            "connections": raw.get("connections_num", 0),
+            "connections_lost": raw.get("connections_lost", 0),
+        }
+    return stats
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    @property
+    def pool(self):
+        options = self.settings_dict["OPTIONS"].get("pool")
+        if self.alias == NO_DB_ALIAS or not options:
+            return None
+        key = (self.alias, self.settings_dict["NAME"])
+        if key not in _pools:
+            if self.settings_dict.get("CONN_MAX_AGE", 0) != 0:
+                msg = (
+                    f"Database {self.alias!r}: pooling replaces persistent "
+                    "connections, set CONN_MAX_AGE to 0."
+                )
+                raise ImproperlyConfigured(msg)
+            from psycopg_pool import ConnectionPool
+
+            params = self.get_connection_params()
+            # Django sets the autocommit mode it wants on every checkout.
+            params["autocommit"] = True
+            check = self.settings_dict["CONN_HEALTH_CHECKS"]
+            pool = ConnectionPool(
+                kwargs=params,
+                open=False,
+                name=self.alias,
+                check=ConnectionPool.check_connection if check else None,
+                **({} if options is True else options),
+            )
+            with _pools_lock:
+                # Another thread may have got there first; its pool wins.
+                _pools.setdefault(key, pool)
+        return _pools[key]
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop("pool", None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        # As in the stock backend, minus connecting.
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        try:
+            self.isolation_level = IsolationLevel(
+                IsolationLevel.READ_COMMITTED
+                if isolation_level is None
+                else isolation_level,
+            )
+        except ValueError:
+            msg = f"Invalid transaction isolation level {isolation_level} specified."
+            raise ImproperlyConfigured(msg) from None
+
+        pool.open()
+        started = time.perf_counter()
+        connection = pool.getconn()
+        if (metrics := instrumentation.current()) is not None:
+            metrics.db_pool_checkouts += 1
+            metrics.db_pool_wait += time.perf_counter() - started
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is None or self.pool is None:
+            return super()._close()  # type: ignore[misc]
+        with self.wrap_database_errors:
+            # The connection knows its pool, which may be an earlier one if
+            # the settings changed since it was checked out.
+            self.connection._pool.putconn(self.connection)  # noqa: SLF001
+            self.connection = None
+        return None
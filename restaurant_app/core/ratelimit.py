@@ -0,0 +1,119 @@
+"""
+Rate limits shared by every process, kept in the default cache.
+
+Rates are in DRF's format, ``"<requests>/<period>"`` with a period of second,
+minute, hour or day (``"30/minute"``). ``hit()`` counts a request against a key.
+Limits are token buckets, computed with GCRA: up to ``requests`` may come at
+once, then one every ``period / requests``. Each key holds a single timestamp,
+the time at which its bucket is full again, and expires at that time.
+
+On Redis each hit is one atomic Lua script: a single round trip, whichever
+process or server makes it. Other caches run the same steps with a get and a
+set, which concurrent requests can race; they are for development and tests.
+
+If Redis can't be reached, requests are let through, as ``IGNORE_EXCEPTIONS``
+does for the cache, and Redis isn't tried again for ``OUTAGE_SECONDS``, so
+requests don't each wait for a connection timeout. ``RATELIMIT_ENABLED =
+False`` turns every limit off.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django_redis.cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+OUTAGE_SECONDS = 5.0
+
+# KEYS[1]: the bucket. ARGV[1]: milliseconds between requests, ARGV[2]: the
+# period in milliseconds. Returns 0, or the milliseconds to wait. Redis' clock
+# is the one every process shares.
+GCRA_SCRIPT = """
+local now = redis.call("TIME")
+now = now[1] * 1000 + math.floor(now[2] / 1000)
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local full_at = math.max(tonumber(redis.call("GET", KEYS[1])) or now, now)
+full_at = full_at + interval
+if full_at - now > period then
+    return full_at - now - period
+end
+redis.call("SET", KEYS[1], full_at, "PX", full_at - now)
+return 0
+"""
+
+_unavailable_until = 0.0
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """``"30/minute"`` -> ``(30, 60)``: requests and seconds, as DRF parses it."""
+    requests, period = rate.split("/")
+    return int(requests), PERIODS[period[0]]
+
+
+def hit(key: str, requests: int, period: int) -> float | None:
+    """
+    Count a request against ``key``, limited to ``requests`` per ``period``
+    seconds.
+
+    Returns ``None`` if it's allowed, or the seconds until one would be if it
+    isn't. Rejected requests don't count.
+    """
+    if not settings.RATELIMIT_ENABLED:
+        return None
+    backend = caches["default"]
+    # Whole milliseconds, as Redis' Lua can't hold microsecond timestamps
+    # exactly: over 1000 requests a second is the same as 1000.
+    interval_ms = max(period * 1000 // requests, 1)
+    if isinstance(backend, RedisCache):
+        wait_ms = _hit_redis(backend, key, interval_ms, period * 1000)
+    else:
+        wait_ms = _hit_cache(backend, key, interval_ms, period * 1000)
+    return wait_ms / 1000 if wait_ms else None
+
+
+@functools.cache
+def _script(client):
+    return client.register_script(GCRA_SCRIPT)
+
+
+def _hit_redis(backend: RedisCache, key: str, interval_ms: int, period_ms: int) -> int:
+    # redis is imported where it is used, as in restaurant_app.kitchen.brokers:
+    # this module is loaded by every process, with whichever cache.
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from redis.exceptions import TimeoutError as RedisTimeoutError
+
+    global _unavailable_until  # noqa: PLW0603
+    if time.monotonic() < _unavailable_until:
+        return 0
+    try:
+        client = backend.client.get_client(write=True)
+        return _script(client)(
+            keys=[backend.client.make_key(key)],
+            args=[interval_ms, period_ms],
+        )
+    except (RedisConnectionError, RedisTimeoutError):
+        _unavailable_until = time.monotonic() + OUTAGE_SECONDS
+        logger.warning(
+            "Redis is unreachable, rate limits are off for %g s",
+            OUTAGE_SECONDS,
+            exc_info=True,
+        )
+        return 0
+
+
+def _hit_cache(backend, key: str, interval_ms: int, period_ms: int) -> int:
+    # GCRA_SCRIPT, on the cache API.
+    now = int(time.time() * 1000)
+    full_at = max(backend.get(key, now), now) + interval_ms
+    if full_at - now > period_ms:
+        return full_at - now - period_ms
+    backend.set(key, full_at, (full_at - now) / 1000)
+    return 0
@@ -0,0 +1,103 @@
+"""
+Read replicas for the request read paths.
+
+``ReplicaRouter`` sends reads of the models in ``REPLICA_APPS`` to one of
+``DATABASE_REPLICAS``, picked at random, while serving a request. Everything
+else stays on the primary: writes, reads inside a transaction, and code that
+runs outside requests (management commands, tasks), which usually reads back
+what it just wrote.
+
+Replicas lag behind the primary, so a request that writes reads from the
+primary from then on, and so does whoever made it (the session's user, or the
+same ``Authorization`` header) for the next ``REPLICA_PIN_SECONDS``.
+``ReplicaPinMiddleware`` keeps track of that; pins live in the default cache.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import random
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def pin_key(identity: str) -> str:
+    return f"replicas:pin:{identity}"
+
+
+def client_identity(request) -> str | None:
+    """Who made the request, as far as pinning is concerned."""
+    session = getattr(request, "session", None)
+    user_id = session.get(SESSION_KEY) if session is not None else None
+    if user_id is not None:
+        return f"user:{user_id}"
+    authorization = request.headers.get("Authorization")
+    if authorization:
+        return f"auth:{hashlib.sha256(authorization.encode()).hexdigest()}"
+    return None
+
+
+class RequestState:
+    def __init__(self, request):
+        self.request = request
+        self.wrote = False
+
+    @cached_property
+    def pinned(self) -> bool:
+        # Only looked up once the request reads something a replica could serve.
+        identity = client_identity(self.request)
+        return identity is not None and cache.get(pin_key(identity)) is not None
+
+    def pin(self) -> None:
+        """Keep this client on the primary for the next ``REPLICA_PIN_SECONDS``."""
+        identity = client_identity(self.request)
+        if identity is not None:
+            cache.set(pin_key(identity), 1, settings.REPLICA_PIN_SECONDS)
+
+
+request_state: contextvars.ContextVar[RequestState | None] = contextvars.ContextVar(
+    "replica_request_state",
+    default=None,
+)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        app_label = model._meta.app_label  # noqa: SLF001
+        if not replicas or app_label not in settings.REPLICA_APPS:
+            return None
+        state = request_state.get()
+        if (
+            state is None
+            or state.wrote
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+            or state.pinned
+        ):
+            return None
+        return random.choice(replicas)  # noqa: S311
+
+    def db_for_write(self, model, **hints):
+        state = request_state.get()
+        if state is not None:
+            state.wrote = True
+        # Not None: Django would then save an instance read from a replica
+        # back to its _state.db.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if {obj1._state.db, obj2._state.db} <= databases:  # noqa: SLF001
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
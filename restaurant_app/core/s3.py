@@ -0,0 +1,21 @@
+"""Storages on S3, for the production settings; they need django-storages."""
+
+from storages.backends.s3 import S3ManifestStaticStorage
+
+from restaurant_app.core.staticfiles import CompressedManifestFilesMixin
+from restaurant_app.core.staticfiles import cache_control
+
+
+class StaticS3Storage(CompressedManifestFilesMixin, S3ManifestStaticStorage):
+    """
+    ``restaurant_app.core.staticfiles`` on S3.
+
+    Hashed files are cached for a year, everything else for an hour.
+    django-storages sets ``Content-Type`` and ``Content-Encoding`` for the
+    ``.gz`` and ``.br`` variants from their names.
+    """
+
+    def get_object_parameters(self, name):
+        params = super().get_object_parameters(name)
+        params["CacheControl"] = cache_control(name)
+        return params
@@ -0,0 +1,68 @@
+"""
+Session engine on the default cache (Redis in production).
+
+Use with ``SESSION_ENGINE = "restaurant_app.core.sessions"``. Compared to
+``django.contrib.sessions.backends.cache``:
+
+* each process keeps what it last read or wrote for ``SESSION_LOCAL_CACHE_TTL``
+  seconds, so a page that fans out into parallel requests reads the session
+  from Redis once per process;
+* a session is only written back when its contents actually changed, not
+  whenever something assigned to it.
+
+Another process may serve a session that was changed or deleted elsewhere for
+up to ``SESSION_LOCAL_CACHE_TTL`` seconds; set it to 0 to skip the local copy.
+``manage.py migrate_sessions_to_cache`` moves sessions from the database.
+"""
+
+from django.conf import settings
+from django.contrib.sessions.backends.cache import SessionStore as CacheSessionStore
+
+from restaurant_app.core.cache import LocalCache
+
+_local_sessions = LocalCache(
+    max_size=settings.SESSION_LOCAL_CACHE_SIZE,
+    ttl=settings.SESSION_LOCAL_CACHE_TTL,
+)
+
+
+class SessionStore(CacheSessionStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # The session as last read or written, to tell whether it changed.
+        self._stored: bytes | None = None
+
+    def load(self):
+        stored = _local_sessions.get(self.cache_key)
+        if stored is not None:
+            self._stored = stored
+            return self.serializer().loads(stored)
+        session_data = super().load()
+        if self.session_key is not None:
+            self._remember(session_data)
+        return session_data
+
+    def save(self, must_create=False):  # noqa: FBT002
+        if self.session_key is None:
+            return self.create()
+        if (
+            not must_create
+            and not settings.SESSION_SAVE_EVERY_REQUEST
+            and self._stored is not None
+            and self.serializer().dumps(dict(self.items())) == self._stored
+        ):
+            return None
+        super().save(must_create=must_create)
+        self._remember(dict(self.items()))
+        return None
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            session_key = self.session_key
+        super().delete(session_key)
+        if session_key is not None:
+            _local_sessions.delete(self.cache_key_prefix + session_key)
+
+    def _remember(self, session_data: dict) -> None:
+        self._stored = self.serializer().dumps(session_data)
+        _local_sessions.set(self.cache_key, self._stored)
@@ -0,0 +1,119 @@
+"""
+Static files with content-hashed names and precompressed variants.
+
+``collectstatic`` with a storage using ``CompressedManifestFilesMixin`` stores,
+besides each file, a copy named after its content
+(``css/project.0123456789ab.css``, which ``{% static %}`` links to) and, for
+text formats, gzip and brotli versions of that copy (``….css.gz``,
+``….css.br``) for servers and CDNs that pick one by ``Accept-Encoding``. Since
+a hashed name changes with the content, those files can be cached for a year
+without revalidation; see ``cache_control()``.
+
+The manifest from the last run lists the hashed files already stored, so files
+that haven't changed aren't uploaded, deleted or even looked up again, and only
+new ones are compressed. ``CompressedManifestStaticFilesStorage`` keeps them on
+the local filesystem, as ``restaurant_app.core.s3.StaticS3Storage`` does on S3.
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import re
+
+from django.contrib.staticfiles.storage import ManifestFilesMixin
+from django.contrib.staticfiles.storage import StaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# How HashedFilesMixin.hashed_name() names files: the first 12 hex digits of
+# the content's MD5 before the extension, if any.
+HASHED_NAME = re.compile(r"\.[0-9a-f]{12}(\.[^./]+)?$")
+# Text formats; images and fonts are compressed already.
+COMPRESSIBLE = (".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".xml")
+COMPRESSORS = {
+    ".gz": functools.partial(gzip.compress, compresslevel=9, mtime=0),
+}
+if brotli is not None:
+    COMPRESSORS[".br"] = functools.partial(brotli.compress, quality=11)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+# For the unhashed copies, which are replaced in place.
+REVALIDATE = "public, max-age=3600, must-revalidate"
+
+
+def is_hashed(name: str) -> bool:
+    name = name.removesuffix(".br").removesuffix(".gz")
+    return HASHED_NAME.search(name) is not None
+
+
+def cache_control(name: str) -> str:
+    """The ``Cache-Control`` header for the stored file ``name``."""
+    return IMMUTABLE if is_hashed(name) else REVALIDATE
+
+
+class CompressedManifestFilesMixin(ManifestFilesMixin):
+    # Variants that don't save at least 5% aren't worth a request.
+    max_compression_ratio = 0.95
+
+    def __init__(self, *args, **kwargs):
+        # The previous manifest's paths and the hashed names in it, while
+        # post-processing. The content of those files is whatever their name
+        # says it is, so they are left alone.
+        self.stored_files: dict[str, str] = {}
+        self.stored: frozenset[str] = frozenset()
+        super().__init__(*args, **kwargs)
+
+    def post_process(self, paths, dry_run=False, **options):  # noqa: FBT002
+        if not dry_run:
+            self.stored_files, _ = self.load_manifest()  # type: ignore[assignment]
+            self.stored = frozenset(self.stored_files.values())
+        try:
+            yield from super().post_process(paths, dry_run, **options)
+        finally:
+            self.stored_files = {}
+            self.stored = frozenset()
+
+    def save_manifest(self):
+        if self.hashed_files == self.stored_files:
+            return
+        # Before the manifest, which marks the files as stored.
+        for name in sorted(set(self.hashed_files.values())):
+            if name not in self.stored and name.endswith(COMPRESSIBLE):
+                self.compress(name)
+        super().save_manifest()
+
+    def compress(self, name: str) -> None:
+        with self.open(name) as original:  # type: ignore[attr-defined]
+            content = original.read()
+        for suffix, compress in COMPRESSORS.items():
+            compressed = compress(content)
+            if len(compressed) > len(content) * self.max_compression_ratio:
+                continue
+            if self.exists(name + suffix):
+                self.delete(name + suffix)
+            self._save(name + suffix, ContentFile(compressed))
+
+    def exists(self, name):
+        return name in self.stored or super().exists(name)  # type: ignore[misc]
+
+    def delete(self, name):
+        # Only ever deleted to be saved again, with the same content.
+        if name not in self.stored:
+            super().delete(name)  # type: ignore[misc]
+
+    def _save(self, name, content):
+        if name in self.stored:
+            return name
+        return super()._save(name, content)  # type: ignore[misc]
+
+
+class CompressedManifestStaticFilesStorage(  # type: ignore[misc]
+    CompressedManifestFilesMixin,
+    StaticFilesStorage,
+):
+    pass
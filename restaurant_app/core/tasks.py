@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+import smtplib
+from typing import Any
+
+from celery.utils.time import get_exponential_backoff_interval
+from django.core.mail import get_connection
+
+from config.celery_app import app
+from restaurant_app.core.mail import message_from_dict
+
+try:
+    from anymail.exceptions import AnymailAPIError
+    from anymail.exceptions import AnymailRecipientsRefused
+except ImportError:  # pragma: no cover
+    AnymailAPIError = AnymailRecipientsRefused = None
+
+logger = logging.getLogger(__name__)
+
+# Errors that may pass: the mail server or the API being unreachable, slow or
+# throttling us. A refused recipient stays refused.
+RETRY_FOR: tuple[type[Exception], ...] = (smtplib.SMTPException, OSError)
+NOT_RETRIED: tuple[type[Exception], ...] = (smtplib.SMTPRecipientsRefused,)
+if AnymailAPIError is not None:
+    RETRY_FOR += (AnymailAPIError,)
+    NOT_RETRIED += (AnymailRecipientsRefused,)
+# Seconds: retries wait up to 2, 4, 8... with full jitter, capped at 10 minutes.
+RETRY_BACKOFF = 2
+RETRY_BACKOFF_MAX = 10 * 60
+
+
+@app.task(bind=True, max_retries=8)
+def send_messages(self, messages: list[dict[str, Any]]) -> int:
+    """
+    Send ``messages``, from ``restaurant_app.core.mail.message_to_dict()``,
+    over one backend connection.
+
+    On an error in ``RETRY_FOR`` the task is retried, with exponential
+    backoff, for the messages that weren't sent yet. Messages whose recipients
+    are all refused are logged and dropped.
+    """
+    sent = 0
+    try:
+        with get_connection() as connection:
+            for data in messages:
+                try:
+                    connection.send_messages([message_from_dict(data)])
+                except NOT_RETRIED:
+                    logger.exception("Mail to %s refused", data["to"])
+                sent += 1
+    except RETRY_FOR as exc:
+        countdown = get_exponential_backoff_interval(
+            factor=RETRY_BACKOFF,
+            retries=self.request.retries,
+            maximum=RETRY_BACKOFF_MAX,
+            full_jitter=True,
+        )
+        raise self.retry(
+            args=[messages[sent:]],
+            exc=exc,
+            countdown=countdown,
+        ) from exc
+    return sent
@@ -0,0 +1,105 @@
+"""
+Compile the templates before the first request needs them.
+
+Django's cached loader compiles a template the first time it is used and keeps
+it for the life of the process, so the first render of each page after a
+deploy pays for reading and parsing every template it extends, includes and
+renders widgets with (``FORM_RENDERER`` renders form widgets through the
+template engine too). ``preload_templates()`` loads every template under the
+``TEMPLATES`` ``DIRS`` and the ``templates`` directory of the apps in
+``TEMPLATE_PRELOAD_APPS`` into that cache up front.
+
+``config.wsgi`` and ``config.asgi`` call it when ``TEMPLATE_PRELOAD`` is set,
+so with gunicorn's ``--preload`` it runs once in the master and the workers
+fork with the compiled templates; ``manage.py preload_templates`` runs it by
+hand and reports what it found.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.template import TemplateDoesNotExist
+from django.template import TemplateSyntaxError
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.template import Engine
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = frozenset({".html", ".txt"})
+
+
+@dataclass
+class PreloadResult:
+    loaded: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+def template_dirs(engine: Engine) -> list[Path]:
+    """The directories to preload, most specific first, like the loaders."""
+    return [
+        *(Path(directory) for directory in engine.dirs),
+        *(
+            Path(apps.get_app_config(label).path) / "templates"
+            for label in settings.TEMPLATE_PRELOAD_APPS
+        ),
+    ]
+
+
+def template_names(engine: Engine) -> Iterator[str]:
+    seen = set()
+    for directory in template_dirs(engine):
+        for path in sorted(directory.rglob("*")):
+            if path.suffix not in TEMPLATE_SUFFIXES or not path.is_file():
+                continue
+            name = path.relative_to(directory).as_posix()
+            # An earlier directory overrides it; that one is what gets served.
+            if name not in seen:
+                seen.add(name)
+                yield name
+
+
+def preload_templates() -> PreloadResult:
+    """
+    Load every template into the engines' cached loaders.
+
+    Templates that don't compile are left out and reported rather than raised:
+    apps ship templates for optional features (allauth's providers, say) that
+    use tag libraries this project doesn't install, and they fail the same
+    way when rendered.
+    """
+    result = PreloadResult()
+    started = time.perf_counter()
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name in template_names(backend.engine):
+            try:
+                backend.engine.get_template(name)
+            except (TemplateSyntaxError, TemplateDoesNotExist) as exc:
+                # The first line; unknown tag libraries go on to list the
+                # known ones.
+                result.failed[name] = str(exc).partition("\n")[0]
+            else:
+                result.loaded += 1
+    result.elapsed = time.perf_counter() - started
+    logger.info(
+        "Preloaded %d templates in %.0f ms, %d failed to compile",
+        result.loaded,
+        result.elapsed * 1000,
+        len(result.failed),
+    )
+    return result
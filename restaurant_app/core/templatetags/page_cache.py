@@ -0,0 +1,48 @@
+from django import template
+from django.conf import settings
+from django.core.cache import cache
+
+from restaurant_app.core.pages import fragment_key
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, name: str, vary_on: list):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+
+    def render(self, context):
+        key = fragment_key(self.name, *(var.resolve(context) for var in self.vary_on))
+        fragment = cache.get(key)
+        if fragment is None:
+            fragment = self.nodelist.render(context)
+            cache.set(key, fragment, settings.PAGE_CACHE_TIMEOUT)
+        return fragment
+
+
+@register.tag
+def fragment_cache(parser, token):
+    """
+    Cache the enclosed template for ``PAGE_CACHE_TIMEOUT`` seconds::
+
+        {% fragment_cache "navbar" request.user.pk request.user.updated %}
+          ...
+        {% endfragment_cache %}
+
+    Keyed on the name, the values after it and the language, and dropped with
+    the rest of the page cache (see ``restaurant_app.core.pages``).
+    """
+    nodelist = parser.parse(("endfragment_cache",))
+    parser.delete_first_token()
+    bits = token.split_contents()
+    if len(bits) < 2:  # noqa: PLR2004
+        msg = f"'{bits[0]}' tag requires a fragment name."
+        raise template.TemplateSyntaxError(msg)
+    name = bits[1].strip("\"'")
+    return FragmentCacheNode(
+        nodelist,
+        name,
+        [parser.compile_filter(b) for b in bits[2:]],
+    )
@@ -0,0 +1,39 @@
+from restaurant_app.core.cache import LocalCache
+
+
+class TestLocalCache:
+    def test_lru(self):
+        local = LocalCache(max_size=2, ttl=60)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        assert local.get("a") == 1
+        assert local.get("b") is None
+        assert local.get("c") == 3  # noqa: PLR2004
+
+    def test_expiry(self, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr("restaurant_app.core.cache.time.monotonic", lambda: now)
+        local = LocalCache(max_size=10, ttl=5)
+        local.set("a", 1)
+
+        now += 4.9
+        assert local.get("a") == 1
+        now += 0.1
+        assert local.get("a", "missing") == "missing"
+
+    def test_disabled(self):
+        local = LocalCache(max_size=10, ttl=0)
+        local.set("a", 1)
+
+        assert local.get("a") is None
+
+    def test_delete(self):
+        local = LocalCache(max_size=10, ttl=60)
+        local.set("a", 1)
+        local.delete("a")
+        local.delete("missing")
+
+        assert local.get("a") is None
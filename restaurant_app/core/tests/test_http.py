@@ -0,0 +1,63 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.messages import constants
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.urls import reverse
+
+from restaurant_app.core.http import page_etag
+from restaurant_app.core.http import release_version
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _release_version():
+    release_version.cache_clear()
+    yield
+    release_version.cache_clear()
+
+
+def test_release_version(settings):
+    settings.RELEASE_VERSION = ""
+    digest = release_version()
+    release_version.cache_clear()
+    settings.RELEASE_VERSION = "abc123"
+
+    assert len(digest) == 16  # noqa: PLR2004
+    assert release_version() == "abc123"
+
+
+class TestConditionalPages:
+    def test_not_modified(self, client, db):
+        response = client.get(reverse("home"))
+        assert response["Cache-Control"] == "private, no-cache"
+
+        response = client.get(reverse("home"), HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_per_user(self, client, user: User):
+        anonymous = client.get(reverse("home"))["ETag"]
+        client.force_login(user)
+
+        response = client.get(reverse("home"), HTTP_IF_NONE_MATCH=anonymous)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_new_release(self, client, db, settings):
+        etag = client.get(reverse("about"))["ETag"]
+        settings.RELEASE_VERSION = "next"
+        release_version.cache_clear()
+
+        response = client.get(reverse("about"), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_pending_messages(self, rf, user: User):
+        request = rf.get("/")
+        request.user = user
+        request.session = {}
+        request._messages = FallbackStorage(request)  # noqa: SLF001
+        request._messages.add(constants.INFO, "Saved.")  # noqa: SLF001
+
+        assert page_etag(request) is None
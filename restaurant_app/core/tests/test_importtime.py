@@ -0,0 +1,38 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from restaurant_app.core.importtime import parse
+from restaurant_app.core.importtime import walk
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     redis.exceptions
+import time:      2000 |       2120 |   redis
+import time:       300 |       2420 | restaurant_app.kitchen.brokers
+import time:        50 |         50 | restaurant_app.kitchen
+Warning: not an import line
+"""
+
+
+def test_parse():
+    brokers, kitchen = parse(OUTPUT)
+
+    assert brokers.name == "restaurant_app.kitchen.brokers"
+    assert (brokers.self_us, brokers.cumulative_us) == (300, 2420)
+    assert brokers.in_project
+    (redis,) = brokers.children
+    assert redis.name == "redis"
+    assert not redis.in_project
+    assert [child.name for child in redis.children] == ["redis.exceptions"]
+    assert kitchen.children == []
+    assert len(list(walk([brokers, kitchen]))) == 4  # noqa: PLR2004
+
+
+def test_import_report():
+    out = StringIO()
+    call_command("import_report", "--no-urlconf", "--limit", "3", stdout=out)
+
+    lines = out.getvalue().splitlines()
+    assert "modules imported in" in lines[0]
+    assert any("restaurant_app." in line for line in lines[2:])
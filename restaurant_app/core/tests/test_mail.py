@@ -0,0 +1,141 @@
+import smtplib
+
+import pytest
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import transaction
+
+from restaurant_app.core.mail import message_from_dict
+from restaurant_app.core.mail import message_to_dict
+from restaurant_app.core.mail import send_later
+
+
+class CountingBackend(EmailBackend):
+    opened = 0
+
+    def open(self):
+        CountingBackend.opened += 1
+        return super().open()
+
+
+class FlakyBackend(EmailBackend):
+    """Drops the connection on the second message, once."""
+
+    failed = False
+
+    def send_messages(self, messages):
+        if len(mail.outbox) == 1 and not FlakyBackend.failed:
+            FlakyBackend.failed = True
+            raise smtplib.SMTPServerDisconnected
+        if messages[0].to == ["refused@example.com"]:
+            raise smtplib.SMTPRecipientsRefused({})
+        return super().send_messages(messages)
+
+
+def _message(to="cook@example.com") -> EmailMessage:
+    return EmailMessage("Order ready", "Table 4", "noreply@example.com", [to])
+
+
+def test_message_round_trip():
+    message = EmailMultiAlternatives(
+        "Order ready",
+        "Table 4",
+        "noreply@example.com",
+        ["cook@example.com"],
+        bcc=["manager@example.com"],
+        headers={"X-Order": "42"},
+        attachments=[("ticket.pdf", b"%PDF\x00", "application/pdf")],
+    )
+    message.attach_alternative("<p>Table 4</p>", "text/html")
+
+    restored = message_from_dict(message_to_dict(message))
+
+    assert (restored.subject, restored.body) == ("Order ready", "Table 4")
+    assert restored.alternatives == [("<p>Table 4</p>", "text/html")]
+    assert restored.attachments == message.attachments
+    assert restored.recipients() == message.recipients()
+    assert restored.extra_headers == {"X-Order": "42"}
+
+
+@pytest.mark.django_db
+def test_send_later_batches(settings, django_capture_on_commit_callbacks):
+    settings.EMAIL_BACKEND = "restaurant_app.core.tests.test_mail.CountingBackend"
+    settings.EMAIL_BATCH_SIZE = 2
+    CountingBackend.opened = 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        send_later(*(_message() for _ in range(3)))
+
+    assert len(mail.outbox) == 3  # noqa: PLR2004
+    assert CountingBackend.opened == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_send_later_retries_unsent_messages(
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    settings.EMAIL_BACKEND = "restaurant_app.core.tests.test_mail.FlakyBackend"
+    FlakyBackend.failed = False
+
+    with django_capture_on_commit_callbacks(execute=True):
+        send_later(
+            _message("first@example.com"),
+            _message("refused@example.com"),
+            _message("last@example.com"),
+        )
+
+    assert FlakyBackend.failed
+    assert [message.to for message in mail.outbox] == [
+        ["first@example.com"],
+        ["last@example.com"],
+    ]
+
+
+@pytest.mark.django_db
+def test_send_later_waits_for_commit(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        send_later(_message())
+
+        assert not mail.outbox
+
+    assert len(callbacks) == 1
+    assert len(mail.outbox) == 1
+
+
+@pytest.mark.django_db
+def test_send_later_batches_a_transaction(
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    settings.EMAIL_BACKEND = "restaurant_app.core.tests.test_mail.CountingBackend"
+    CountingBackend.opened = 0
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        for number in range(3):
+            send_later(_message(f"cook{number}@example.com"))
+
+    assert len(callbacks) == 1
+    assert len(mail.outbox) == 3  # noqa: PLR2004
+    assert CountingBackend.opened == 1
+
+
+@pytest.mark.django_db
+def test_send_later_drops_rolled_back_savepoint(django_capture_on_commit_callbacks):
+    @transaction.atomic
+    def send_then_fail():
+        send_later(_message("rolled-back@example.com"))
+        raise RuntimeError
+
+    with django_capture_on_commit_callbacks(execute=True):
+        send_later(_message("before@example.com"))
+        with pytest.raises(RuntimeError):
+            send_then_fail()
+        send_later(_message("after@example.com"))
+
+    assert [message.to for message in mail.outbox] == [
+        ["before@example.com"],
+        ["after@example.com"],
+    ]
@@ -0,0 +1,170 @@
+import logging
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.template.loader import render_to_string
+from django.urls import reverse
+
+from restaurant_app.core import instrumentation
+from restaurant_app.users.models import User
+
+_MISSING = object()
+
+
+class ClientCache(LocMemCache):
+    """Reads take a ``client``, like django-redis's, and async ones are native."""
+
+    def get(self, key, default=None, version=None, client=None):
+        return super().get(key, default, version)
+
+    def get_many(self, keys, version=None, client=None):
+        return super().get_many(keys, version)
+
+    async def aget(self, key, default=None, version=None, client=None):
+        return LocMemCache.get(self, key, default, version)
+
+    async def aget_many(self, keys, version=None, client=None):
+        values = {key: LocMemCache.get(self, key, _MISSING, version) for key in keys}
+        return {key: value for key, value in values.items() if value is not _MISSING}
+
+
+def _timings(response) -> dict[str, str]:
+    return {
+        entry.split(";", 1)[0]: entry
+        for entry in response.headers["Server-Timing"].split(", ")
+    }
+
+
+class TestServerTimingMiddleware:
+    def test_header(self, user: User, client):
+        client.force_login(user)
+        response = client.get(reverse("users:detail", args=[user.username]))
+
+        assert response.status_code == HTTPStatus.OK
+        timings = _timings(response)
+        assert set(timings) == {"total", "db", "tpl", "cache"}
+        assert "0 queries" not in timings["db"]
+
+    def test_log_line(self, user: User, client, caplog):
+        client.force_login(user)
+        with caplog.at_level(logging.INFO, logger="restaurant_app.performance"):
+            client.get(reverse("users:detail", args=[user.username]))
+
+        (record,) = caplog.records
+        assert record.view == "users:detail"
+        assert record.status == HTTPStatus.OK
+        assert record.db_queries > 0
+        assert record.template_ms > 0
+
+    @pytest.mark.django_db
+    def test_not_sampled(self, client, settings, caplog):
+        settings.PERFORMANCE_SAMPLE_RATE = 0
+        with caplog.at_level(logging.INFO, logger="restaurant_app.performance"):
+            response = client.get(reverse("home"))
+
+        assert "Server-Timing" not in response.headers
+        assert not caplog.records
+
+
+class TestRateLimitMiddleware:
+    @pytest.fixture(autouse=True)
+    def _limits(self, settings):
+        settings.RATELIMIT_ENABLED = True
+        settings.RATELIMIT_PATHS = {"/accounts/": "2/minute"}
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_limited(self, client, db):
+        for _ in range(2):
+            assert client.get("/accounts/login/").status_code == HTTPStatus.OK
+
+        response = client.get("/accounts/signup/")
+
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "30"
+        assert b"Too Many Requests" in response.content
+
+    def test_per_client_ip(self, client, db):
+        for _ in range(2):
+            client.get("/accounts/login/")
+
+        response = client.get("/accounts/login/", REMOTE_ADDR="192.0.2.1")
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_other_paths(self, client, db):
+        for _ in range(3):
+            assert client.get("/").status_code == HTTPStatus.OK
+
+
+class TestInstrumentation:
+    def test_inactive_outside_requests(self):
+        assert instrumentation.current() is None
+
+    @pytest.mark.django_db
+    def test_db_queries(self):
+        metrics, token = instrumentation.start()
+        try:
+            User.objects.count()
+            list(User.objects.all())
+        finally:
+            instrumentation.stop(token)
+
+        assert metrics.db_queries == 2  # noqa: PLR2004
+        assert connection.execute_wrappers.count(instrumentation._execute_wrapper) == 1  # noqa: SLF001
+
+    def test_cache_hits_and_misses(self):
+        cache.set("instrumented", "value")
+        metrics, token = instrumentation.start()
+        try:
+            assert cache.get("instrumented") == "value"
+            assert cache.get("missing", "default") == "default"
+            assert cache.get_many(["instrumented", "missing"]) == {
+                "instrumented": "value",
+            }
+        finally:
+            instrumentation.stop(token)
+
+        assert (metrics.cache_hits, metrics.cache_misses) == (2, 2)
+
+    def test_cache_arguments_and_async_reads(self):
+        backend = instrumentation._instrument_cache(  # noqa: SLF001
+            ClientCache("client", {}),
+        )
+        backend.set("instrumented", "value")
+
+        async def read():
+            return (
+                await backend.aget("instrumented", client="replica"),
+                await backend.aget("missing", "default", client="replica"),
+                await backend.aget_many(["instrumented", "missing"], client="replica"),
+            )
+
+        metrics, token = instrumentation.start()
+        try:
+            assert backend.get("instrumented", client="replica") == "value"
+            assert backend.get_many(["missing"], client="replica") == {}
+            assert async_to_sync(read)() == (
+                "value",
+                "default",
+                {"instrumented": "value"},
+            )
+        finally:
+            instrumentation.stop(token)
+
+        assert (metrics.cache_hits, metrics.cache_misses) == (3, 3)
+
+    def test_nested_templates_counted_once(self):
+        metrics, token = instrumentation.start()
+        try:
+            render_to_string("pages/about.html")
+        finally:
+            instrumentation.stop(token)
+
+        assert metrics.template_time > 0
+        assert metrics.template_depth == 0
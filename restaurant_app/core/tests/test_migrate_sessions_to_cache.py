@@ -0,0 +1,76 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.sessions.backends.db import SessionStore as DatabaseSessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+
+from restaurant_app.core.sessions import SessionStore
+from restaurant_app.core.sessions import _local_sessions
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    cache.clear()
+    _local_sessions.clear()
+
+
+def _db_session(**data) -> str:
+    session = DatabaseSessionStore()
+    session.update(data)
+    session.create()
+    assert session.session_key is not None
+    return session.session_key
+
+
+def _migrate(*args) -> str:
+    out = StringIO()
+    call_command("migrate_sessions_to_cache", *args, "--batch-size=2", stdout=out)
+    return out.getvalue()
+
+
+class TestMigrateSessionsToCache:
+    def test_copies_live_sessions(self):
+        keys = [_db_session(user=str(n)) for n in range(3)]
+        expired = _db_session(user="expired")
+        Session.objects.filter(pk=expired).update(
+            expire_date=timezone.now() - timedelta(seconds=1),
+        )
+
+        output = _migrate()
+
+        assert output == "Copied 3 sessions; 0 were already in the cache.\n"
+        assert [SessionStore(key)["user"] for key in keys] == ["0", "1", "2"]
+        assert "user" not in SessionStore(expired)
+        assert Session.objects.count() == 4  # noqa: PLR2004
+
+    def test_keeps_sessions_already_in_the_cache(self):
+        key = _db_session(user="old")
+        # Changed since SESSION_ENGINE was switched.
+        cache.set(SessionStore.cache_key_prefix + key, {"user": "new"})
+
+        output = _migrate()
+
+        assert output == "Copied 0 sessions; 1 were already in the cache.\n"
+        assert SessionStore(key)["user"] == "new"
+
+    def test_dry_run(self):
+        key = _db_session(user="1")
+
+        output = _migrate("--dry-run")
+
+        assert output == "Would copy 1 sessions; 0 were already in the cache.\n"
+        assert "user" not in SessionStore(key)
+
+    def test_delete(self):
+        key = _db_session(user="1")
+
+        _migrate("--delete")
+
+        assert not Session.objects.exists()
+        assert SessionStore(key)["user"] == "1"
@@ -0,0 +1,94 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template import Context
+from django.template import Template
+from django.urls import reverse
+
+from restaurant_app.core import pages
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    pages._generation.clear()  # noqa: SLF001
+
+
+def _rendered(response) -> bool:
+    return bool(response.templates)
+
+
+class TestAnonymousPageCache:
+    def test_cached(self, client, db):
+        first = client.get(reverse("home"))
+        second = client.get(reverse("home"))
+
+        assert _rendered(first)
+        assert not _rendered(second)
+        assert second.content == first.content
+        assert second["Content-Type"] == first["Content-Type"]
+
+    def test_logged_in(self, client, user: User):
+        client.force_login(user)
+        client.get(reverse("home"))
+
+        assert _rendered(client.get(reverse("home")))
+
+    def test_query_string(self, client, db):
+        client.get(reverse("home"))
+
+        assert _rendered(client.get(reverse("home"), {"utm_source": "mail"}))
+
+    def test_language(self, client, db):
+        client.get(reverse("home"))
+
+        assert _rendered(client.get(reverse("home"), HTTP_ACCEPT_LANGUAGE="fr"))
+
+    def test_settings(self, client, db, settings):
+        client.get(reverse("home"))
+        settings.ACCOUNT_ALLOW_REGISTRATION = not settings.ACCOUNT_ALLOW_REGISTRATION
+
+        assert _rendered(client.get(reverse("home")))
+
+    def test_invalidate(self, client, db):
+        client.get(reverse("home"))
+
+        call_command("invalidate_page_cache", stdout=StringIO())
+
+        assert _rendered(client.get(reverse("home")))
+
+    def test_generation_evicted(self, client, db):
+        client.get(reverse("home"))
+        version = pages.page_cache_version()
+        pages.invalidate_pages()
+        cache.delete(pages.GENERATION_KEY)
+        pages._generation.clear()  # noqa: SLF001
+
+        assert pages.page_cache_version() != version
+
+
+class TestFragmentCache:
+    template = Template(
+        "{% load page_cache %}"
+        '{% fragment_cache "greeting" user_id %}Hi {{ name }}{% endfragment_cache %}',
+    )
+
+    def test_cached(self):
+        first = self.template.render(Context({"user_id": 1, "name": "Ann"}))
+        second = self.template.render(Context({"user_id": 1, "name": "Bob"}))
+
+        assert first == second == "Hi Ann"
+
+    def test_vary_on(self):
+        self.template.render(Context({"user_id": 1, "name": "Ann"}))
+
+        assert self.template.render(Context({"user_id": 2, "name": "Bob"})) == "Hi Bob"
+
+    def test_invalidate(self):
+        self.template.render(Context({"user_id": 1, "name": "Ann"}))
+        pages.invalidate_pages()
+
+        assert self.template.render(Context({"user_id": 1, "name": "Bob"})) == "Hi Bob"
@@ -0,0 +1,46 @@
+import pytest
+from django.db import connection
+
+from restaurant_app.core.paginator import EstimatedCountPaginator
+from restaurant_app.core.paginator import estimated_count
+from restaurant_app.users.models import User
+from restaurant_app.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def users(db):
+    UserFactory.create_batch(3)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users_user")
+    return User.objects.order_by("pk")
+
+
+def test_estimated_count(users):
+    assert estimated_count(users) == 3  # noqa: PLR2004
+
+
+def test_estimate_for_big_tables(users, django_assert_num_queries):
+    paginator = EstimatedCountPaginator(users, 2)
+    paginator.exact_below = 0
+    UserFactory()
+
+    with django_assert_num_queries(1) as queries:
+        assert paginator.count == 3  # noqa: PLR2004
+    assert "COUNT" not in queries.captured_queries[0]["sql"]
+
+
+def test_exact_for_small_tables(users):
+    UserFactory()
+
+    assert EstimatedCountPaginator(users, 2).count == 4  # noqa: PLR2004
+
+
+def test_exact_when_filtered(users):
+    paginator = EstimatedCountPaginator(users.filter(is_active=False), 2)
+    paginator.exact_below = 0
+
+    assert paginator.count == 0
+
+
+def test_lists():
+    assert EstimatedCountPaginator([1, 2, 3], 2).count == 3  # noqa: PLR2004
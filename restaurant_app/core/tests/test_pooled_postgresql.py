@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError
+from django.db import connection
+
+from restaurant_app.core import instrumentation
+from restaurant_app.core.pooled_postgresql.base import DatabaseWrapper
+from restaurant_app.core.pooled_postgresql.base import close_pools
+from restaurant_app.core.pooled_postgresql.base import pool_stats
+
+POOL_TIMEOUT = 0.2
+
+
+def _settings(**pool) -> dict:
+    return {
+        **connection.settings_dict,
+        "CONN_MAX_AGE": 0,
+        "OPTIONS": {**connection.settings_dict["OPTIONS"], "pool": pool},
+    }
+
+
+@pytest.fixture
+def pooled(db):
+    settings_dict = _settings(min_size=0, max_size=1, timeout=POOL_TIMEOUT)
+    wrappers = [DatabaseWrapper(settings_dict, alias="pooled") for _ in range(2)]
+    yield wrappers
+    for wrapper in wrappers:
+        wrapper.close()
+    close_pools()
+
+
+class TestPooledDatabaseWrapper:
+    def test_connections_are_reused(self, pooled):
+        first, _ = pooled
+        first.ensure_connection()
+        backend_pid = first.connection.info.backend_pid
+        first.close()
+
+        first.ensure_connection()
+
+        assert first.connection.info.backend_pid == backend_pid
+        assert pool_stats()["pooled"]["connections"] == 1
+
+    def test_checked_out_and_timeouts(self, pooled):
+        first, second = pooled
+        first.ensure_connection()
+
+        with pytest.raises(OperationalError):
+            second.ensure_connection()
+
+        stats = pool_stats()["pooled"]
+        assert stats["checked_out"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_ms"] >= POOL_TIMEOUT * 1000 * 0.9
+
+    def test_no_persistent_connections(self, db):
+        wrapper = DatabaseWrapper(
+            {**_settings(max_size=1), "CONN_MAX_AGE": 60},
+            alias="pooled",
+        )
+
+        with pytest.raises(ImproperlyConfigured):
+            _ = wrapper.pool
+
+    def test_without_pool(self, db):
+        wrapper = DatabaseWrapper(
+            {**connection.settings_dict, "OPTIONS": {}},
+            alias="default",
+        )
+
+        assert wrapper.pool is None
+
+    def test_stats_log(self, pooled, settings, monkeypatch, caplog):
+        pooled[0].ensure_connection()
+        settings.DATABASE_POOL_STATS_INTERVAL = 60
+        monkeypatch.setattr(instrumentation, "_next_pool_report", 0.0)
+
+        with caplog.at_level(logging.INFO, logger="restaurant_app.performance"):
+            instrumentation._report_pool_stats(sender=None)  # noqa: SLF001
+            instrumentation._report_pool_stats(sender=None)  # noqa: SLF001
+
+        (record,) = [
+            r for r in caplog.records if getattr(r, "db_pool", None) == "pooled"
+        ]
+        assert record.checked_out == 1
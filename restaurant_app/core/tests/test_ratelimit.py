@@ -0,0 +1,101 @@
+import os
+import socket
+import time
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import pytest
+from django.core.cache import cache
+
+from restaurant_app.core import ratelimit
+
+REDIS_CACHE = {
+    "BACKEND": "django_redis.cache.RedisCache",
+    "LOCATION": os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
+}
+
+
+def _redis_reachable() -> bool:
+    url = urlsplit(REDIS_CACHE["LOCATION"])
+    with socket.socket() as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex((url.hostname, url.port or 6379)) == 0
+
+
+@pytest.fixture
+def enabled(settings, monkeypatch):
+    settings.RATELIMIT_ENABLED = True
+    monkeypatch.setattr(ratelimit, "_unavailable_until", 0.0)
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(params=["locmem", "redis"])
+def limits(request, settings):
+    """The cache fallback, and the Lua script when Redis is running."""
+    if request.param == "redis":
+        if not _redis_reachable():
+            pytest.skip("Redis isn't running at REDIS_URL")
+        settings.CACHES = {"default": REDIS_CACHE}
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_parse_rate():
+    assert ratelimit.parse_rate("30/minute") == (30, 60)
+    assert ratelimit.parse_rate("5/s") == (5, 1)
+    assert ratelimit.parse_rate("1000/day") == (1000, 86400)
+
+
+@pytest.mark.usefixtures("enabled", "limits")
+def test_burst_then_wait():
+    assert [ratelimit.hit("key", 3, 60) for _ in range(3)] == [None] * 3
+
+    wait = ratelimit.hit("key", 3, 60)
+
+    # A request is let through every 20 seconds.
+    assert wait == pytest.approx(20, abs=0.1)
+    assert ratelimit.hit("other", 3, 60) is None
+
+
+@pytest.mark.usefixtures("enabled")
+def test_refills(monkeypatch):
+    now = 1_700_000_000.0
+    clock = SimpleNamespace(time=lambda: now, monotonic=time.monotonic)
+    monkeypatch.setattr(ratelimit, "time", clock)
+    for _ in range(2):
+        ratelimit.hit("key", 2, 60)
+    assert ratelimit.hit("key", 2, 60) == pytest.approx(30)
+
+    now += 29
+    assert ratelimit.hit("key", 2, 60) == pytest.approx(1)
+    now += 1
+    assert ratelimit.hit("key", 2, 60) is None
+    assert ratelimit.hit("key", 2, 60) == pytest.approx(30)
+
+
+def test_disabled(settings):
+    settings.RATELIMIT_ENABLED = False
+
+    assert [ratelimit.hit("key", 1, 60) for _ in range(3)] == [None] * 3
+
+
+@pytest.mark.usefixtures("enabled")
+def test_redis_unreachable(settings, caplog):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    settings.CACHES = {
+        "default": {
+            **REDIS_CACHE,
+            "LOCATION": f"redis://127.0.0.1:{port}/0",
+            "OPTIONS": {"IGNORE_EXCEPTIONS": True},
+        },
+    }
+
+    assert [ratelimit.hit("key", 1, 60) for _ in range(3)] == [None] * 3
+    # Tried once, then left alone for OUTAGE_SECONDS.
+    (record,) = caplog.records
+    assert "unreachable" in record.getMessage()
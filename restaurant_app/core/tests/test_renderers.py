@@ -0,0 +1,93 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from restaurant_app.core.api.parsers import FastJSONParser
+from restaurant_app.core.api.renderers import FastJSONRenderer
+from restaurant_app.users.models import User
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"price": Decimal("12.50"), "total": "12.50"},
+        {
+            "created": timezone.now(),
+            "naive": datetime.datetime(2024, 1, 2, 3, 4, 5),  # noqa: DTZ001
+        },
+        {"day": datetime.date(2024, 1, 2), "at": datetime.time(9, 30)},
+        {"id": uuid.uuid4(), "status": _("In progress")},
+        {"name": "Crème brûlée\u2028\u2029", "lines": ({"n": 1}, [2.5, None, True])},
+        {1: "non-string key"},
+    ],
+)
+def test_renders_like_json_renderer(data):
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_indented():
+    data = {"a": [1, 2]}
+    accepted = "application/json; indent=4"
+
+    assert FastJSONRenderer().render(data, accepted) == JSONRenderer().render(
+        data,
+        accepted,
+    )
+
+
+def test_none():
+    assert FastJSONRenderer().render(None) == b""
+
+
+class TestFastJSONParser:
+    def test_parse(self):
+        body = '{"name": "Crème", "lines": [{"item": 1}]}'.encode()
+
+        assert FastJSONParser().parse(io.BytesIO(body)) == {
+            "name": "Crème",
+            "lines": [{"item": 1}],
+        }
+
+    @pytest.mark.parametrize("body", [b"{", b"[NaN]"])
+    def test_invalid(self, body: bytes):
+        with pytest.raises(ParseError) as fast:
+            FastJSONParser().parse(io.BytesIO(body))
+        with pytest.raises(ParseError) as stdlib:
+            JSONParser().parse(io.BytesIO(body))
+
+        assert str(fast.value) == str(stdlib.value)
+
+    def test_other_encodings(self):
+        body = '{"name": "Crème"}'.encode("utf-16")
+
+        data = FastJSONParser().parse(
+            io.BytesIO(body),
+            parser_context={"encoding": "utf-16"},
+        )
+
+        assert data == {"name": "Crème"}
+
+
+def test_auth_token(user: User):
+    user.set_password("secret-password")
+    user.save()
+
+    response = APIClient().post(
+        "/api/auth-token/",
+        {"username": user.username, "password": "secret-password"},
+        format="json",
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response["Content-Type"] == "application/json"
+    assert response.json()["token"]
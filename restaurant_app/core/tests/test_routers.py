@@ -0,0 +1,139 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.db import connections
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from restaurant_app.core.routers import ReplicaRouter
+from restaurant_app.core.routers import RequestState
+from restaurant_app.core.routers import client_identity
+from restaurant_app.core.routers import request_state
+from restaurant_app.menu.models import Restaurant
+from restaurant_app.menu.tests.factories import RestaurantFactory
+from restaurant_app.orders.models import Order
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def replicas(settings):
+    settings.DATABASE_REPLICAS = ["replica_1"]
+    cache.clear()
+
+
+@pytest.fixture
+def state(rf: RequestFactory):
+    request = rf.get("/", headers={"Authorization": "Token abc"})
+    state = RequestState(request)
+    token = request_state.set(state)
+    yield state
+    request_state.reset(token)
+
+
+class TestReplicaRouter:
+    router = ReplicaRouter()
+
+    def test_outside_requests(self):
+        assert self.router.db_for_read(Restaurant) is None
+
+    def test_replica_apps(self, state):
+        assert self.router.db_for_read(Restaurant) == "replica_1"
+        assert self.router.db_for_read(User) == "replica_1"
+        assert self.router.db_for_read(Order) is None
+
+    def test_no_replicas(self, settings, state):
+        settings.DATABASE_REPLICAS = []
+
+        assert self.router.db_for_read(Restaurant) is None
+
+    def test_primary_after_write(self, state):
+        assert self.router.db_for_write(Restaurant) == "default"
+        assert self.router.db_for_read(Restaurant) is None
+
+    def test_primary_when_pinned(self, state):
+        state.pin()
+
+        assert self.router.db_for_read(Restaurant) is None
+
+    def test_no_migrations_on_replicas(self):
+        assert self.router.allow_migrate("replica_1", "menu") is False
+        assert self.router.allow_migrate("default", "menu") is None
+
+
+class TestClientIdentity:
+    def test_session_user(self, rf: RequestFactory):
+        request = rf.get("/", headers={"Authorization": "Token abc"})
+        request.session = {"_auth_user_id": "7"}  # type: ignore[assignment]
+
+        assert client_identity(request) == "user:7"
+
+    def test_authorization_header(self, rf: RequestFactory):
+        first = client_identity(rf.get("/", headers={"Authorization": "Token abc"}))
+        second = client_identity(rf.get("/", headers={"Authorization": "Token def"}))
+
+        assert first is not None
+        assert first.startswith("auth:")
+        assert first != second
+
+    def test_anonymous(self, rf: RequestFactory):
+        assert client_identity(rf.get("/")) is None
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica_1"])
+class TestReplicaReads:
+    def _reads(self, client, url) -> tuple[int, int]:
+        with (
+            CaptureQueriesContext(connections["default"]) as primary,
+            CaptureQueriesContext(connections["replica_1"]) as replica,
+        ):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        return len(primary), len(replica)
+
+    def test_reads_from_replica(self, client):
+        RestaurantFactory()
+        client.force_login(User.objects.create_user("reader"))
+
+        primary, replica = self._reads(client, reverse("api:restaurant-list"))
+
+        assert primary == 0
+        assert replica > 0
+
+    def test_writes_go_to_primary(self, client):
+        user = User.objects.create_user("writer")
+        client.force_login(user)
+
+        with CaptureQueriesContext(connections["replica_1"]) as replica:
+            response = client.patch(
+                reverse("api:user-detail", args=[user.username]),
+                {"name": "New name"},
+                content_type="application/json",
+            )
+
+        assert response.status_code == HTTPStatus.OK
+        assert replica.captured_queries
+        writes = ("INSERT", "UPDATE", "DELETE")
+        assert not [
+            query
+            for query in replica.captured_queries
+            if query["sql"].startswith(writes)
+        ]
+        user.refresh_from_db()
+        assert user.name == "New name"
+
+    def test_writer_reads_from_primary(self, client):
+        user = User.objects.create_user("writer")
+        client.force_login(user)
+
+        response = client.patch(
+            reverse("api:user-detail", args=[user.username]),
+            {"name": "New name"},
+            content_type="application/json",
+        )
+        assert response.status_code == HTTPStatus.OK
+        primary, replica = self._reads(client, reverse("api:restaurant-list"))
+
+        assert primary > 0
+        assert replica == 0
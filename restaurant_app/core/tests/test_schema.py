@@ -0,0 +1,67 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError
+from django.core.management import call_command
+from django.urls import reverse
+
+from restaurant_app.core.api.schema import generate_schema
+from restaurant_app.core.api.schema import stored_schema
+
+
+@pytest.fixture
+def schema_file(settings, tmp_path):
+    path = tmp_path / "openapi.yaml"
+    path.write_bytes(generate_schema())
+    settings.API_SCHEMA_FILE = str(path)
+    stored_schema.cache_clear()
+    yield path
+    stored_schema.cache_clear()
+
+
+def test_serves_stored_schema(admin_client, schema_file):
+    url = reverse("api-schema")
+
+    response = admin_client.get(url)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.content == schema_file.read_bytes()
+    assert response["Content-Type"].startswith("application/vnd.oai.openapi")
+    assert admin_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == (
+        HTTPStatus.NOT_MODIFIED
+    )
+    json = admin_client.get(url, {"format": "json"})
+    assert json["ETag"] != response["ETag"]
+    assert json.json()["paths"]
+
+
+def test_generates_schema_without_stored_one(admin_client, settings):
+    settings.API_SCHEMA_FILE = ""
+    stored_schema.cache_clear()
+
+    response = admin_client.get(reverse("api-schema"))
+
+    assert response.status_code == HTTPStatus.OK
+    assert "ETag" not in response
+
+
+def test_generates_schema_for_another_language(admin_client, schema_file):
+    schema_file.write_text("openapi: 3.0.3\n")
+
+    response = admin_client.get(reverse("api-schema"), {"lang": "fr"})
+
+    assert b"/api/users/" in response.content
+
+
+def test_openapi_schema_check(schema_file):
+    out = StringIO()
+    call_command("openapi_schema", "--check", stdout=out)
+    assert "up to date" in out.getvalue()
+
+    schema_file.write_text("openapi: 3.0.3\n")
+    with pytest.raises(CommandError, match="out of date"):
+        call_command("openapi_schema", "--check", stdout=out, stderr=StringIO())
+
+    call_command("openapi_schema", stdout=out)
+    assert schema_file.read_bytes() == generate_schema()
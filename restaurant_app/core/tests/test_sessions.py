@@ -0,0 +1,117 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from restaurant_app.core.sessions import SessionStore
+from restaurant_app.core.sessions import _local_sessions
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    cache.clear()
+    _local_sessions.clear()
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Keys written to the shared cache."""
+    written = []
+    for name in ["set", "add"]:
+        method = getattr(cache, name)
+
+        def spy(key, *args, method=method, **kwargs):
+            written.append(key)
+            return method(key, *args, **kwargs)
+
+        monkeypatch.setattr(cache, name, spy)
+    return written
+
+
+def _session(**data) -> SessionStore:
+    session = SessionStore()
+    session.update(data)
+    session.save()
+    return session
+
+
+class TestSessionStore:
+    def test_round_trip(self):
+        session = _session(cart=[1, 2])
+
+        assert SessionStore(session.session_key)["cart"] == [1, 2]
+
+    def test_local_copy(self):
+        session = _session(cart=[1])
+        cache.delete(session.cache_key)
+
+        assert SessionStore(session.session_key)["cart"] == [1]
+
+        _local_sessions.clear()
+        assert "cart" not in SessionStore(session.session_key)
+
+    def test_local_copy_is_not_shared(self):
+        session = _session(cart=[1])
+
+        SessionStore(session.session_key)["cart"].append(2)
+
+        assert SessionStore(session.session_key)["cart"] == [1]
+
+    def test_unchanged_session_is_not_written(self, writes):
+        session = _session(cart=[1])
+        writes.clear()
+
+        loaded = SessionStore(session.session_key)
+        loaded["cart"] = [1]
+        loaded.save()
+
+        assert writes == []
+        assert loaded.modified
+
+    def test_changed_session_is_written(self, writes):
+        session = _session(cart=[1])
+        writes.clear()
+
+        loaded = SessionStore(session.session_key)
+        loaded["cart"] = [1, 2]
+        loaded.save()
+
+        assert writes == [session.cache_key]
+        _local_sessions.clear()
+        assert SessionStore(session.session_key)["cart"] == [1, 2]
+
+    def test_save_every_request(self, settings, writes):
+        settings.SESSION_SAVE_EVERY_REQUEST = True
+        session = _session(cart=[1])
+        writes.clear()
+
+        SessionStore(session.session_key).save()
+
+        assert writes == [session.cache_key]
+
+    def test_delete(self):
+        session = _session(cart=[1])
+
+        key = session.session_key
+        assert key is not None
+
+        session.delete()
+
+        assert not SessionStore(key).exists(key)
+        assert "cart" not in SessionStore(key)
+
+    def test_cycle_key(self):
+        session = _session(cart=[1])
+        old_key = session.session_key
+
+        session.cycle_key()
+
+        assert "cart" not in SessionStore(old_key)
+        assert SessionStore(session.session_key)["cart"] == [1]
+
+    def test_login(self, client, user: User):
+        client.force_login(user)
+
+        response = client.get(reverse("users:detail", args=[user.username]))
+
+        assert response.status_code == 200  # noqa: PLR2004
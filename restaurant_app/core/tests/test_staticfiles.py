@@ -0,0 +1,103 @@
+import gzip
+import json
+from types import SimpleNamespace
+
+import brotli
+import pytest
+from django.core.management import call_command
+
+from restaurant_app.core.staticfiles import IMMUTABLE
+from restaurant_app.core.staticfiles import REVALIDATE
+from restaurant_app.core.staticfiles import cache_control
+
+CSS = "body { background: url('../images/logo.svg'); }\n" * 20
+SVG = "<svg xmlns='http://www.w3.org/2000/svg'><rect/></svg>\n" * 20
+
+
+@pytest.fixture
+def static(settings, tmp_path):
+    source = tmp_path / "source"
+    (source / "css").mkdir(parents=True)
+    (source / "images").mkdir()
+    (source / "css" / "project.css").write_text(CSS)
+    (source / "images" / "logo.svg").write_text(SVG)
+    (source / "images" / "photo.png").write_bytes(b"\x89PNG")
+    root = tmp_path / "static"
+    settings.STATIC_ROOT = str(root)
+    settings.STATICFILES_DIRS = [str(source)]
+    settings.STATICFILES_FINDERS = [
+        "django.contrib.staticfiles.finders.FileSystemFinder",
+    ]
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": (
+                "restaurant_app.core.staticfiles.CompressedManifestStaticFilesStorage"
+            ),
+        },
+    }
+
+    def run():
+        call_command("collectstatic", interactive=False, verbosity=0)
+        files = {
+            str(path.relative_to(root)): path.stat().st_mtime_ns
+            for path in root.rglob("*")
+            if path.is_file()
+        }
+        manifest = json.loads((root / "staticfiles.json").read_text())["paths"]
+        return files, manifest
+
+    return SimpleNamespace(run=run, source=source, root=root)
+
+
+def test_collectstatic(static):
+    files, manifest = static.run()
+
+    css = manifest["css/project.css"]
+    svg = manifest["images/logo.svg"]
+    assert css != "css/project.css"
+    assert svg in (static.root / css).read_text()
+    assert (
+        gzip.decompress((static.root / f"{css}.gz").read_bytes())
+        == (static.root / css).read_bytes()
+    )
+    assert brotli.decompress((static.root / f"{svg}.br").read_bytes()) == SVG.encode()
+    png = manifest["images/photo.png"]
+    assert f"{png}.gz" not in files
+
+
+def test_collectstatic_skips_stored_files(static):
+    files, manifest = static.run()
+
+    assert static.run() == (files, manifest)
+
+    (static.source / "images" / "logo.svg").write_text(SVG.replace("rect", "circle"))
+    changed, changed_manifest = static.run()
+
+    svg = changed_manifest["images/logo.svg"]
+    css = changed_manifest["css/project.css"]
+    assert svg != manifest["images/logo.svg"]
+    assert css != manifest["css/project.css"]
+    assert {f"{svg}.gz", f"{svg}.br", f"{css}.gz", f"{css}.br"} <= changed.keys()
+    # Files that didn't change are left alone.
+    png = manifest["images/photo.png"]
+    assert changed[png] == files[png]
+    old_css = manifest["css/project.css"]
+    assert changed[f"{old_css}.br"] == files[f"{old_css}.br"]
+
+
+def test_collectstatic_after_clear(static):
+    files, manifest = static.run()
+    call_command("collectstatic", interactive=False, verbosity=0, clear=True)
+
+    css = manifest["css/project.css"]
+    assert (static.root / f"{css}.br").exists()
+
+
+def test_cache_control():
+    assert cache_control("css/project.0123456789ab.css") == IMMUTABLE
+    assert cache_control("css/project.0123456789ab.css.br") == IMMUTABLE
+    assert cache_control("fonts/LICENSE.0123456789ab") == IMMUTABLE
+    assert cache_control("css/project.css") == REVALIDATE
+    assert cache_control("css/project.css.gz") == REVALIDATE
+    assert cache_control("staticfiles.json") == REVALIDATE
@@ -0,0 +1,55 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Engine
+
+from restaurant_app.core.template_preload import preload_templates
+from restaurant_app.core.template_preload import template_names
+
+
+@pytest.fixture
+def cached_loader():
+    (loader,) = Engine.get_default().template_loaders
+    loader.reset()
+    yield loader
+    loader.reset()
+
+
+def test_template_names():
+    names = list(template_names(Engine.get_default()))
+
+    assert "users/user_form.html" in names
+    assert "account/signup.html" in names
+    assert "bootstrap5/field.html" in names
+    assert "django/forms/widgets/input.html" in names
+    # Overridden by restaurant_app/templates, listed once.
+    assert names.count("allauth/layouts/base.html") == 1
+
+
+def test_preload_templates(cached_loader):
+    result = preload_templates()
+
+    assert result.loaded > 100  # noqa: PLR2004
+    assert "users/user_form.html" in cached_loader.get_template_cache
+    assert "account/signup.html" in cached_loader.get_template_cache
+
+
+def test_preload_templates_reports_failures(cached_loader, settings, tmp_path):
+    (tmp_path / "broken.html").write_text("{% load no_such_library %}")
+    settings.TEMPLATES = [
+        {**settings.TEMPLATES[0], "DIRS": [str(tmp_path)]},
+    ]
+
+    result = preload_templates()
+
+    assert "account/signup.html" not in result.failed
+    assert "no_such_library" in result.failed["broken.html"]
+    assert "\n" not in result.failed["broken.html"]
+
+
+def test_preload_templates_command(cached_loader):
+    out = StringIO()
+    call_command("preload_templates", stdout=out)
+
+    assert out.getvalue().startswith("Compiled ")
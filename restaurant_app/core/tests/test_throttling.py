@@ -0,0 +1,66 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _limits(settings):
+    settings.RATELIMIT_ENABLED = True
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def rates(settings):
+    def set_rates(**rates):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {
+                **settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+                **rates,
+            },
+        }
+
+    return set_rates
+
+
+def test_user(user: User, rates):
+    rates(user="2/minute")
+    client = APIClient()
+    client.force_authenticate(user)
+
+    statuses = [client.get("/api/users/me/").status_code for _ in range(3)]
+
+    assert statuses == [HTTPStatus.OK, HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS]
+
+
+def test_per_user(user: User, rates):
+    rates(user="1/minute")
+    client = APIClient()
+    client.force_authenticate(user)
+    client.get("/api/users/me/")
+    other = User.objects.create_user("other", "other@example.com", "password")
+    client.force_authenticate(other)
+
+    assert client.get("/api/users/me/").status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_auth_token(rates):
+    rates(auth="2/minute")
+    client = APIClient()
+    for _ in range(2):
+        client.post("/api/auth-token/", {"username": "cook", "password": "wrong"})
+
+    response = client.post(
+        "/api/auth-token/",
+        {"username": "cook", "password": "wrong"},
+    )
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "30"
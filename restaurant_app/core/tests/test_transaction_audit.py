@@ -0,0 +1,14 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+
+def test_transaction_audit():
+    out = StringIO()
+    call_command("transaction_audit", stdout=out)
+
+    lines = {line.split()[0]: line.split() for line in out.getvalue().splitlines()}
+    assert lines["URL"] == ["URL", "NAME", "VIEW", "READS", "WRITES"]
+    assert lines["/"][-2:] == ["autocommit", "atomic"]
+    assert lines["/api/orders/"][-2:] == ["autocommit", "autocommit"]
+    assert lines["/kitchen/<slug:slug>/tickets/"][-2:] == ["autocommit", "autocommit"]
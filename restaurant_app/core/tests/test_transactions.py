@@ -0,0 +1,159 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic import View
+from rest_framework.decorators import api_view
+from rest_framework.decorators import permission_classes
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+
+from restaurant_app.core.transactions import ATOMIC
+from restaurant_app.core.transactions import AUTOCOMMIT
+from restaurant_app.core.transactions import AtomicRequestsMixin
+from restaurant_app.core.transactions import NonAtomicRequestsMixin
+from restaurant_app.core.transactions import RequestTransaction
+from restaurant_app.core.transactions import atomic_requests
+from restaurant_app.core.transactions import request_transaction
+from restaurant_app.core.transactions import transaction_mode
+from restaurant_app.users.models import User
+
+
+def view(request):
+    # Depth of the atomic blocks the view runs in.
+    return HttpResponse(len(connection.atomic_blocks))
+
+
+async def async_view(request):
+    return HttpResponse()
+
+
+class RecordErrors:
+    seen: list[tuple[type, int]] = []
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        self.seen.append((type(exception), len(connection.atomic_blocks)))
+
+
+class TestTransactionMode:
+    def test_by_method(self):
+        assert transaction_mode(view, "GET") == AUTOCOMMIT
+        assert transaction_mode(view, "HEAD") == AUTOCOMMIT
+        assert transaction_mode(view, "POST") == ATOMIC
+        assert transaction_mode(view, "DELETE") == ATOMIC
+
+    def test_atomic_requests(self):
+        decorated = atomic_requests(lambda request: HttpResponse())
+
+        assert transaction_mode(decorated, "GET") == ATOMIC
+
+    def test_non_atomic_requests(self):
+        decorated = transaction.non_atomic_requests(lambda request: HttpResponse())
+
+        assert transaction_mode(decorated, "POST") == AUTOCOMMIT
+
+    def test_async_view(self):
+        assert transaction_mode(atomic_requests(async_view), "POST") == AUTOCOMMIT
+
+    def test_mixins(self):
+        class AtomicView(AtomicRequestsMixin, View):
+            pass
+
+        class NonAtomicView(NonAtomicRequestsMixin, View):
+            pass
+
+        assert transaction_mode(AtomicView.as_view(), "GET") == ATOMIC
+        assert transaction_mode(NonAtomicView.as_view(), "POST") == AUTOCOMMIT
+
+
+class TestRequestTransaction:
+    def _depth(self, request, view_func) -> int:
+        baseline = len(connection.atomic_blocks)
+        response = request_transaction(view_func)(request)
+        return int(response.content) - baseline
+
+    @pytest.mark.django_db
+    def test_read_runs_without_transaction(self, rf: RequestFactory):
+        request = rf.get("/")
+
+        assert self._depth(request, view) == 0
+        assert request.transaction_mode == AUTOCOMMIT  # type: ignore[attr-defined]
+
+    @pytest.mark.django_db
+    def test_write_runs_in_transaction(self, rf: RequestFactory):
+        request = rf.post("/")
+
+        assert self._depth(request, view) == 1
+        assert request.transaction_mode == ATOMIC  # type: ignore[attr-defined]
+
+    @pytest.mark.django_db
+    def test_api_error_rolls_back(self, rf: RequestFactory):
+        @api_view(["POST"])
+        @permission_classes([AllowAny])
+        def create_then_fail(request):
+            User.objects.create(username="rolled-back")
+            raise ValidationError
+
+        view_func = request_transaction(create_then_fail)  # type: ignore[arg-type]
+        response = view_func(rf.post("/"))
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert not User.objects.filter(username="rolled-back").exists()
+
+    def test_async_view_left_alone(self):
+        assert request_transaction(async_view) is async_view
+
+    def test_view_attributes(self):
+        wrapped = request_transaction(csrf_exempt(view))
+
+        assert wrapped.csrf_exempt is True
+        assert wrapped.__name__ == "view"
+        assert wrapped.__module__ == __name__
+
+
+class TestTransactionURLResolver:
+    def test_resolves_to_wrapped_view(self):
+        match = resolve(reverse("users:update"))
+
+        assert isinstance(match.func, RequestTransaction)
+        assert match.view_name == "users:update"
+        assert match._func_path == "restaurant_app.users.views.UserUpdateView"  # noqa: SLF001
+
+    def test_atomic_requests(self):
+        connection.settings_dict["ATOMIC_REQUESTS"] = True
+        try:
+            match = resolve(reverse("users:update"))
+        finally:
+            connection.settings_dict["ATOMIC_REQUESTS"] = False
+
+        assert not isinstance(match.func, RequestTransaction)
+
+    def test_errors_reach_middleware(self, client, user: User, settings, monkeypatch):
+        depths = []
+
+        def fail(*args, **kwargs):
+            depths.append(len(connection.atomic_blocks))
+            raise ZeroDivisionError
+
+        settings.MIDDLEWARE = [*settings.MIDDLEWARE, f"{__name__}.RecordErrors"]
+        monkeypatch.setattr("restaurant_app.users.views.UserUpdateView.post", fail)
+        client.force_login(user)
+        client.raise_request_exception = False
+
+        response = client.post(reverse("users:update"), {"name": "New"})
+
+        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        # Seen by process_exception, once the view's transaction rolled back.
+        assert RecordErrors.seen == [(ZeroDivisionError, depths[0] - 1)]
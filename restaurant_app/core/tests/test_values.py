@@ -0,0 +1,75 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from restaurant_app.core.api.values import ValuesSerializer
+from restaurant_app.orders.api.serializers import OrderSerializer
+from restaurant_app.orders.models import Order
+from restaurant_app.orders.tests.factories import OrderFactory
+from restaurant_app.users.api.serializers import UserSerializer
+from restaurant_app.users.models import User
+from restaurant_app.users.tests.factories import UserFactory
+
+
+class OrderSummarySerializer(serializers.ModelSerializer[Order]):
+    restaurant = serializers.CharField(source="restaurant.slug")
+
+    class Meta:
+        model = Order
+        fields = ["id", "url", "restaurant", "status", "total", "created"]
+        extra_kwargs = {"url": {"view_name": "api:order-detail"}}
+
+
+def _context(query: dict | None = None) -> dict:
+    return {"request": Request(APIRequestFactory().get("/", query))}
+
+
+def _same_output(serializer_class, queryset, context: dict) -> None:
+    values = ValuesSerializer(serializer_class, context=context)
+    expected = serializer_class(queryset, many=True, context=context).data
+
+    assert values.serialize(queryset.values(*values.columns)) == expected
+
+
+class TestValuesSerializer:
+    @pytest.mark.parametrize("username", ["plain", "a+b@c-d_e", "zoë"])
+    def test_matches_user_serializer(self, db, username: str):
+        UserFactory(username=username)
+
+        _same_output(UserSerializer, User.objects.all(), _context())
+
+    def test_decimals_dates_and_relations(self, db):
+        OrderFactory.create_batch(2)
+
+        _same_output(OrderSummarySerializer, Order.objects.all(), _context())
+
+    def test_sparse_fieldsets(self, db):
+        UserFactory()
+        context = _context({"fields": "url"})
+
+        assert ValuesSerializer(UserSerializer, context).columns == ["username"]
+        _same_output(UserSerializer, User.objects.all(), context)
+
+    def test_nested_serializers(self):
+        with pytest.raises(ImproperlyConfigured):
+            ValuesSerializer(OrderSerializer, _context())
+
+
+def test_user_list(user: User, client):
+    client.force_login(user)
+
+    response = client.get(reverse("api:user-list"))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["results"] == [
+        {
+            "username": user.username,
+            "name": user.name,
+            "url": f"http://testserver/api/users/{user.username}/",
+        },
+    ]
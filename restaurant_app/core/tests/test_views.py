@@ -0,0 +1,47 @@
+from django.http import HttpResponse
+from django.urls import resolve
+from django.urls import reverse
+
+from restaurant_app.core.views import lazy_view
+
+
+def hello(request, name):
+    return HttpResponse(f"Hello {name}")
+
+
+def test_lazy_function_view(rf):
+    view = lazy_view("restaurant_app.core.tests.test_views.hello")
+
+    response = view(rf.get("/"), name="kitchen")
+
+    assert response.content == b"Hello kitchen"
+    assert f"{view.__module__}.{view.__qualname__}" == hello.__module__ + ".hello"
+
+
+def test_lazy_class_based_view(rf):
+    view = lazy_view(
+        "django.views.generic.RedirectView",
+        url="/elsewhere/",
+        permanent=False,
+    )
+
+    response = view(rf.get("/"))
+
+    assert response.status_code == 302  # noqa: PLR2004
+    assert response.url == "/elsewhere/"
+
+
+def test_lazy_views_in_urlconf():
+    match = resolve(reverse("api-docs"))
+
+    assert match._func_path == "drf_spectacular.views.SpectacularSwaggerView"  # noqa: SLF001
+    assert getattr(resolve("/api/auth-token/").func, "csrf_exempt", False)
+
+
+def test_lazy_views_in_schema():
+    from drf_spectacular.generators import SchemaGenerator
+
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+
+    assert "/api/auth-token/" in schema["paths"]
+    assert "/api/schema/" in schema["paths"]
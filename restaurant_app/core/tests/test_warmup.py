@@ -0,0 +1,34 @@
+import pytest
+from django.db import connection
+from django.urls import clear_url_caches
+from django.urls import get_resolver
+
+from restaurant_app.core.pooled_postgresql.base import DatabaseWrapper
+from restaurant_app.core.pooled_postgresql.base import pool_stats
+from restaurant_app.core.warmup import warm_up
+
+
+@pytest.mark.django_db(transaction=True)
+def test_warm_up(settings, django_assert_num_queries):
+    clear_url_caches()
+    pooled = DatabaseWrapper(
+        {
+            **connection.settings_dict,
+            "CONN_MAX_AGE": 0,
+            "OPTIONS": {
+                **connection.settings_dict["OPTIONS"],
+                "pool": {"min_size": 0, "max_size": 1},
+            },
+        },
+        alias="pooled",
+    )
+    pooled.ensure_connection()
+    pooled.close()
+    assert pool_stats()["pooled"]["size"] == 1
+
+    with django_assert_num_queries(0):
+        warm_up()
+
+    assert settings.LANGUAGE_CODE in get_resolver()._reverse_dict  # noqa: SLF001
+    assert connection.connection is None
+    assert pool_stats() == {}
@@ -0,0 +1,141 @@
+"""
+Per-view request transactions, in place of ``ATOMIC_REQUESTS``.
+
+``TransactionURLResolver`` runs a view in a transaction on the default database
+when the request may change data (any method but GET, HEAD, OPTIONS and TRACE),
+and leaves reads in autocommit, where they cost no BEGIN and COMMIT and pages
+that never query don't take a database connection at all. Views can override
+that either way:
+
+* ``atomic_requests`` (or ``AtomicRequestsMixin``) for views that write on
+  every method, GETs included;
+* Django's ``transaction.non_atomic_requests`` (or ``NonAtomicRequestsMixin``)
+  for views that manage their own transactions.
+
+Async views always run in autocommit, as Django can't wrap them.
+``manage.py transaction_audit`` lists what every URL gets.
+
+Like ``ATOMIC_REQUESTS``, the transaction wraps the view itself, from the URL
+resolver: middleware, exception handling and template rendering stay outside
+it, as Django has them.
+"""
+
+import functools
+
+from asgiref.sync import iscoroutinefunction
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+from django.db import transaction
+from django.urls import URLResolver
+from django.urls.resolvers import RoutePattern
+from rest_framework.views import exception_handler
+
+ATOMIC = "atomic"
+AUTOCOMMIT = "autocommit"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+
+def atomic_requests(view):
+    """Run ``view`` in a transaction for every method, reads included."""
+    view.atomic_requests = True
+    return view
+
+
+def transaction_mode(view, method: str) -> str:
+    """``ATOMIC`` or ``AUTOCOMMIT``: how ``view`` runs for ``method`` requests."""
+    if iscoroutinefunction(view) or DEFAULT_DB_ALIAS in getattr(
+        view,
+        "_non_atomic_requests",
+        (),
+    ):
+        return AUTOCOMMIT
+    if getattr(view, "atomic_requests", False) or method not in SAFE_METHODS:
+        return ATOMIC
+    return AUTOCOMMIT
+
+
+class RequestTransaction:
+    """
+    ``view``, in a transaction when ``transaction_mode`` says so.
+
+    Stores the mode on ``request.transaction_mode``. Other attributes, such as
+    ``csrf_exempt``, are the view's.
+    """
+
+    def __init__(self, view):
+        self.view = view
+        # What ResolverMatch and Django's response checks report.
+        self.__module__ = view.__module__
+        self.__name__ = getattr(view, "__name__", type(view).__name__)
+        self.__qualname__ = getattr(view, "__qualname__", self.__name__)
+
+    def __call__(self, request, *args, **kwargs):
+        request.transaction_mode = transaction_mode(self.view, request.method)
+        if request.transaction_mode != ATOMIC:
+            return self.view(request, *args, **kwargs)
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            return self.view(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        if name == "view":
+            raise AttributeError(name)
+        return getattr(self.view, name)
+
+
+@functools.cache
+def request_transaction(view):
+    """``view`` wrapped in a ``RequestTransaction``, unless it's async."""
+    if iscoroutinefunction(view):
+        return view
+    return RequestTransaction(view)
+
+
+class TransactionURLResolver(URLResolver):
+    """
+    Resolves to the matched views wrapped in ``RequestTransaction``.
+
+    Left alone when ``ATOMIC_REQUESTS`` is on, as Django wraps them already.
+    """
+
+    def resolve(self, path):
+        match = super().resolve(path)
+        if not connections[DEFAULT_DB_ALIAS].settings_dict["ATOMIC_REQUESTS"]:
+            match.func = request_transaction(match.func)
+        return match
+
+
+def request_transactions(urlpatterns) -> TransactionURLResolver:
+    """All of ``urlpatterns``, under a ``TransactionURLResolver``."""
+    return TransactionURLResolver(RoutePattern("", is_endpoint=False), urlpatterns)
+
+
+class AtomicRequestsMixin:
+    """Class-based view counterpart of ``atomic_requests``."""
+
+    @classmethod
+    def as_view(cls, *args, **kwargs):
+        return atomic_requests(super().as_view(*args, **kwargs))  # type: ignore[misc]
+
+
+class NonAtomicRequestsMixin:
+    """Class-based view counterpart of ``transaction.non_atomic_requests``."""
+
+    @classmethod
+    def as_view(cls, *args, **kwargs):
+        view = super().as_view(*args, **kwargs)  # type: ignore[misc]
+        return transaction.non_atomic_requests(view)
+
+
+def api_exception_handler(exc, context):
+    """
+    DRF's exception handler, rolling back the request's transaction.
+
+    DRF only does this itself under ``ATOMIC_REQUESTS``; without it, an error
+    response would commit whatever the view wrote before raising.
+    """
+    response = exception_handler(exc, context)
+    request = context.get("request")
+    if response is not None and getattr(request, "transaction_mode", None) == ATOMIC:
+        transaction.set_rollback(True)
+    return response
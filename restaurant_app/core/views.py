@@ -0,0 +1,60 @@
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+
+
+class LazyView:
+    """
+    A view imported on its first request instead of with the URLconf.
+
+    See ``lazy_view()``. The attributes that DRF's schema generation (``cls``,
+    ``initkwargs``, ``actions``) and Django's middleware (``csrf_exempt``, the
+    transaction markers) look for on views are read from the real view,
+    importing it. ``view_class`` isn't: reversing any URL checks every view
+    for it.
+    """
+
+    delegated = frozenset(
+        {
+            "cls",
+            "initkwargs",
+            "actions",
+            "csrf_exempt",
+            "atomic_requests",
+            "_non_atomic_requests",
+        },
+    )
+
+    def __init__(self, path: str, initkwargs: dict):
+        self._path = path
+        self._initkwargs = initkwargs
+        # What ResolverMatch and transaction_audit report.
+        self.__module__, _, self.__qualname__ = path.rpartition(".")
+        self.__name__ = self.__qualname__
+
+    @cached_property
+    def view(self):
+        view = import_string(self._path)
+        if hasattr(view, "as_view"):
+            return view.as_view(**self._initkwargs)
+        return view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.view(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        if name in self.delegated:
+            return getattr(self.view, name)
+        raise AttributeError(name)
+
+
+def lazy_view(path: str, **initkwargs) -> LazyView:
+    """
+    A view imported on its first request instead of with the URLconf.
+
+    For views that are rarely used and expensive to import, so that management
+    commands, tests and worker startup (all of which load the URLconf) don't
+    pay for them. ``path`` is the dotted path of a view function or of a
+    class-based view, which ``initkwargs`` are passed to ``as_view()``. Only
+    for sync views.
+    """
+    return LazyView(path, initkwargs)
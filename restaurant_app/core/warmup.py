@@ -0,0 +1,73 @@
+"""
+Do the work Django leaves to the first requests, before there are any.
+
+``warm_up()`` imports the URLconf and every view, builds the resolvers'
+lookup tables, compiles their patterns and loads the translation catalog, for
+``LANGUAGE_CODE``, then loads the OpenAPI schema and renders it (see
+``restaurant_app.core.api.schema``), or, without a stored schema, generates it,
+which inspects every API view and serializer. ``config.gunicorn`` calls it
+in the master once the app is loaded (templates are compiled by then, see
+``restaurant_app.core.template_preload``), so the workers fork with all of it
+already in memory and share those pages with the master until they write to
+them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import close_caches
+from django.db import connections
+from django.urls import Resolver404
+from django.urls import get_resolver
+from django.urls import resolve
+from django.utils import translation
+
+from restaurant_app.core.pooled_postgresql.base import close_pools
+
+logger = logging.getLogger(__name__)
+
+# Matches no URL, so resolving it tries, and compiles, every pattern.
+UNMATCHED_PATH = "/__warm_up__/"
+
+
+def warm_url_resolvers() -> None:
+    # Both are kept per language; requests in others warm their own.
+    with translation.override(settings.LANGUAGE_CODE):
+        _ = get_resolver().reverse_dict
+        with contextlib.suppress(Resolver404):
+            resolve(UNMATCHED_PATH)
+
+
+def warm_schema() -> None:
+    if not apps.is_installed("drf_spectacular"):
+        return
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+    from drf_spectacular.renderers import OpenApiYamlRenderer
+
+    from restaurant_app.core.api.schema import generate_schema
+    from restaurant_app.core.api.schema import stored_schema
+
+    schema = stored_schema()
+    if schema is None:
+        generate_schema()
+        return
+    for renderer in (OpenApiYamlRenderer(), OpenApiJsonRenderer()):
+        schema.render(renderer)
+
+
+def warm_up() -> None:
+    started = time.perf_counter()
+    warm_url_resolvers()
+    warm_schema()
+    # Nothing forked may share the master's sockets. Closing a pooled
+    # connection only returns it to its pool, which would fork along with its
+    # open connections and worker threads.
+    connections.close_all()
+    close_pools()
+    close_caches()
+    logger.info("Warmed up in %.0f ms", (time.perf_counter() - started) * 1000)
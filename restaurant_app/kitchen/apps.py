@@ -0,0 +1,13 @@
+import contextlib
+
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class KitchenConfig(AppConfig):
+    name = "restaurant_app.kitchen"
+    verbose_name = _("Kitchen")
+
+    def ready(self):
+        with contextlib.suppress(ImportError):
+            import restaurant_app.kitchen.signals  # noqa: F401
@@ -0,0 +1,325 @@
+"""
+Event brokers behind the kitchen ticket feed.
+
+A broker keeps a short, append-only log per channel and fans new entries out to
+the subscribers in this process. Entry ids have the Redis stream format
+``<ms>-<seq>``; clients send the last one they saw back on reconnect
+(``Last-Event-ID``) and are caught up from the log before going live.
+
+``RedisBroker`` keeps the log in a Redis stream and runs one blocking reader per
+channel and process, however many connections subscribe to it.
+``InMemoryBroker`` does the same within a single process, for tests and local
+development.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import contextlib
+import functools
+import logging
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import cast
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Event:
+    id: str
+    data: str = ""
+    name: str = "message"
+
+
+class CursorExpired(Exception):  # noqa: N818
+    """Entries after the cursor have been trimmed from the log."""
+
+
+def parse_id(event_id: str) -> tuple[int, int]:
+    """``<ms>-<seq>`` as a comparable tuple; raises ``ValueError`` if malformed."""
+    ms, _, seq = event_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+@functools.cache
+def get_broker() -> Broker:
+    """The broker configured by ``KITCHEN_BROKER``, one per process."""
+    return import_string(settings.KITCHEN_BROKER)()
+
+
+class Subscription:
+    """One subscriber's buffer, fed from any thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.loop = loop
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def put(self, event: Event) -> None:
+        # RuntimeError: the subscriber's event loop is gone, it's unsubscribing.
+        with contextlib.suppress(RuntimeError):
+            self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: Event) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class Broker(abc.ABC):
+    def __init__(self, maxlen: int | None = None, buffer_size: int | None = None):
+        self.maxlen = maxlen or settings.KITCHEN_LOG_LENGTH
+        self.buffer_size = buffer_size or settings.KITCHEN_SUBSCRIBER_BUFFER
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def publish(self, channel: str, data: str) -> str:
+        """Append ``data`` to the channel's log; returns the new entry id."""
+        ...
+
+    @abc.abstractmethod
+    async def last_id(self, channel: str) -> str:
+        """Id of the newest entry in the channel's log, ``"0-0"`` if empty."""
+        ...
+
+    @abc.abstractmethod
+    async def since(self, channel: str, cursor: str) -> list[Event]:
+        """Entries after ``cursor``; raises ``CursorExpired`` if some are gone."""
+        ...
+
+    async def subscribe(
+        self,
+        channel: str,
+        cursor: str | None = None,
+        idle_timeout: float | None = None,
+    ) -> AsyncGenerator[Event | None, None]:
+        """
+        Yield the entries after ``cursor``, then new ones as they are published.
+
+        A ``"ready"`` event marks the switch to live entries; its id is the
+        position the subscriber is at. A ``"reset"`` event is sent instead when
+        the cursor has expired, and the subscriber should reload its state.
+        ``None`` is yielded after ``idle_timeout`` seconds without entries. The
+        iterator ends if the subscriber falls more than ``buffer_size`` entries
+        behind; reconnecting with the last id catches up from the log.
+        """
+        subscription = Subscription(asyncio.get_running_loop(), self.buffer_size)
+        # Subscribe before reading the log so that nothing published in between
+        # is missed; entries seen twice are skipped by id.
+        await self._attach(channel, subscription)
+        try:
+            ready = "ready"
+            position = await self.last_id(channel)
+            if cursor is not None:
+                try:
+                    for event in await self.since(channel, cursor):
+                        position = event.id
+                        yield event
+                except CursorExpired:
+                    ready = "reset"
+            yield Event(position, name=ready)
+
+            while not subscription.overflowed:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        idle_timeout,
+                    )
+                except TimeoutError:
+                    yield None
+                    continue
+                if parse_id(event.id) > parse_id(position):
+                    position = event.id
+                    yield event
+        finally:
+            await self._detach(channel, subscription)
+
+    def _dispatch(self, channel: str, event: Event) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.put(event)
+
+    async def _attach(self, channel: str, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+
+    async def _detach(self, channel: str, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(channel, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(channel, None)
+
+
+class InMemoryBroker(Broker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._logs: dict[str, deque[Event]] = {}
+        self._trimmed: dict[str, str] = {}
+        self._sequence = 0
+
+    def publish(self, channel: str, data: str) -> str:
+        with self._lock:
+            self._sequence += 1
+            event = Event(f"{self._sequence}-0", data, "ticket")
+            log = self._logs.setdefault(channel, deque())
+            log.append(event)
+            if len(log) > self.maxlen:
+                self._trimmed[channel] = log.popleft().id
+        self._dispatch(channel, event)
+        return event.id
+
+    async def last_id(self, channel: str) -> str:
+        with self._lock:
+            log = self._logs.get(channel)
+            return log[-1].id if log else "0-0"
+
+    async def since(self, channel: str, cursor: str) -> list[Event]:
+        after = parse_id(cursor)
+        with self._lock:
+            log = list(self._logs.get(channel, ()))
+            trimmed = self._trimmed.get(channel, "0-0")
+        last = log[-1].id if log else trimmed
+        # A cursor ahead of the log comes from before a restart.
+        if parse_id(trimmed) > after or parse_id(last) < after:
+            raise CursorExpired
+        return [event for event in log if parse_id(event.id) > after]
+
+
+class RedisBroker(Broker):
+    """Logs are Redis streams named ``kitchen:<channel>``, capped at ``maxlen``."""
+
+    def __init__(self, *args, url: str | None = None, **kwargs):
+        # redis is imported where it is used: every process loads this module
+        # through the order signals, and most never publish a ticket.
+        import redis
+
+        super().__init__(*args, **kwargs)
+        self.url = url or settings.REDIS_URL
+        self.block_ms = 5000
+        self.retry_delay = 1.0
+        self._client = redis.Redis.from_url(self.url)
+        # asyncio clients and reader tasks belong to the loop they were made in.
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._readers: dict[str, asyncio.Task] = {}
+
+    def key(self, channel: str) -> str:
+        return f"kitchen:{channel}"
+
+    def publish(self, channel: str, data: str) -> str:
+        event_id = cast(
+            "bytes",
+            self._client.xadd(
+                self.key(channel),
+                {"data": data},
+                maxlen=self.maxlen,
+                approximate=True,
+            ),
+        )
+        return event_id.decode()
+
+    async def last_id(self, channel: str) -> str:
+        entries = await self._aclient().xrevrange(self.key(channel), count=1)
+        return entries[0][0].decode() if entries else "0-0"
+
+    async def since(self, channel: str, cursor: str) -> list[Event]:
+        from redis import ResponseError
+
+        client = self._aclient()
+        after = parse_id(cursor)
+        try:
+            info = await client.xinfo_stream(self.key(channel))
+        except ResponseError:
+            # No stream: nothing was published yet, or Redis lost it since the
+            # cursor was handed out.
+            if after > (0, 0):
+                raise CursorExpired from None
+            return []
+        last = info["last-generated-id"].decode()
+        # max-deleted-entry-id needs Redis 7; older servers fall back to the
+        # first entry, which may expire a cursor that is still just valid.
+        trimmed = info.get("max-deleted-entry-id")
+        if trimmed is not None:
+            expired = parse_id(trimmed.decode()) > after
+        else:
+            first = info["first-entry"]
+            expired = first is not None and parse_id(first[0].decode()) > after
+        if expired or parse_id(last) < after:
+            raise CursorExpired
+        entries = await client.xrange(self.key(channel), min=f"({cursor}")
+        return [self._event(event_id, fields) for event_id, fields in entries]
+
+    async def _attach(self, channel: str, subscription: Subscription) -> None:
+        await super()._attach(channel, subscription)
+        reader = self._readers.get(channel)
+        if reader is None or reader.done():
+            start = await self.last_id(channel)
+            # Another subscriber may have started one while we waited.
+            if channel not in self._readers or self._readers[channel].done():
+                self._readers[channel] = asyncio.create_task(
+                    self._read(channel, start),
+                )
+
+    async def _detach(self, channel: str, subscription: Subscription) -> None:
+        await super()._detach(channel, subscription)
+        if channel not in self._subscriptions and channel in self._readers:
+            self._readers.pop(channel).cancel()
+
+    async def _read(self, channel: str, start: str) -> None:
+        from redis import ConnectionError as RedisConnectionError
+
+        client = self._aclient()
+        key = self.key(channel)
+        position = start
+        # Runs until cancelled by the last subscriber leaving: whatever goes
+        # wrong, the subscribers still attached must keep getting entries.
+        while True:
+            try:
+                response = await client.xread(
+                    {key: position},
+                    count=100,
+                    block=self.block_ms,
+                )
+            except RedisConnectionError:
+                logger.warning("Lost Redis connection reading %s, retrying", key)
+                await asyncio.sleep(self.retry_delay)
+                continue
+            except Exception:
+                logger.exception("Failed to read %s, retrying", key)
+                await asyncio.sleep(self.retry_delay)
+                continue
+            for _stream, entries in response:
+                for event_id, fields in entries:
+                    # Past it even if it's malformed, or it would be read again.
+                    position = event_id.decode()
+                    try:
+                        event = self._event(event_id, fields)
+                    except (KeyError, UnicodeDecodeError):
+                        logger.exception("Skipping malformed entry %s", position)
+                        continue
+                    self._dispatch(channel, event)
+
+    def _aclient(self):
+        from redis import asyncio as aioredis
+
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_clients:
+            self._async_clients[loop] = aioredis.Redis.from_url(self.url)
+        return self._async_clients[loop]
+
+    def _event(self, event_id: bytes, fields: dict) -> Event:
+        return Event(event_id.decode(), fields[b"data"].decode(), "ticket")
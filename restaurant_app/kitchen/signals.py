@@ -0,0 +1,15 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from restaurant_app.orders.models import Order
+
+from .tickets import publish_ticket
+
+
+@receiver(post_save, sender=Order)
+def order_saved(sender, instance, **kwargs):
+    # The order is already saved by then; a broker outage is logged, not raised.
+    transaction.on_commit(partial(publish_ticket, instance), robust=True)
@@ -0,0 +1,170 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+from redis import ResponseError
+
+from restaurant_app.kitchen.brokers import Event
+from restaurant_app.kitchen.brokers import InMemoryBroker
+from restaurant_app.kitchen.brokers import RedisBroker
+
+CHANNEL = "restaurant:1:tickets"
+
+
+def _run(coroutine_function):
+    return async_to_sync(coroutine_function)()
+
+
+class TestInMemoryBroker:
+    def test_live(self):
+        broker = InMemoryBroker()
+
+        async def scenario():
+            events = broker.subscribe(CHANNEL)
+            ready = await anext(events)
+            event_id = broker.publish(CHANNEL, "new")
+            event = await anext(events)
+            await events.aclose()
+            return ready, event_id, event
+
+        ready, event_id, event = _run(scenario)
+
+        assert ready == Event("0-0", name="ready")
+        assert event == Event(event_id, "new", "ticket")
+        assert not broker._subscriptions  # noqa: SLF001
+
+    def test_catch_up(self):
+        broker = InMemoryBroker()
+        cursor = broker.publish(CHANNEL, "a")
+        broker.publish(CHANNEL, "b")
+        last = broker.publish(CHANNEL, "c")
+
+        async def scenario():
+            events = broker.subscribe(CHANNEL, cursor)
+            received = [await anext(events) for _ in range(3)]
+            await events.aclose()
+            return received
+
+        b, c, ready = _run(scenario)
+
+        assert [b.data, c.data] == ["b", "c"]
+        assert ready == Event(last, name="ready")
+
+    def test_expired_cursor(self):
+        broker = InMemoryBroker(maxlen=2)
+        cursor = broker.publish(CHANNEL, "a")
+        broker.publish(CHANNEL, "b")
+        broker.publish(CHANNEL, "c")
+        last = broker.publish(CHANNEL, "d")
+
+        async def scenario():
+            events = broker.subscribe(CHANNEL, cursor)
+            event = await anext(events)
+            await events.aclose()
+            return event
+
+        assert _run(scenario) == Event(last, name="reset")
+
+    def test_cursor_from_before_a_restart(self):
+        broker = InMemoryBroker()
+
+        async def scenario():
+            events = broker.subscribe(CHANNEL, "42-0")
+            event = await anext(events)
+            await events.aclose()
+            return event
+
+        assert _run(scenario).name == "reset"
+
+    def test_idle(self):
+        broker = InMemoryBroker()
+
+        async def scenario():
+            events = broker.subscribe(CHANNEL, idle_timeout=0.01)
+            await anext(events)
+            event = await anext(events)
+            await events.aclose()
+            return event
+
+        assert _run(scenario) is None
+
+    def test_fan_out(self):
+        broker = InMemoryBroker()
+        subscribers = 2000
+
+        async def scenario():
+            streams = [broker.subscribe(CHANNEL) for _ in range(subscribers)]
+            await asyncio.gather(*(anext(events) for events in streams))
+            broker.publish(CHANNEL, "new")
+            received = await asyncio.gather(*(anext(events) for events in streams))
+            await asyncio.gather(*(events.aclose() for events in streams))
+            return received
+
+        received = _run(scenario)
+
+        assert {event.data for event in received} == {"new"}
+        assert len(received) == subscribers
+        assert not broker._subscriptions  # noqa: SLF001
+
+    def test_slow_subscriber_is_dropped(self):
+        broker = InMemoryBroker(buffer_size=1)
+
+        async def scenario():
+            events = broker.subscribe(CHANNEL)
+            await anext(events)
+            broker.publish(CHANNEL, "a")
+            broker.publish(CHANNEL, "b")
+            first = await anext(events)
+            rest = [event async for event in events]
+            return first, rest
+
+        first, rest = _run(scenario)
+
+        assert first.data == "a"
+        assert rest == []
+
+
+class FlakyStreams:
+    """An asyncio Redis client whose ``XREAD`` fails, then gets a bad entry."""
+
+    def __init__(self):
+        self.responses = [
+            ResponseError("LOADING Redis is loading the dataset in memory"),
+            [(b"kitchen:x", [(b"1-0", {b"other": b""}), (b"2-0", {b"data": b"new"})])],
+        ]
+
+    async def xrevrange(self, key, count):
+        return []
+
+    async def xread(self, streams, count, block):
+        if not self.responses:
+            await asyncio.Event().wait()
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class FlakyRedisBroker(RedisBroker):
+    def __init__(self):
+        super().__init__(url="redis://localhost:6379/0")
+        self.retry_delay = 0
+        self.client = FlakyStreams()
+
+    def _aclient(self):
+        return self.client
+
+
+class TestRedisBroker:
+    def test_reader_survives_errors(self):
+        broker = FlakyRedisBroker()
+
+        async def scenario():
+            events = broker.subscribe(CHANNEL)
+            await anext(events)
+            try:
+                return await asyncio.wait_for(anext(events), 1)
+            finally:
+                await events.aclose()
+
+        assert _run(scenario) == Event("2-0", "new", "ticket")
+        assert not broker._readers  # noqa: SLF001
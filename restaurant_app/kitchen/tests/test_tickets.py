@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from restaurant_app.kitchen.brokers import InMemoryBroker
+from restaurant_app.kitchen.brokers import get_broker
+from restaurant_app.kitchen.tickets import publish_ticket
+from restaurant_app.kitchen.tickets import ticket_data
+from restaurant_app.orders.models import LineItemModifier
+from restaurant_app.orders.tests.factories import LineItemFactory
+
+
+@pytest.fixture(autouse=True)
+def _broker():
+    get_broker.cache_clear()
+    yield
+    get_broker.cache_clear()
+
+
+class TestTickets:
+    def test_ticket_data(self, db, django_assert_num_queries):
+        line = LineItemFactory(notes="No ice")
+        LineItemModifier.objects.create(line=line, name="Lemon", price="0.00")
+
+        # Orders without prefetched lines are loaded with them.
+        with django_assert_num_queries(3):
+            ticket = ticket_data(line.order)
+
+        assert ticket["id"] == line.order.pk
+        assert ticket["status"] == "new"
+        assert ticket["lines"] == [
+            {
+                "id": line.pk,
+                "name": line.name,
+                "quantity": 1,
+                "notes": "No ice",
+                "modifiers": ["Lemon"],
+            },
+        ]
+
+    def test_published_on_commit(self, db, django_capture_on_commit_callbacks):
+        broker = get_broker()
+        assert isinstance(broker, InMemoryBroker)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            line = LineItemFactory()
+        order = line.order
+        channel = f"restaurant:{order.restaurant_id}:tickets"
+
+        (event,) = broker._logs[channel]  # noqa: SLF001
+        assert json.loads(event.data)["lines"][0]["id"] == line.pk
+
+        second = publish_ticket(order)
+        assert broker._logs[channel][-1].id == second  # noqa: SLF001
@@ -0,0 +1,131 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import Permission
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from restaurant_app.kitchen.brokers import get_broker
+from restaurant_app.kitchen.tickets import ticket_channel
+from restaurant_app.menu.models import Restaurant
+from restaurant_app.menu.tests.factories import RestaurantFactory
+from restaurant_app.orders.tests.factories import LineItemFactory
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _broker():
+    get_broker.cache_clear()
+    yield
+    get_broker.cache_clear()
+
+
+@pytest.fixture
+def cook(user: User) -> User:
+    user.user_permissions.add(Permission.objects.get(codename="view_order"))
+    return user
+
+
+@pytest.fixture
+def restaurant(db) -> Restaurant:
+    return RestaurantFactory()
+
+
+def _read(response, count: int) -> list[str]:
+    async def scenario():
+        chunks = aiter(response.streaming_content)
+        received = [(await anext(chunks)).decode() for _ in range(count)]
+        await chunks.aclose()
+        return received
+
+    return async_to_sync(scenario)()
+
+
+def _stream(async_client, restaurant: Restaurant, headers=None):
+    url = reverse("kitchen:tickets", kwargs={"slug": restaurant.slug})
+    return async_to_sync(async_client.get)(url, headers=headers)
+
+
+class TestTicketStreamView:
+    def test_wsgi(self, client, cook: User, restaurant: Restaurant):
+        client.force_login(cook)
+        url = reverse("kitchen:tickets", kwargs={"slug": restaurant.slug})
+
+        response = client.get(url)
+
+        assert response.status_code == HTTPStatus.NOT_IMPLEMENTED
+        assert not get_broker()._subscriptions  # noqa: SLF001
+
+    def test_anonymous(self, async_client, restaurant: Restaurant):
+        response = _stream(async_client, restaurant)
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    def test_permission_required(self, async_client, user: User, restaurant):
+        async_client.force_login(user)
+
+        response = _stream(async_client, restaurant)
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_invalid_cursor(self, async_client, cook: User, restaurant):
+        async_client.force_login(cook)
+
+        response = _stream(async_client, restaurant, {"Last-Event-ID": "nope"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_stream(self, async_client, cook: User, restaurant: Restaurant):
+        async_client.force_login(cook)
+
+        response = _stream(async_client, restaurant)
+        retry, ready = _read(response, 2)
+
+        assert response["Content-Type"] == "text/event-stream"
+        assert retry == "retry: 3000\n\n"
+        assert ready == "id: 0-0\nevent: ready\ndata: \n\n"
+
+    def test_catch_up(
+        self,
+        async_client,
+        cook: User,
+        restaurant: Restaurant,
+        django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            line = LineItemFactory(order__restaurant=restaurant)
+        Token.objects.create(user=cook)
+
+        response = _stream(
+            async_client,
+            restaurant,
+            {"Authorization": f"Token {cook.auth_token.key}", "Last-Event-ID": "0-0"},
+        )
+        _retry, ticket, ready = _read(response, 3)
+
+        event_id, name, data = (
+            field.split(": ", 1)[1] for field in ticket.split("\n")[:3]
+        )
+        assert name == "ticket"
+        assert json.loads(data)["id"] == line.order.pk
+        assert ready.startswith(f"id: {event_id}\nevent: ready\n")
+
+    def test_live(self, async_client, cook: User, restaurant: Restaurant):
+        async_client.force_login(cook)
+        url = reverse("kitchen:tickets", kwargs={"slug": restaurant.slug})
+
+        async def scenario():
+            response = await async_client.get(url)
+            chunks = aiter(response.streaming_content)
+            await anext(chunks)
+            await anext(chunks)
+            get_broker().publish(ticket_channel(restaurant.pk), '{"id":1}')
+            ticket = await anext(chunks)
+            await chunks.aclose()
+            return ticket.decode()
+
+        ticket = async_to_sync(scenario)()
+
+        assert ticket == 'id: 1-0\nevent: ticket\ndata: {"id":1}\n\n'
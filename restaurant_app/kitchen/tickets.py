@@ -0,0 +1,46 @@
+"""
+Kitchen tickets: orders as the kitchen screens see them.
+
+Every committed change to an order is published to its restaurant's channel on
+the broker from ``get_broker()``, where the ticket feed picks it up.
+"""
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from restaurant_app.kitchen.brokers import get_broker
+from restaurant_app.orders.models import Order
+
+
+def ticket_channel(restaurant_id: int) -> str:
+    return f"restaurant:{restaurant_id}:tickets"
+
+
+def ticket_data(order: Order) -> dict:
+    lines = getattr(order, "line_list", None)
+    if lines is None:
+        lines = Order.objects.with_lines().get(pk=order.pk).line_list
+    return {
+        "id": order.pk,
+        "status": order.status,
+        "notes": order.notes,
+        "created": order.created,
+        "updated": order.updated,
+        "lines": [
+            {
+                "id": line.pk,
+                "name": line.name,
+                "quantity": line.quantity,
+                "notes": line.notes,
+                "modifiers": [modifier.name for modifier in line.modifier_list],
+            }
+            for line in lines
+        ],
+    }
+
+
+def publish_ticket(order: Order) -> str:
+    """Publish the order's current ticket; returns the event id."""
+    data = json.dumps(ticket_data(order), cls=DjangoJSONEncoder, separators=(",", ":"))
+    return get_broker().publish(ticket_channel(order.restaurant_id), data)
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import ticket_stream_view
+
+app_name = "kitchen"
+urlpatterns = [
+    path("<slug:slug>/tickets/", view=ticket_stream_view, name="tickets"),
+]
@@ -0,0 +1,85 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse
+from django.http import HttpResponseBadRequest
+from django.http import StreamingHttpResponse
+from django.shortcuts import aget_object_or_404
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import AuthenticationFailed
+
+from restaurant_app.menu.models import Restaurant
+from restaurant_app.users.authentication import CachedTokenAuthentication
+
+from .brokers import get_broker
+from .brokers import parse_id
+from .tickets import ticket_channel
+
+
+async def _authenticate(request):
+    """The session user, or the user of an ``Authorization: Token ...`` header."""
+    user = await request.auser()
+    if user.is_authenticated:
+        return user
+    authentication = CachedTokenAuthentication()
+    try:
+        credentials = await sync_to_async(authentication.authenticate)(request)
+    except AuthenticationFailed:
+        return user
+    return credentials[0] if credentials else user
+
+
+async def _events(channel: str, cursor: str | None):
+    yield f"retry: {settings.KITCHEN_RETRY_MS}\n\n"
+    events = get_broker().subscribe(
+        channel,
+        cursor,
+        idle_timeout=settings.KITCHEN_HEARTBEAT_INTERVAL,
+    )
+    async for event in events:
+        if event is None:
+            # Keeps proxies from closing an idle connection.
+            yield ":\n\n"
+        else:
+            yield f"id: {event.id}\nevent: {event.name}\ndata: {event.data}\n\n"
+
+
+@require_GET
+async def ticket_stream_view(request, slug):
+    """
+    Server-sent events with the restaurant's tickets as they change.
+
+    Authentication, the permission check and the restaurant lookup happen once,
+    when the connection opens; after that an idle connection costs a coroutine
+    and a queue, and no database connection. Reconnecting clients send
+    ``Last-Event-ID`` (or ``?cursor=``) and get what they missed first; a
+    ``reset`` event means it is gone and the screen should reload its tickets.
+
+    Needs the ASGI application: under WSGI every open screen would hold a
+    worker for good, so the stream is refused there with a 501.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(
+            "The ticket stream needs the ASGI server (DJANGO_ASGI=True).",
+            status=501,
+            content_type="text/plain",
+        )
+    user = await _authenticate(request)
+    if not user.is_authenticated:
+        return HttpResponse(status=401)
+    if not await sync_to_async(user.has_perm)("orders.view_order"):
+        return HttpResponse(status=403)
+    restaurant = await aget_object_or_404(Restaurant, slug=slug)
+
+    cursor = request.headers.get("Last-Event-ID") or request.GET.get("cursor")
+    if cursor is not None:
+        try:
+            parse_id(cursor)
+        except ValueError:
+            return HttpResponseBadRequest("Invalid cursor.")
+
+    return StreamingHttpResponse(
+        _events(ticket_channel(restaurant.pk), cursor),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
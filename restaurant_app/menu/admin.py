@@ -0,0 +1,52 @@
+from django.contrib import admin
+
+from .models import AvailabilityWindow
+from .models import Category
+from .models import Item
+from .models import Modifier
+from .models import Restaurant
+
+
+class CategoryInline(admin.TabularInline):
+    model = Category
+    extra = 0
+
+
+class AvailabilityWindowInline(admin.TabularInline):
+    model = AvailabilityWindow
+    extra = 0
+
+
+class ItemInline(admin.TabularInline):
+    model = Item
+    extra = 0
+
+
+class ModifierInline(admin.TabularInline):
+    model = Modifier
+    extra = 0
+
+
+@admin.register(Restaurant)
+class RestaurantAdmin(admin.ModelAdmin):
+    list_display = ["name", "slug", "menu_version"]
+    search_fields = ["name", "slug"]
+    prepopulated_fields = {"slug": ["name"]}
+    inlines = [CategoryInline]
+
+
+@admin.register(Category)
+class CategoryAdmin(admin.ModelAdmin):
+    list_display = ["name", "restaurant", "position"]
+    list_filter = ["restaurant"]
+    list_select_related = ["restaurant"]
+    inlines = [AvailabilityWindowInline, ItemInline]
+
+
+@admin.register(Item)
+class ItemAdmin(admin.ModelAdmin):
+    list_display = ["name", "category", "price", "is_available"]
+    list_filter = ["is_available", "category__restaurant"]
+    list_select_related = ["category"]
+    search_fields = ["name"]
+    inlines = [ModifierInline]
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from restaurant_app.core.api.fieldsets import SparseFieldsetSerializerMixin
+from restaurant_app.menu.models import Restaurant
+
+
+class RestaurantSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer[Restaurant],
+):
+    class Meta:
+        model = Restaurant
+        fields = ["name", "slug", "url"]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:restaurant-detail", "lookup_field": "slug"},
+        }
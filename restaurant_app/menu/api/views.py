@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from rest_framework.decorators import action
+from rest_framework.mixins import ListModelMixin
+from rest_framework.mixins import RetrieveModelMixin
+from rest_framework.viewsets import GenericViewSet
+
+from restaurant_app.core.api.fieldsets import SparseFieldsetMixin
+from restaurant_app.core.api.values import ValuesListMixin
+from restaurant_app.core.http import make_etag
+from restaurant_app.menu.models import Restaurant
+from restaurant_app.menu.snapshots import get_snapshot
+
+from .serializers import RestaurantSerializer
+
+
+class RestaurantViewSet(
+    SparseFieldsetMixin,
+    ValuesListMixin,
+    RetrieveModelMixin,
+    ListModelMixin,
+    GenericViewSet,
+):
+    serializer_class = RestaurantSerializer
+    queryset = Restaurant.objects.all()
+    lookup_field = "slug"
+    # Pages by the unique slug: name isn't unique or indexed.
+    ordering = ("slug",)
+
+    @action(detail=True)
+    def menu(self, request, slug=None):
+        """
+        Full menu tree, served from the prebuilt snapshot.
+
+        The ETag comes from the menu version, so a 304 costs the restaurant
+        lookup and nothing else.
+        """
+        restaurant = self.get_object()
+        etag = make_etag(request, "menu", restaurant.pk, restaurant.menu_version)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                get_snapshot(restaurant),
+                content_type="application/json",
+            )
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, max_age=settings.MENU_MAX_AGE)
+        return response
@@ -0,0 +1,13 @@
+import contextlib
+
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class MenuConfig(AppConfig):
+    name = "restaurant_app.menu"
+    verbose_name = _("Menu")
+
+    def ready(self):
+        with contextlib.suppress(ImportError):
+            import restaurant_app.menu.signals  # noqa: F401
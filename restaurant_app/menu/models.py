@@ -0,0 +1,149 @@
+from decimal import Decimal
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class Restaurant(models.Model):
+    name = models.CharField(_("Name"), max_length=255)
+    slug = models.SlugField(_("Slug"), unique=True)
+    # Bumped once per committed menu change; part of the snapshot cache key.
+    menu_version = models.PositiveIntegerField(
+        _("Menu version"),
+        default=0,
+        editable=False,
+    )
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self) -> str:
+        return self.name
+
+    def save(self, *args, **kwargs):
+        # menu_version is only ever bumped with an UPDATE ... SET menu_version + 1;
+        # never write back a value that may be stale by now.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.fields
+                if not field.primary_key and field.name != "menu_version"
+            ]
+        super().save(*args, **kwargs)
+
+
+class MenuNode(models.Model):
+    """
+    A model below ``Restaurant`` in the menu tree.
+
+    Remembers the parent it was loaded with, so that moving a node marks both
+    the old and the new place in the menu snapshot as stale.
+    """
+
+    parent_field: str
+    loaded_parent_id: int | None = None
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.loaded_parent_id = getattr(instance, f"{cls.parent_field}_id", None)
+        return instance
+
+    def parent_ids(self) -> set[int]:
+        ids = {getattr(self, f"{self.parent_field}_id")}
+        if self.loaded_parent_id is not None:
+            ids.add(self.loaded_parent_id)
+        return ids
+
+
+class Category(MenuNode):
+    parent_field = "restaurant"
+
+    restaurant = models.ForeignKey(
+        Restaurant,
+        on_delete=models.CASCADE,
+        related_name="categories",
+    )
+    name = models.CharField(_("Name"), max_length=255)
+    position = models.PositiveIntegerField(_("Position"), default=0)
+
+    class Meta:
+        ordering = ["position", "id"]
+        verbose_name_plural = _("categories")
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class AvailabilityWindow(MenuNode):
+    """A weekly time range during which a category can be ordered."""
+
+    parent_field = "category"
+
+    class Weekday(models.IntegerChoices):
+        MONDAY = 0, _("Monday")
+        TUESDAY = 1, _("Tuesday")
+        WEDNESDAY = 2, _("Wednesday")
+        THURSDAY = 3, _("Thursday")
+        FRIDAY = 4, _("Friday")
+        SATURDAY = 5, _("Saturday")
+        SUNDAY = 6, _("Sunday")
+
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name="availability_windows",
+    )
+    weekday = models.PositiveSmallIntegerField(_("Weekday"), choices=Weekday.choices)
+    starts_at = models.TimeField(_("Starts at"))
+    ends_at = models.TimeField(_("Ends at"))
+
+    class Meta:
+        ordering = ["weekday", "starts_at"]
+
+    def __str__(self) -> str:
+        return f"{self.get_weekday_display()} {self.starts_at}-{self.ends_at}"
+
+
+class Item(MenuNode):
+    parent_field = "category"
+
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name="items",
+    )
+    name = models.CharField(_("Name"), max_length=255)
+    description = models.TextField(_("Description"), blank=True)
+    price = models.DecimalField(_("Price"), max_digits=8, decimal_places=2)
+    is_available = models.BooleanField(_("Available"), default=True)
+    position = models.PositiveIntegerField(_("Position"), default=0)
+
+    class Meta:
+        ordering = ["position", "id"]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class Modifier(MenuNode):
+    parent_field = "item"
+
+    item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name="modifiers")
+    name = models.CharField(_("Name"), max_length=255)
+    price = models.DecimalField(
+        _("Price"),
+        max_digits=8,
+        decimal_places=2,
+        default=Decimal("0.00"),
+    )
+    position = models.PositiveIntegerField(_("Position"), default=0)
+
+    class Meta:
+        ordering = ["position", "id"]
+
+    def __str__(self) -> str:
+        return self.name
@@ -0,0 +1,57 @@
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .models import AvailabilityWindow
+from .models import Category
+from .models import Item
+from .models import Modifier
+from .models import Restaurant
+from .snapshots import mark_stale
+
+
+def _mark_categories_stale(rows) -> None:
+    """Mark ``(restaurant_id, category_id)`` pairs stale, grouped by restaurant."""
+    by_restaurant: dict[int, set[int]] = {}
+    for restaurant_id, category_id in rows:
+        by_restaurant.setdefault(restaurant_id, set()).add(category_id)
+    for restaurant_id, category_ids in by_restaurant.items():
+        mark_stale(restaurant_id, category_ids)
+
+
+@receiver(post_save, sender=Restaurant)
+def restaurant_saved(sender, instance, **kwargs):
+    mark_stale(instance.pk, ())
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    for restaurant_id in instance.parent_ids():
+        mark_stale(restaurant_id, [instance.pk])
+
+
+# Deletes are resolved in pre_delete, while the parent rows are still there.
+@receiver(post_save, sender=Item)
+@receiver(pre_delete, sender=Item)
+@receiver(post_save, sender=AvailabilityWindow)
+@receiver(pre_delete, sender=AvailabilityWindow)
+def category_child_changed(sender, instance, **kwargs):
+    _mark_categories_stale(
+        Category.objects.filter(pk__in=instance.parent_ids()).values_list(
+            "restaurant_id",
+            "id",
+        ),
+    )
+
+
+@receiver(post_save, sender=Modifier)
+@receiver(pre_delete, sender=Modifier)
+def modifier_changed(sender, instance, **kwargs):
+    _mark_categories_stale(
+        Item.objects.filter(pk__in=instance.parent_ids()).values_list(
+            "category__restaurant_id",
+            "category_id",
+        ),
+    )
@@ -0,0 +1,183 @@
+"""
+Prebuilt, versioned menu snapshots.
+
+A restaurant's full menu tree is kept in the cache as ready-to-send JSON, keyed
+on ``Restaurant.menu_version``. Reads are a cache lookup; writes mark the menu
+stale, and once the transaction commits the version is bumped and the next
+snapshot is stored. When the previous snapshot is still cached only the
+categories that changed are rebuilt and spliced into it.
+
+Bulk operations (``bulk_create``, ``QuerySet.update``...) don't send signals:
+call ``mark_stale`` for the restaurants they touch.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F
+
+from .models import AvailabilityWindow
+from .models import Category
+from .models import Item
+from .models import Modifier
+from .models import Restaurant
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_pending = threading.local()
+
+
+def snapshot_key(restaurant_id: int, version: int) -> str:
+    return f"menu:snapshot:{restaurant_id}:{version}"
+
+
+def get_snapshot(restaurant: Restaurant) -> bytes:
+    """Return the restaurant's menu as JSON, building it on a cache miss."""
+    key = snapshot_key(restaurant.pk, restaurant.menu_version)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = _encode(build_menu(restaurant))
+        cache.set(key, snapshot, settings.MENU_SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def build_menu(restaurant: Restaurant) -> dict:
+    return {
+        **_header(restaurant),
+        "categories": _categories(restaurant.pk),
+    }
+
+
+def mark_stale(restaurant_id: int, category_ids: Iterable[int] | None = None) -> None:
+    """
+    Schedule a snapshot refresh for when the current transaction commits.
+
+    ``category_ids`` limits the rebuild to those categories (an empty iterable
+    only refreshes the restaurant itself); ``None`` rebuilds the whole menu.
+    Refreshes are coalesced so a transaction bumps each version only once.
+    """
+    pending = _pending.__dict__.setdefault("restaurants", {})
+    if category_ids is None or pending.get(restaurant_id, set()) is None:
+        pending[restaurant_id] = None
+    else:
+        pending.setdefault(restaurant_id, set()).update(category_ids)
+    transaction.on_commit(_flush)
+
+
+def refresh_snapshot(restaurant_id: int, category_ids: set[int] | None = None) -> None:
+    """Bump the menu version and store the snapshot for the new version."""
+    if not Restaurant.objects.filter(pk=restaurant_id).update(
+        menu_version=F("menu_version") + 1,
+    ):
+        return
+    restaurant = Restaurant.objects.get(pk=restaurant_id)
+    previous = None
+    if category_ids is not None:
+        previous = cache.get(snapshot_key(restaurant_id, restaurant.menu_version - 1))
+    if previous is None:
+        menu = build_menu(restaurant)
+    else:
+        menu = _patch(json.loads(previous), restaurant, category_ids or set())
+    cache.set(
+        snapshot_key(restaurant_id, restaurant.menu_version),
+        _encode(menu),
+        settings.MENU_SNAPSHOT_TIMEOUT,
+    )
+
+
+def _flush() -> None:
+    # Every write registers this callback; the first one to run does the work.
+    pending = _pending.__dict__.pop("restaurants", {})
+    for restaurant_id, category_ids in pending.items():
+        refresh_snapshot(restaurant_id, category_ids)
+
+
+def _patch(previous: dict, restaurant: Restaurant, category_ids: set[int]) -> dict:
+    categories = [c for c in previous["categories"] if c["id"] not in category_ids]
+    if category_ids:
+        categories += _categories(restaurant.pk, category_ids)
+        categories.sort(key=lambda category: (category["position"], category["id"]))
+    return {**_header(restaurant), "categories": categories}
+
+
+def _header(restaurant: Restaurant) -> dict:
+    return {
+        "id": restaurant.pk,
+        "name": restaurant.name,
+        "slug": restaurant.slug,
+        "version": restaurant.menu_version,
+    }
+
+
+def _categories(restaurant_id: int, category_ids: set[int] | None = None) -> list:
+    """Menu subtrees of a restaurant's categories, in four queries."""
+    scope: dict[str, Any] = {"restaurant_id": restaurant_id}
+    if category_ids is not None:
+        scope["id__in"] = category_ids
+    categories: dict[int, dict[str, Any]] = {
+        pk: {
+            "id": pk,
+            "name": name,
+            "position": position,
+            "availability": [],
+            "items": [],
+        }
+        for pk, name, position in Category.objects.filter(**scope).values_list(
+            "id",
+            "name",
+            "position",
+        )
+    }
+    nested = {f"category__{lookup}": value for lookup, value in scope.items()}
+
+    windows = AvailabilityWindow.objects.filter(**nested).values_list(
+        "category_id",
+        "weekday",
+        "starts_at",
+        "ends_at",
+    )
+    for category_id, weekday, starts_at, ends_at in windows:
+        categories[category_id]["availability"].append(
+            {"weekday": weekday, "starts_at": starts_at, "ends_at": ends_at},
+        )
+
+    rows = Item.objects.filter(**nested).values_list(
+        "id",
+        "category_id",
+        "name",
+        "description",
+        "price",
+        "is_available",
+    )
+    items: dict[int, dict[str, Any]] = {}
+    for pk, category_id, name, description, price, is_available in rows:
+        items[pk] = {
+            "id": pk,
+            "name": name,
+            "description": description,
+            "price": price,
+            "is_available": is_available,
+            "modifiers": [],
+        }
+        categories[category_id]["items"].append(items[pk])
+
+    modifiers = Modifier.objects.filter(
+        **{f"item__{lookup}": value for lookup, value in nested.items()},
+    ).values_list("id", "item_id", "name", "price")
+    for pk, item_id, name, price in modifiers:
+        items[item_id]["modifiers"].append({"id": pk, "name": name, "price": price})
+
+    return list(categories.values())
+
+
+def _encode(menu: dict) -> bytes:
+    return json.dumps(menu, cls=DjangoJSONEncoder, separators=(",", ":")).encode()
@@ -0,0 +1,59 @@
+import datetime
+from decimal import Decimal
+
+from factory import Faker
+from factory import Sequence
+from factory import SubFactory
+from factory.django import DjangoModelFactory
+
+from restaurant_app.menu.models import AvailabilityWindow
+from restaurant_app.menu.models import Category
+from restaurant_app.menu.models import Item
+from restaurant_app.menu.models import Modifier
+from restaurant_app.menu.models import Restaurant
+
+
+class RestaurantFactory(DjangoModelFactory[Restaurant]):
+    name = Faker("company")
+    slug = Sequence(lambda n: f"restaurant-{n}")
+
+    class Meta:
+        model = Restaurant
+
+
+class CategoryFactory(DjangoModelFactory[Category]):
+    restaurant = SubFactory(RestaurantFactory)
+    name = Faker("word")
+    position = Sequence(lambda n: n)
+
+    class Meta:
+        model = Category
+
+
+class AvailabilityWindowFactory(DjangoModelFactory[AvailabilityWindow]):
+    category = SubFactory(CategoryFactory)
+    weekday = AvailabilityWindow.Weekday.MONDAY
+    starts_at = datetime.time(8)
+    ends_at = datetime.time(11)
+
+    class Meta:
+        model = AvailabilityWindow
+
+
+class ItemFactory(DjangoModelFactory[Item]):
+    category = SubFactory(CategoryFactory)
+    name = Faker("word")
+    price = Decimal("9.50")
+    position = Sequence(lambda n: n)
+
+    class Meta:
+        model = Item
+
+
+class ModifierFactory(DjangoModelFactory[Modifier]):
+    item = SubFactory(ItemFactory)
+    name = Faker("word")
+    price = Decimal("1.25")
+
+    class Meta:
+        model = Modifier
@@ -0,0 +1,80 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from restaurant_app.menu.snapshots import refresh_snapshot
+from restaurant_app.menu.tests.factories import ItemFactory
+from restaurant_app.menu.tests.factories import RestaurantFactory
+from restaurant_app.users.models import User
+
+
+class TestRestaurantViewSet:
+    @pytest.fixture
+    def item(self, db, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            return ItemFactory()
+
+    def test_menu(self, user: User, client, item, django_assert_max_num_queries):
+        restaurant = item.category.restaurant
+        client.force_login(user)
+        url = reverse("api:restaurant-menu", kwargs={"slug": restaurant.slug})
+
+        # User and restaurant lookups, and no transaction for a read; the menu
+        # itself comes from the cache.
+        with django_assert_max_num_queries(2):
+            response = client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/json"
+        menu = json.loads(response.content)
+        assert menu["categories"][0]["items"][0]["id"] == item.pk
+
+    def test_detail(self, user: User, client, item):
+        restaurant = item.category.restaurant
+        client.force_login(user)
+        response = client.get(reverse("api:restaurant-detail", args=[restaurant.slug]))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "name": restaurant.name,
+            "slug": restaurant.slug,
+            "url": f"http://testserver/api/restaurants/{restaurant.slug}/",
+        }
+
+    def test_list_sparse_fields(self, user: User, client):
+        restaurants = RestaurantFactory.create_batch(3)
+        client.force_login(user)
+
+        response = client.get(reverse("api:restaurant-list"), {"fields": "name"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["results"] == [
+            {"name": restaurant.name}
+            for restaurant in sorted(restaurants, key=lambda r: r.slug)
+        ]
+
+    def test_menu_not_modified(self, user: User, client, item):
+        restaurant = item.category.restaurant
+        client.force_login(user)
+        url = reverse("api:restaurant-menu", kwargs={"slug": restaurant.slug})
+        response = client.get(url)
+        assert response["Cache-Control"] == "private, max-age=60"
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response["ETag"]
+
+    def test_menu_changed(self, user: User, client, item):
+        restaurant = item.category.restaurant
+        client.force_login(user)
+        url = reverse("api:restaurant-menu", kwargs={"slug": restaurant.slug})
+        etag = client.get(url)["ETag"]
+        refresh_snapshot(restaurant.pk)
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["ETag"] != etag
@@ -0,0 +1,159 @@
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+
+from restaurant_app.menu.models import Restaurant
+from restaurant_app.menu.snapshots import get_snapshot
+from restaurant_app.menu.snapshots import snapshot_key
+from restaurant_app.menu.tests.factories import AvailabilityWindowFactory
+from restaurant_app.menu.tests.factories import CategoryFactory
+from restaurant_app.menu.tests.factories import ItemFactory
+from restaurant_app.menu.tests.factories import ModifierFactory
+from restaurant_app.menu.tests.factories import RestaurantFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def committed(django_capture_on_commit_callbacks):
+    """Run the snapshot refreshes that writes schedule for commit time."""
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+def _menu(restaurant: Restaurant) -> dict:
+    restaurant.refresh_from_db()
+    return json.loads(get_snapshot(restaurant))
+
+
+class TestSnapshot:
+    def test_tree(self):
+        modifier = ModifierFactory(name="Extra cheese")
+        item = modifier.item
+        AvailabilityWindowFactory(category=item.category)
+        restaurant = item.category.restaurant
+
+        menu = _menu(restaurant)
+
+        assert menu["slug"] == restaurant.slug
+        assert menu["version"] == restaurant.menu_version
+        (category,) = menu["categories"]
+        assert category["availability"] == [
+            {"weekday": 0, "starts_at": "08:00:00", "ends_at": "11:00:00"},
+        ]
+        assert category["items"] == [
+            {
+                "id": item.pk,
+                "name": item.name,
+                "description": "",
+                "price": "9.50",
+                "is_available": True,
+                "modifiers": [
+                    {"id": modifier.pk, "name": "Extra cheese", "price": "1.25"},
+                ],
+            },
+        ]
+
+    def test_reads_are_flat(self, django_assert_num_queries, committed):
+        restaurant = RestaurantFactory()
+        with committed():
+            for category in CategoryFactory.create_batch(3, restaurant=restaurant):
+                for item in ItemFactory.create_batch(20, category=category):
+                    ModifierFactory(item=item)
+        restaurant.refresh_from_db()
+
+        with django_assert_num_queries(0):
+            menu = json.loads(get_snapshot(restaurant))
+
+        assert sum(len(category["items"]) for category in menu["categories"]) == 60  # noqa: PLR2004
+
+    def test_rebuilt_on_miss(self, django_assert_num_queries):
+        restaurant = ItemFactory().category.restaurant
+        restaurant.refresh_from_db()
+        cache.clear()
+
+        with django_assert_num_queries(4):
+            get_snapshot(restaurant)
+        with django_assert_num_queries(0):
+            get_snapshot(restaurant)
+
+
+class TestInvalidation:
+    def test_write_bumps_version(self, committed):
+        with committed():
+            item = ItemFactory()
+        restaurant = item.category.restaurant
+        restaurant.refresh_from_db()
+        version = restaurant.menu_version
+
+        item.price = Decimal("11.00")
+        with committed():
+            item.save()
+
+        menu = _menu(restaurant)
+        assert menu["version"] == version + 1
+        assert menu["categories"][0]["items"][0]["price"] == "11.00"
+
+    def test_incremental_rebuild_keeps_other_categories(self, committed):
+        with committed():
+            untouched = ItemFactory(name="Soup")
+            restaurant = untouched.category.restaurant
+            item = ItemFactory(category__restaurant=restaurant, name="Burger")
+        restaurant.refresh_from_db()
+        # Prove the untouched category comes from the previous snapshot.
+        previous_key = snapshot_key(restaurant.pk, restaurant.menu_version)
+        previous = json.loads(cache.get(previous_key))
+        previous["categories"][0]["items"][0]["name"] = "Soup (cached)"
+        cache.set(previous_key, json.dumps(previous).encode())
+
+        item.name = "Cheeseburger"
+        with committed():
+            item.save()
+
+        names = [c["items"][0]["name"] for c in _menu(restaurant)["categories"]]
+        assert names == ["Soup (cached)", "Cheeseburger"]
+
+    def test_moved_item_leaves_old_category(self, committed):
+        with committed():
+            item = ItemFactory()
+            restaurant = item.category.restaurant
+            other = CategoryFactory(restaurant=restaurant)
+
+        item = type(item).objects.get(pk=item.pk)
+        item.category = other
+        with committed():
+            item.save()
+
+        items = [[i["id"] for i in c["items"]] for c in _menu(restaurant)["categories"]]
+        assert items == [[], [item.pk]]
+
+    def test_delete_category(self, committed):
+        with committed():
+            item = ItemFactory()
+        restaurant = item.category.restaurant
+
+        with committed():
+            item.category.delete()
+
+        assert _menu(restaurant)["categories"] == []
+
+    def test_restaurant_save_keeps_version(self, committed):
+        with committed():
+            restaurant = ItemFactory().category.restaurant
+        stale = Restaurant.objects.get(pk=restaurant.pk)
+        with committed():
+            ItemFactory(category__restaurant=restaurant)
+
+        stale.name = "Renamed"
+        with committed():
+            stale.save()
+
+        menu = _menu(restaurant)
+        assert menu["name"] == "Renamed"
+        assert len(menu["categories"]) == 2  # noqa: PLR2004
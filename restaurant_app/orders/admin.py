@@ -0,0 +1,28 @@
+from django.contrib import admin
+
+from .models import LineItem
+from .models import LineItemModifier
+from .models import Order
+
+
+class LineItemInline(admin.TabularInline):
+    model = LineItem
+    extra = 0
+    fields = ["name", "unit_price", "quantity", "notes"]
+    readonly_fields = ["name", "unit_price", "quantity", "notes"]
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "restaurant", "placed_by", "status", "total", "created"]
+    list_filter = ["status", "restaurant"]
+    list_select_related = ["restaurant", "placed_by"]
+    readonly_fields = ["restaurant", "placed_by", "total", "idempotency_key", "created"]
+    inlines = [LineItemInline]
+
+
+@admin.register(LineItemModifier)
+class LineItemModifierAdmin(admin.ModelAdmin):
+    list_display = ["name", "line", "price"]
+    list_select_related = ["line"]
+    readonly_fields = ["line", "modifier", "name", "price"]
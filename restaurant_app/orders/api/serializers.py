@@ -0,0 +1,132 @@
+from rest_framework import serializers
+
+from restaurant_app.core.api.fieldsets import SparseFieldsetSerializerMixin
+from restaurant_app.menu.models import Item
+from restaurant_app.menu.models import Modifier
+from restaurant_app.menu.models import Restaurant
+from restaurant_app.orders.models import LineItem
+from restaurant_app.orders.models import LineItemModifier
+from restaurant_app.orders.models import Order
+from restaurant_app.orders.services import place_order
+
+
+class LineItemModifierSerializer(serializers.ModelSerializer[LineItemModifier]):
+    class Meta:
+        model = LineItemModifier
+        fields = ["modifier", "name", "price"]
+
+
+class LineItemSerializer(serializers.ModelSerializer[LineItem]):
+    modifiers = LineItemModifierSerializer(source="modifier_list", many=True)
+
+    class Meta:
+        model = LineItem
+        fields = ["id", "item", "name", "unit_price", "quantity", "notes", "modifiers"]
+
+
+class OrderSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer[Order],
+):
+    """Expects orders from ``Order.objects.with_lines()`` or ``place_order()``."""
+
+    restaurant = serializers.CharField(source="restaurant.slug", read_only=True)
+    lines = LineItemSerializer(source="line_list", many=True, read_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            "id",
+            "url",
+            "restaurant",
+            "status",
+            "notes",
+            "total",
+            "lines",
+            "created",
+        ]
+        read_only_fields = fields
+
+        extra_kwargs = {
+            "url": {"view_name": "api:order-detail"},
+        }
+
+
+class LineInputSerializer(serializers.Serializer):
+    item = serializers.IntegerField(min_value=1)
+    quantity = serializers.IntegerField(min_value=1, max_value=99, default=1)
+    modifiers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        max_length=20,
+        default=list,
+    )
+    notes = serializers.CharField(max_length=255, allow_blank=True, default="")
+
+
+class OrderCreateSerializer(serializers.Serializer):
+    """
+    Validate a new order against the menu and place it.
+
+    Items and modifiers are looked up with one query each, however many lines
+    the order has.
+    """
+
+    restaurant = serializers.SlugRelatedField(
+        slug_field="slug",
+        queryset=Restaurant.objects.all(),
+    )
+    notes = serializers.CharField(max_length=255, allow_blank=True, default="")
+    lines = LineInputSerializer(many=True, allow_empty=False, max_length=100)  # type: ignore[call-arg]
+
+    def validate(self, attrs):
+        lines = attrs["lines"]
+        items = {
+            pk: (name, price)
+            for pk, name, price in Item.objects.filter(
+                pk__in={line["item"] for line in lines},
+                category__restaurant=attrs["restaurant"],
+                is_available=True,
+            ).values_list("id", "name", "price")
+        }
+        modifiers = {
+            (item_id, pk): (name, price)
+            for pk, item_id, name, price in Modifier.objects.filter(
+                pk__in={pk for line in lines for pk in line["modifiers"]},
+            ).values_list("id", "item_id", "name", "price")
+        }
+
+        errors = {}
+        resolved = []
+        for index, line in enumerate(lines):
+            if line["item"] not in items:
+                errors[index] = {"item": ["This item is not available here."]}
+                continue
+            if any((line["item"], pk) not in modifiers for pk in line["modifiers"]):
+                errors[index] = {"modifiers": ["Unknown modifier for this item."]}
+                continue
+            name, price = items[line["item"]]
+            resolved.append(
+                {
+                    "item_id": line["item"],
+                    "name": name,
+                    "unit_price": price,
+                    "quantity": line["quantity"],
+                    "notes": line["notes"],
+                    "modifiers": [
+                        {
+                            "modifier_id": pk,
+                            "name": modifiers[line["item"], pk][0],
+                            "price": modifiers[line["item"], pk][1],
+                        }
+                        for pk in line["modifiers"]
+                    ],
+                },
+            )
+        if errors:
+            raise serializers.ValidationError(
+                {"lines": [errors.get(index, {}) for index in range(len(lines))]},
+            )
+        return {**attrs, "lines": resolved}
+
+    def create(self, validated_data):
+        return place_order(**validated_data)
@@ -0,0 +1,102 @@
+from django.db import IntegrityError
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.exceptions import ValidationError
+from rest_framework.mixins import ListModelMixin
+from rest_framework.mixins import RetrieveModelMixin
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from restaurant_app.core.api.fieldsets import SparseFieldsetMixin
+from restaurant_app.orders.models import IDEMPOTENCY_KEY_MAX_LENGTH
+from restaurant_app.orders.models import Order
+from restaurant_app.orders.services import get_replay
+from restaurant_app.orders.services import request_fingerprint
+from restaurant_app.orders.services import store_replay
+
+from .serializers import OrderCreateSerializer
+from .serializers import OrderSerializer
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was already used for a different request."
+    default_code = "idempotency_key_reused"
+
+
+# place_order() writes each order in its own short transaction, and replayed
+# POSTs shouldn't open one at all.
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class OrderViewSet(
+    SparseFieldsetMixin,
+    RetrieveModelMixin,
+    ListModelMixin,
+    GenericViewSet,
+):
+    """
+    Orders placed by the current user.
+
+    POSTs may carry an ``Idempotency-Key`` header: retrying with the same key
+    and body returns the original response, flagged with
+    ``Idempotent-Replayed: true``, instead of placing the order again.
+    """
+
+    serializer_class = OrderSerializer
+    queryset = Order.objects.all()
+    # Newest first, by the (placed_by, id) index.
+    ordering = ("-id",)
+
+    def get_queryset(self, *args, **kwargs):
+        return self.queryset.filter(placed_by=self.request.user).with_lines()
+
+    def get_throttles(self):
+        # Placing orders has a rate of its own, reading them only the user's.
+        self.throttle_scope = "orders" if self.action == "create" else None
+        return super().get_throttles()
+
+    def create(self, request, *args, **kwargs):
+        key = request.headers.get("Idempotency-Key", "")
+        if len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            msg = f"Must be at most {IDEMPOTENCY_KEY_MAX_LENGTH} characters."
+            raise ValidationError({"Idempotency-Key": [msg]})
+        fingerprint = request_fingerprint(request.data) if key else ""
+        if key and (replay := get_replay(request.user.pk, key)) is not None:
+            return self.replay(replay["fingerprint"], fingerprint, replay["data"])
+
+        serializer = OrderCreateSerializer(
+            data=request.data,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        try:
+            order = serializer.save(
+                placed_by=request.user,
+                idempotency_key=key,
+                request_fingerprint=fingerprint,
+            )
+        except IntegrityError:
+            # A concurrent retry got there first, or the cached replay expired.
+            if not key:
+                raise
+            order = self.get_queryset().filter(idempotency_key=key).first()
+            if order is None:
+                raise
+            data = self.get_serializer(order).data
+            store_replay(request.user.pk, key, order.request_fingerprint, data)
+            return self.replay(order.request_fingerprint, fingerprint, data)
+
+        data = self.get_serializer(order).data
+        if key:
+            store_replay(request.user.pk, key, fingerprint, data)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def replay(self, stored_fingerprint, fingerprint, data):
+        if stored_fingerprint != fingerprint:
+            raise IdempotencyKeyReused
+        return Response(
+            data,
+            status=status.HTTP_201_CREATED,
+            headers={"Idempotent-Replayed": "true"},
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.10 on 2026-10-18 18:44
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Orders is a big table: build the index without blocking new orders.
+    atomic = False
+
+    dependencies = [
+        ('menu', '0001_initial'),
+        ('orders', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['placed_by', 'id'], name='orders_order_placed_by_id_idx'),
+        ),
+    ]
@@ -0,0 +1,133 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Prefetch
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from restaurant_app.menu.models import Item
+from restaurant_app.menu.models import Modifier
+from restaurant_app.menu.models import Restaurant
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+class OrderQuerySet(models.QuerySet):
+    def with_lines(self):
+        """Prefetch lines and their modifiers into ``line_list``/``modifier_list``."""
+        return self.select_related("restaurant").prefetch_related(
+            Prefetch(
+                "lines",
+                queryset=LineItem.objects.prefetch_related(
+                    Prefetch("modifiers", to_attr="modifier_list"),
+                ),
+                to_attr="line_list",
+            ),
+        )
+
+
+class Order(models.Model):
+    class Status(models.TextChoices):
+        NEW = "new", _("New")
+        IN_PROGRESS = "in_progress", _("In progress")
+        READY = "ready", _("Ready")
+        COMPLETED = "completed", _("Completed")
+        CANCELLED = "cancelled", _("Cancelled")
+
+    restaurant = models.ForeignKey(
+        Restaurant,
+        on_delete=models.PROTECT,
+        related_name="orders",
+    )
+    placed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="orders",
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=Status.choices,
+        default=Status.NEW,
+    )
+    notes = models.CharField(_("Notes"), max_length=255, blank=True)
+    total = models.DecimalField(_("Total"), max_digits=10, decimal_places=2)
+    # Client-supplied Idempotency-Key and a hash of the request it came with.
+    idempotency_key = models.CharField(
+        _("Idempotency key"),
+        max_length=IDEMPOTENCY_KEY_MAX_LENGTH,
+        blank=True,
+    )
+    request_fingerprint = models.CharField(max_length=64, blank=True, editable=False)
+    created = models.DateTimeField(_("Created"), auto_now_add=True)
+    updated = models.DateTimeField(_("Updated"), auto_now=True)
+
+    objects = OrderQuerySet.as_manager()
+
+    # Filled in by OrderQuerySet.with_lines() and services.place_order().
+    line_list: list["LineItem"]
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [
+            # A user's orders, newest first: the API pages through them by id.
+            models.Index(
+                fields=["placed_by", "id"],
+                name="orders_order_placed_by_id_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["placed_by", "idempotency_key"],
+                condition=~Q(idempotency_key=""),
+                name="orders_order_unique_idempotency_key",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.pk}"
+
+
+class LineItem(models.Model):
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="lines")
+    item = models.ForeignKey(
+        Item,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    # Name and price as ordered, so later menu edits don't rewrite history.
+    name = models.CharField(_("Name"), max_length=255)
+    unit_price = models.DecimalField(_("Unit price"), max_digits=8, decimal_places=2)
+    quantity = models.PositiveIntegerField(_("Quantity"), default=1)
+    notes = models.CharField(_("Notes"), max_length=255, blank=True)
+
+    modifier_list: list["LineItemModifier"]
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"{self.quantity} x {self.name}"
+
+
+class LineItemModifier(models.Model):
+    line = models.ForeignKey(
+        LineItem,
+        on_delete=models.CASCADE,
+        related_name="modifiers",
+    )
+    modifier = models.ForeignKey(
+        Modifier,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    name = models.CharField(_("Name"), max_length=255)
+    price = models.DecimalField(_("Price"), max_digits=8, decimal_places=2)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return self.name
@@ -0,0 +1,120 @@
+"""
+Order placement.
+
+An order is written with one INSERT for the order, one for all of its lines and
+one for all of their modifiers, in a single short transaction. Orders placed
+with a client ``Idempotency-Key`` are remembered in the cache so that a retried
+POST is answered without touching the database; the unique constraint on
+``(placed_by, idempotency_key)`` settles concurrent retries and cache evictions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from .models import LineItem
+from .models import LineItemModifier
+from .models import Order
+
+if TYPE_CHECKING:
+    from restaurant_app.menu.models import Restaurant
+    from restaurant_app.users.models import User
+
+
+def place_order(  # noqa: PLR0913
+    *,
+    restaurant: Restaurant,
+    placed_by: User | None,
+    lines: list[dict[str, Any]],
+    notes: str = "",
+    idempotency_key: str = "",
+    request_fingerprint: str = "",
+) -> Order:
+    """
+    Insert an order with its lines and modifiers.
+
+    ``lines`` are resolved against the menu already: each one has ``item_id``,
+    ``name``, ``unit_price``, ``quantity``, ``notes`` and a list of
+    ``modifiers`` dicts with ``modifier_id``, ``name`` and ``price``. The
+    returned order has ``line_list`` and ``modifier_list`` filled in, the same
+    as ``Order.objects.with_lines()``.
+
+    Raises ``IntegrityError`` when ``idempotency_key`` was used before.
+    """
+    order = Order(
+        restaurant=restaurant,
+        placed_by=placed_by,
+        notes=notes,
+        total=sum((_line_total(line) for line in lines), Decimal("0.00")),
+        idempotency_key=idempotency_key,
+        request_fingerprint=request_fingerprint,
+    )
+    with transaction.atomic():
+        order.save(force_insert=True)
+        line_items = LineItem.objects.bulk_create(
+            LineItem(
+                order=order,
+                item_id=line["item_id"],
+                name=line["name"],
+                unit_price=line["unit_price"],
+                quantity=line["quantity"],
+                notes=line["notes"],
+            )
+            for line in lines
+        )
+        for line_item, line in zip(line_items, lines, strict=True):
+            line_item.modifier_list = [
+                LineItemModifier(line=line_item, **modifier)
+                for modifier in line["modifiers"]
+            ]
+        LineItemModifier.objects.bulk_create(
+            modifier for line_item in line_items for modifier in line_item.modifier_list
+        )
+        # Before the commit, so that on_commit callbacks see the whole order.
+        order.line_list = line_items
+    return order
+
+
+def _line_total(line: dict[str, Any]) -> Decimal:
+    modifiers = sum((modifier["price"] for modifier in line["modifiers"]), Decimal(0))
+    return (line["unit_price"] + modifiers) * line["quantity"]
+
+
+# IDEMPOTENCY
+# ------------------------------------------------------------------------------
+def request_fingerprint(data: Any) -> str:
+    """Hash of a request body, to tell a retry from a reused key."""
+    encoded = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _replay_key(user_id: int, idempotency_key: str) -> str:
+    digest = hashlib.sha256(idempotency_key.encode()).hexdigest()
+    return f"orders:idempotency:{user_id}:{digest}"
+
+
+def get_replay(user_id: int, idempotency_key: str) -> dict[str, Any] | None:
+    """The stored ``fingerprint`` and response ``data`` for a key, if cached."""
+    return cache.get(_replay_key(user_id, idempotency_key))
+
+
+def store_replay(
+    user_id: int,
+    idempotency_key: str,
+    fingerprint: str,
+    data: dict[str, Any],
+) -> None:
+    cache.set(
+        _replay_key(user_id, idempotency_key),
+        {"fingerprint": fingerprint, "data": data},
+        settings.ORDER_IDEMPOTENCY_TIMEOUT,
+    )
@@ -0,0 +1,33 @@
+from decimal import Decimal
+
+from factory import SelfAttribute
+from factory import SubFactory
+from factory.django import DjangoModelFactory
+
+from restaurant_app.menu.tests.factories import ItemFactory
+from restaurant_app.menu.tests.factories import RestaurantFactory
+from restaurant_app.orders.models import LineItem
+from restaurant_app.orders.models import Order
+from restaurant_app.users.tests.factories import UserFactory
+
+
+class OrderFactory(DjangoModelFactory[Order]):
+    restaurant = SubFactory(RestaurantFactory)
+    placed_by = SubFactory(UserFactory)
+    total = Decimal("9.50")
+
+    class Meta:
+        model = Order
+
+
+class LineItemFactory(DjangoModelFactory[LineItem]):
+    order = SubFactory(OrderFactory)
+    item = SubFactory(
+        ItemFactory,
+        category__restaurant=SelfAttribute("...order.restaurant"),
+    )
+    name = SelfAttribute("item.name")
+    unit_price = SelfAttribute("item.price")
+
+    class Meta:
+        model = LineItem
@@ -0,0 +1,249 @@
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from restaurant_app.menu.models import Item
+from restaurant_app.menu.tests.factories import ItemFactory
+from restaurant_app.menu.tests.factories import ModifierFactory
+from restaurant_app.orders.models import Order
+from restaurant_app.orders.tests.factories import LineItemFactory
+from restaurant_app.orders.tests.factories import OrderFactory
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+
+
+class TestOrderViewSet:
+    @pytest.fixture
+    def api_client(self, user: User) -> APIClient:
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    @pytest.fixture
+    def item(self, db) -> Item:
+        return ItemFactory(price=Decimal("8.00"))
+
+    def _payload(self, item: Item, modifiers=()) -> dict:
+        return {
+            "restaurant": item.category.restaurant.slug,
+            "lines": [
+                {
+                    "item": item.pk,
+                    "quantity": 2,
+                    "modifiers": [m.pk for m in modifiers],
+                },
+                {"item": item.pk},
+            ],
+        }
+
+    def test_create(self, api_client: APIClient, item: Item):
+        modifier = ModifierFactory(item=item, price=Decimal("1.00"))
+
+        response = api_client.post(
+            reverse("api:order-list"),
+            self._payload(item, [modifier]),
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.CREATED
+        data = response.json()
+        assert data["total"] == "26.00"
+        assert data["status"] == Order.Status.NEW
+        assert [line["quantity"] for line in data["lines"]] == [2, 1]
+        assert data["lines"][0]["modifiers"] == [
+            {"modifier": modifier.pk, "name": modifier.name, "price": "1.00"},
+        ]
+        assert Order.objects.get().lines.count() == len(data["lines"])
+
+    def test_create_query_count(
+        self,
+        api_client: APIClient,
+        item: Item,
+        django_assert_num_queries,
+    ):
+        modifier = ModifierFactory(item=item)
+        payload = self._payload(item, [modifier])
+        payload["lines"] *= 15
+
+        # Restaurant, items and modifiers lookups, then savepoint, order, lines,
+        # modifiers and release; no per-line queries.
+        with django_assert_num_queries(8):
+            response = api_client.post(
+                reverse("api:order-list"),
+                payload,
+                format="json",
+            )
+
+        assert response.status_code == HTTPStatus.CREATED
+
+    def test_retry_is_replayed(
+        self,
+        api_client: APIClient,
+        item: Item,
+        django_assert_num_queries,
+    ):
+        url = reverse("api:order-list")
+        first = api_client.post(
+            url,
+            self._payload(item),
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="order-1",
+        )
+
+        with django_assert_num_queries(0):
+            retry = api_client.post(
+                url,
+                self._payload(item),
+                format="json",
+                HTTP_IDEMPOTENCY_KEY="order-1",
+            )
+
+        assert retry.status_code == HTTPStatus.CREATED
+        assert retry["Idempotent-Replayed"] == "true"
+        assert retry.json() == first.json()
+        assert Order.objects.count() == 1
+
+    def test_retry_after_cache_eviction(self, api_client: APIClient, item: Item):
+        url = reverse("api:order-list")
+        first = api_client.post(
+            url,
+            self._payload(item),
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="order-1",
+        )
+        cache.clear()
+
+        retry = api_client.post(
+            url,
+            self._payload(item),
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="order-1",
+        )
+
+        assert retry.status_code == HTTPStatus.CREATED
+        assert retry["Idempotent-Replayed"] == "true"
+        assert retry.json() == first.json()
+        assert Order.objects.count() == 1
+
+    def test_key_reused_for_another_order(self, api_client: APIClient, item: Item):
+        url = reverse("api:order-list")
+        api_client.post(
+            url,
+            self._payload(item),
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="order-1",
+        )
+        payload = self._payload(item)
+        payload["notes"] = "No onions"
+
+        response = api_client.post(
+            url,
+            payload,
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="order-1",
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert Order.objects.count() == 1
+
+    def test_unavailable_item(self, api_client: APIClient, item: Item):
+        other = ItemFactory(is_available=False, category=item.category)
+        foreign = ItemFactory()
+        payload = self._payload(item)
+        payload["lines"] += [{"item": other.pk}, {"item": foreign.pk}]
+
+        response = api_client.post(reverse("api:order-list"), payload, format="json")
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()["lines"]
+        assert errors[:2] == [{}, {}]
+        assert "item" in errors[2]
+        assert "item" in errors[3]
+        assert not Order.objects.exists()
+
+    def test_modifier_of_another_item(self, api_client: APIClient, item: Item):
+        modifier = ModifierFactory()
+
+        response = api_client.post(
+            reverse("api:order-list"),
+            self._payload(item, [modifier]),
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert "modifiers" in response.json()["lines"][0]
+
+    def test_create_throttled(self, api_client: APIClient, item: Item, settings):
+        settings.RATELIMIT_ENABLED = True
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {
+                **settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+                "orders": "1/minute",
+            },
+        }
+        url = reverse("api:order-list")
+
+        assert api_client.post(url, self._payload(item), format="json").status_code == (
+            HTTPStatus.CREATED
+        )
+        assert api_client.post(url, self._payload(item), format="json").status_code == (
+            HTTPStatus.TOO_MANY_REQUESTS
+        )
+        assert api_client.get(url).status_code == HTTPStatus.OK
+
+    def test_list_own_orders(self, api_client: APIClient, user: User):
+        line = LineItemFactory(order__placed_by=user)
+        LineItemFactory()
+
+        response = api_client.get(reverse("api:order-list"))
+
+        assert response.status_code == HTTPStatus.OK
+        (order,) = response.json()["results"]
+        assert order["id"] == line.order.pk
+        assert order["lines"][0]["name"] == line.name
+
+    def test_list_pages_by_cursor(self, api_client: APIClient, user: User):
+        orders = OrderFactory.create_batch(5, placed_by=user)
+
+        response = api_client.get(reverse("api:order-list"), {"page_size": 2})
+        pages = [response.json()]
+        while pages[-1]["next"]:
+            pages.append(api_client.get(pages[-1]["next"]).json())
+
+        ids = [order["id"] for page in pages for order in page["results"]]
+        assert ids == sorted((order.pk for order in orders), reverse=True)
+        assert len(pages) == 3  # noqa: PLR2004
+
+    def test_list_sparse_fields(self, api_client: APIClient, user: User):
+        LineItemFactory(order__placed_by=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(
+                reverse("api:order-list"),
+                {"fields": "id,restaurant,total"},
+            )
+
+        assert response.status_code == HTTPStatus.OK
+        (order,) = response.json()["results"]
+        assert set(order) == {"id", "restaurant", "total"}
+        # No lines prefetched, and only the columns asked for.
+        (query,) = queries.captured_queries
+        assert '"orders_order"."status"' not in query["sql"]
+        assert '"menu_restaurant"."slug"' in query["sql"]
+
+    def test_unknown_fields(self, api_client: APIClient):
+        response = api_client.get(reverse("api:order-list"), {"fields": "id,secret"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {"fields": ["Unknown fields: secret."]}
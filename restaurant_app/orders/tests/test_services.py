@@ -0,0 +1,84 @@
+from decimal import Decimal
+
+import pytest
+from django.db import IntegrityError
+
+from restaurant_app.menu.tests.factories import ItemFactory
+from restaurant_app.orders.models import LineItemModifier
+from restaurant_app.orders.models import Order
+from restaurant_app.orders.services import place_order
+from restaurant_app.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+LINES = 20
+
+
+def _lines(count: int, modifiers: int = 2) -> list[dict]:
+    item = ItemFactory()
+    return [
+        {
+            "item_id": item.pk,
+            "name": item.name,
+            "unit_price": Decimal("10.00"),
+            "quantity": 2,
+            "notes": "",
+            "modifiers": [
+                {"modifier_id": None, "name": f"Extra {n}", "price": Decimal("0.50")}
+                for n in range(modifiers)
+            ],
+        }
+        for _ in range(count)
+    ]
+
+
+class TestPlaceOrder:
+    def test_inserts_in_bulk(self, user: User, django_assert_num_queries):
+        lines = _lines(LINES)
+        restaurant = ItemFactory().category.restaurant
+
+        # Savepoint, order, lines, modifiers, release: independent of the size.
+        with django_assert_num_queries(5):
+            order = place_order(restaurant=restaurant, placed_by=user, lines=lines)
+
+        assert order.lines.count() == LINES
+        modifiers = LineItemModifier.objects.filter(line__order=order)
+        assert modifiers.count() == LINES * 2
+        assert [len(line.modifier_list) for line in order.line_list] == [2] * LINES
+
+    def test_total(self, user: User):
+        restaurant = ItemFactory().category.restaurant
+
+        order = place_order(restaurant=restaurant, placed_by=user, lines=_lines(3))
+
+        assert order.total == Decimal("66.00")
+        order.refresh_from_db()
+        assert order.total == Decimal("66.00")
+
+    def test_idempotency_key_is_unique_per_user(self, user: User):
+        restaurant = ItemFactory().category.restaurant
+        place_order(
+            restaurant=restaurant,
+            placed_by=user,
+            lines=_lines(1),
+            idempotency_key="abc",
+        )
+
+        with pytest.raises(IntegrityError):
+            place_order(
+                restaurant=restaurant,
+                placed_by=user,
+                lines=_lines(1),
+                idempotency_key="abc",
+            )
+
+        assert Order.objects.filter(placed_by=user).count() == 1
+        # Orders without a key, or with another user's key, don't collide.
+        place_order(restaurant=restaurant, placed_by=user, lines=_lines(1))
+        place_order(restaurant=restaurant, placed_by=user, lines=_lines(1))
+        place_order(
+            restaurant=restaurant,
+            placed_by=None,
+            lines=_lines(1),
+            idempotency_key="abc",
+        )
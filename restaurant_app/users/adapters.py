@@ -3,8 +3,13 @@ from __future__ import annotations
 import typing
 
 from allauth.account.adapter import DefaultAccountAdapter
+from allauth.core import context as allauth_context
 from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
 from django.conf import settings
+from django.contrib.sites.shortcuts import get_current_site
+from rest_framework.throttling import BaseThrottle
+
+from restaurant_app.core.mail import send_later
 
 if typing.TYPE_CHECKING:
     from allauth.socialaccount.models import SocialLogin
@@ -17,6 +22,35 @@ class AccountAdapter(DefaultAccountAdapter):
     def is_open_for_signup(self, request: HttpRequest) -> bool:
         return getattr(settings, "ACCOUNT_ALLOW_REGISTRATION", True)
 
+    def send_mail(
+        self,
+        template_prefix: str,
+        email: str,
+        context: dict[str, typing.Any],
+    ) -> None:
+        """
+        Render the mail as allauth does, but queue it instead of sending it.
+
+        Sending takes a round trip to SES, up to ``EMAIL_TIMEOUT`` seconds, in
+        the signup, login and password reset requests; see
+        ``restaurant_app.core.mail``.
+        """
+        ctx = {
+            "email": email,
+            "current_site": get_current_site(allauth_context.request),
+            **context,
+        }
+        send_later(self.render_mail(template_prefix, email, ctx))
+
+    def get_client_ip(self, request: HttpRequest) -> str:
+        """
+        The address DRF's throttles key on, going by ``NUM_PROXIES``.
+
+        allauth takes the first X-Forwarded-For entry, which the client
+        chooses: changing it would get around the limits per IP.
+        """
+        return BaseThrottle().get_ident(request)  # type: ignore[arg-type]
+
 
 class SocialAccountAdapter(DefaultSocialAccountAdapter):
     def is_open_for_signup(
@@ -0,0 +1,65 @@
+"""
+DRF's ``obtain_auth_token``, rate limited like the allauth login form.
+
+Credentials are checked as ``AccountAdapter.authenticate()`` does, which
+consumes the ``ACCOUNT_RATE_LIMITS["login_failed"]`` limits, per client IP and
+per username, before hashing anything. Over a limit, the request gets a 429
+without a password being hashed. The form and this endpoint share the limits.
+On top of that, the "auth" throttle limits every request per client IP.
+"""
+
+from allauth.account.adapter import get_adapter
+from allauth.account.auth_backends import AuthenticationBackend
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from rest_framework.authtoken import serializers as authtoken_serializers
+from rest_framework.authtoken import views
+from rest_framework.exceptions import Throttled
+
+from restaurant_app.core.api.throttling import ScopedRateThrottle
+
+
+def authenticate(request, **credentials):
+    """
+    ``AccountAdapter.authenticate()``, with allauth's backend only.
+
+    ``AUTHENTICATION_BACKENDS`` also has ``ModelBackend``, for the admin: going
+    through both would hash a wrong password twice. Inactive users are refused.
+    """
+    adapter = get_adapter(request)
+    adapter.pre_authenticate(request, **credentials)
+    user = AuthenticationBackend().authenticate(request, **credentials)
+    # The backend sets aside inactive users with the right password, for the
+    # login form to tell them so; they don't get a token.
+    AuthenticationBackend.unstash_authenticated_user()
+    if user is None:
+        adapter.authentication_failed(request, **credentials)
+    else:
+        adapter._delete_login_attempts_cached_email(request, **credentials)  # noqa: SLF001
+    return user
+
+
+class AuthTokenSerializer(authtoken_serializers.AuthTokenSerializer):
+    def validate(self, attrs):
+        request = self.context["request"]
+        try:
+            user = authenticate(
+                request,
+                username=attrs["username"],
+                password=attrs["password"],
+            )
+        except DjangoValidationError as exc:
+            raise Throttled(detail=exc.messages[0]) from exc
+        if user is None:
+            msg = _("Unable to log in with provided credentials.")
+            raise serializers.ValidationError(msg, code="authorization")
+        attrs["user"] = user
+        return attrs
+
+
+class ObtainAuthToken(views.ObtainAuthToken):
+    serializer_class = AuthTokenSerializer
+    # DRF's view turns throttling off.
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "auth"
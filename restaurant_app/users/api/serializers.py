@@ -1,9 +1,13 @@
 from rest_framework import serializers
 
+from restaurant_app.core.api.fieldsets import SparseFieldsetSerializerMixin
 from restaurant_app.users.models import User
 
 
-class UserSerializer(serializers.ModelSerializer[User]):
+class UserSerializer(
+    SparseFieldsetSerializerMixin,
+    serializers.ModelSerializer[User],
+):
     class Meta:
         model = User
         fields = ["username", "name", "url"]
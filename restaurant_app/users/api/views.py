@@ -1,26 +1,73 @@
+from adrf.viewsets import GenericViewSet
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.mixins import ListModelMixin
 from rest_framework.mixins import RetrieveModelMixin
 from rest_framework.mixins import UpdateModelMixin
 from rest_framework.response import Response
-from rest_framework.viewsets import GenericViewSet
 
+from restaurant_app.core.api.fieldsets import SparseFieldsetMixin
+from restaurant_app.core.api.values import ValuesListMixin
+from restaurant_app.core.http import make_etag
 from restaurant_app.users.models import User
 
 from .serializers import UserSerializer
 
 
-class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericViewSet):
+def _profile(request, username=None):
+    # Only the current user is visible, and it's already loaded.
+    user = request.user
+    return user if username in (None, user.username) else None
+
+
+def _profile_etag(request, username=None):
+    user = _profile(request, username)
+    return None if user is None else make_etag(request, user.pk, user.updated)
+
+
+def _profile_last_modified(request, username=None):
+    user = _profile(request, username)
+    return None if user is None else user.updated
+
+
+# Clients revalidate every time, and get a 304 without a query or serializing.
+profile_caching = [
+    cache_control(private=True, no_cache=True),
+    condition(etag_func=_profile_etag, last_modified_func=_profile_last_modified),
+]
+
+
+# The updates are single-row and don't need a request-wide transaction.
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+@method_decorator(profile_caching, name="retrieve")
+class UserViewSet(
+    SparseFieldsetMixin,
+    ValuesListMixin,
+    RetrieveModelMixin,
+    ListModelMixin,
+    UpdateModelMixin,
+    GenericViewSet,
+):
     serializer_class = UserSerializer
     queryset = User.objects.all()
     lookup_field = "username"
+    ordering = ("id",)
 
     def get_queryset(self, *args, **kwargs):
         assert isinstance(self.request.user.id, int)
         return self.queryset.filter(id=self.request.user.id)
 
     @action(detail=False)
-    def me(self, request):
+    async def me(self, request):
+        return await self.profile(request)
+
+    # Not on me() itself: until Django 5.1 method_decorator() hides that a
+    # method is async, and adrf would then serve the viewset synchronously.
+    @method_decorator(profile_caching)
+    async def profile(self, request):
         serializer = UserSerializer(request.user, context={"request": request})
         return Response(status=status.HTTP_200_OK, data=serializer.data)
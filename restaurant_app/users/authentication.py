@@ -0,0 +1,83 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from restaurant_app.core.cache import LocalCache
+from restaurant_app.users.models import User
+
+_local_tokens = LocalCache(
+    max_size=settings.TOKEN_AUTH_LOCAL_SIZE,
+    ttl=settings.TOKEN_AUTH_LOCAL_TTL,
+)
+
+
+# Everything but the password hash, which has no business in a shared cache.
+# The rest of what the API reads about a user comes without a query.
+USER_FIELDS = [
+    field.attname
+    for field in User._meta.fields  # noqa: SLF001
+    if field.concrete and field.attname != "password"
+]
+
+
+def token_cache_key(key: str) -> str:
+    # Hashed, so that raw tokens don't show up in cache key listings.
+    return f"auth:token:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    ``TokenAuthentication`` that remembers the user a token belongs to.
+
+    Tokens are looked up in a small per-process LRU, then in the default cache,
+    and only then in the database. Deleting a token, or saving its user (which
+    includes deactivating them), evicts it from the shared cache and from this
+    process' LRU once the change commits. Other processes drop their copy
+    within ``TOKEN_AUTH_LOCAL_TTL`` seconds; set it to 0 to skip the LRU.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        values = _local_tokens.get(cache_key)
+        if values is None:
+            values = cache.get(cache_key)
+            # Cached by a release with other User columns: look it up again.
+            if values is None or values.keys() != set(USER_FIELDS):
+                user, _ = super().authenticate_credentials(key)
+                values = {name: getattr(user, name) for name in USER_FIELDS}
+                cache.set(cache_key, values, settings.TOKEN_AUTH_CACHE_TIMEOUT)
+            _local_tokens.set(cache_key, values)
+        return credentials_from_values(key, values)
+
+
+def credentials_from_values(key: str, values: dict) -> tuple[User, Token]:
+    """
+    ``(user, token)`` rebuilt from the cached column values, as if loaded from
+    the primary: a user read from a replica must not be saved back to it. The
+    password is deferred, and read from the database if anything asks for it.
+    """
+    user = User.from_db(
+        DEFAULT_DB_ALIAS,
+        USER_FIELDS,
+        [values[name] for name in USER_FIELDS],
+    )
+    token = Token.from_db(DEFAULT_DB_ALIAS, ["key", "user_id"], [key, user.pk])
+    token.user = user
+    return user, token
+
+
+def invalidate_tokens(keys) -> None:
+    cache_keys = [token_cache_key(key) for key in keys]
+    cache.delete_many(cache_keys)
+    for cache_key in cache_keys:
+        _local_tokens.delete(cache_key)
+
+
+def invalidate_user_tokens(user_id: int) -> None:
+    invalidate_tokens(
+        Token.objects.filter(user_id=user_id).values_list("key", flat=True),
+    )
@@ -0,0 +1,313 @@
+"""
+Bulk user import and export, for ``manage.py import_users`` and
+``manage.py export_users``.
+
+Files are CSV with a header row, or JSON Lines with one object per user, with
+the columns in ``FIELDS``. Only ``username`` is required. On import,
+``password`` is a raw password, hashed there; ``password_hash`` is one hashed
+already, e.g. by an export. Users with neither can't log in until they reset
+their password.
+
+Both directions stream: rows are read, hashed and inserted ``batch_size`` at
+a time, and exports read users through a server-side cursor, so memory stays
+flat however many users there are. Password hashing, which is nearly all of
+an import's time with Argon2, runs on a process pool while the previous batch
+is written.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+
+import django
+import orjson
+from allauth.account import app_settings as allauth_settings
+from allauth.account.models import EmailAddress
+from django.contrib.auth.hashers import identify_hasher
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from restaurant_app.users.models import User
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from _typeshed import SupportsWrite
+
+FORMATS = ("csv", "jsonl")
+FIELDS = ["username", "email", "name", "is_active", "is_staff", "password_hash"]
+IMPORT_FIELDS = [*FIELDS, "password"]
+TRUE = {"1", "true", "yes", "y", "t"}
+FALSE = {"", "0", "false", "no", "n", "f"}
+
+
+class InvalidRowError(ValueError):
+    pass
+
+
+@dataclass
+class Report:
+    """What an import or export did."""
+
+    users: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def per_second(self) -> float:
+        return self.users / self.seconds if self.seconds else 0.0
+
+
+def format_for(path: str) -> str:
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def read_rows(stream: IO[str], fmt: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """``(line number, row)`` for each row of a CSV or JSON Lines stream."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            yield number, {"": f"not JSON: {exc}"}
+            continue
+        yield number, row if isinstance(row, dict) else {"": "not an object"}
+
+
+def _flag(value: Any, *, default: bool) -> bool:
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE:
+        return True
+    if text in FALSE:
+        return text == "" and default
+    msg = f"{value!r} isn't a boolean"
+    raise InvalidRowError(msg)
+
+
+def build_user(row: dict[str, Any]) -> tuple[User, str | None]:
+    """
+    An unsaved user from ``row``, and the raw password to hash for it.
+
+    Emails are lowercased as allauth does at signup, and usernames too unless
+    ``ACCOUNT_PRESERVE_USERNAME_CASING`` is on. Raises ``InvalidRowError``.
+    """
+    if "" in row:
+        raise InvalidRowError(row[""])
+    unknown = set(row) - set(IMPORT_FIELDS)
+    if unknown:
+        msg = f"unknown columns {', '.join(sorted(unknown))}"
+        raise InvalidRowError(msg)
+    username = (row.get("username") or "").strip()
+    if not allauth_settings.PRESERVE_USERNAME_CASING:
+        username = username.lower()
+    user = User(
+        username=username,
+        email=(row.get("email") or "").strip().lower(),
+        name=(row.get("name") or "").strip(),
+        is_active=_flag(row.get("is_active"), default=True),
+        is_staff=_flag(row.get("is_staff"), default=False),
+    )
+    raw_password = row.get("password") or None
+    password_hash = row.get("password_hash") or None
+    if raw_password and password_hash:
+        msg = "both password and password_hash"
+        raise InvalidRowError(msg)
+    if password_hash:
+        try:
+            identify_hasher(password_hash)
+        except ValueError as exc:
+            msg = "password_hash isn't a known hash"
+            raise InvalidRowError(msg) from exc
+        user.password = password_hash
+    elif not raw_password:
+        user.set_unusable_password()
+    try:
+        # Uniqueness is checked a batch at a time, see UserImporter.
+        user.clean_fields(exclude=["password"])
+    except ValidationError as exc:
+        msg = "; ".join(
+            f"{name}: {' '.join(errors)}" for name, errors in exc.message_dict.items()
+        )
+        raise InvalidRowError(msg) from exc
+    return user, raw_password
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    return [make_password(password) for password in passwords]
+
+
+def _setup_worker() -> None:
+    # A no-op in forked workers; spawned ones start without Django.
+    django.setup()
+
+
+@dataclass
+class _Batch:
+    users: list[User]
+    raw_passwords: list[str | None]
+    hashes: list[Future] | None = None
+
+
+class UserImporter:
+    """
+    Create users from rows, ``batch_size`` per ``bulk_create()``.
+
+    Rows whose username or email is taken, by an existing user or an earlier
+    row, are skipped. With ``verified``, users get a primary, verified
+    ``EmailAddress``, so they can log in without confirming their email
+    first. ``workers`` processes hash the passwords; with 0, they're hashed
+    in this one.
+    """
+
+    def __init__(self, *, batch_size: int, workers: int, verified: bool):
+        self.batch_size = batch_size
+        self.workers = workers
+        self.verified = verified
+        self.report = Report()
+        self.pool: ProcessPoolExecutor | None = None
+
+    def run(self, rows: Iterable[tuple[int, dict[str, Any]]]) -> Report:
+        started = time.perf_counter()
+        if self.workers:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_setup_worker)
+        try:
+            # Hash a batch while the one before it is written.
+            pending: deque[_Batch] = deque()
+            for batch in self.batches(rows):
+                self.start_hashing(batch)
+                pending.append(batch)
+                if len(pending) > 1:
+                    self.write(pending.popleft())
+            while pending:
+                self.write(pending.popleft())
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown(cancel_futures=True)
+        self.report.seconds = time.perf_counter() - started
+        return self.report
+
+    def batches(self, rows: Iterable[tuple[int, dict[str, Any]]]) -> Iterator[_Batch]:
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, self.batch_size)):
+            batch = _Batch([], [])
+            for number, row in chunk:
+                try:
+                    user, raw_password = build_user(row)
+                except InvalidRowError as exc:
+                    self.report.errors.append(f"Line {number}: {exc}")
+                    continue
+                batch.users.append(user)
+                batch.raw_passwords.append(raw_password)
+            yield batch
+
+    def start_hashing(self, batch: _Batch) -> None:
+        passwords = [password for password in batch.raw_passwords if password]
+        if not passwords or self.pool is None:
+            return
+        size = -(-len(passwords) // self.workers)
+        batch.hashes = [
+            self.pool.submit(hash_passwords, passwords[start : start + size])
+            for start in range(0, len(passwords), size)
+        ]
+
+    def write(self, batch: _Batch) -> None:
+        passwords = [password for password in batch.raw_passwords if password]
+        if batch.hashes is not None:
+            hashes = iter([h for future in batch.hashes for h in future.result()])
+        else:
+            hashes = iter(hash_passwords(passwords))
+        for user, raw_password in zip(batch.users, batch.raw_passwords, strict=True):
+            if raw_password:
+                user.password = next(hashes)
+
+        users = self.new_users(batch.users)
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=self.batch_size)
+            if self.verified:
+                EmailAddress.objects.bulk_create(
+                    [
+                        EmailAddress(
+                            user=user,
+                            email=user.email,
+                            primary=True,
+                            verified=True,
+                        )
+                        for user in users
+                        if user.email
+                    ],
+                    batch_size=self.batch_size,
+                )
+        self.report.users += len(users)
+        self.report.skipped += len(batch.users) - len(users)
+
+    def new_users(self, users: list[User]) -> list[User]:
+        usernames = {user.username for user in users}
+        emails = {user.email for user in users if user.email}
+        taken_usernames = set(
+            User.objects.filter(username__in=usernames).values_list(
+                "username",
+                flat=True,
+            ),
+        )
+        taken_emails = set(
+            User.objects.filter(email__in=emails).values_list("email", flat=True),
+        ) | set(
+            EmailAddress.objects.filter(email__in=emails).values_list(
+                "email",
+                flat=True,
+            ),
+        )
+        new = []
+        for user in users:
+            if user.username in taken_usernames or user.email in taken_emails:
+                continue
+            taken_usernames.add(user.username)
+            if user.email:
+                taken_emails.add(user.email)
+            new.append(user)
+        return new
+
+
+def export_users(stream: SupportsWrite[str], fmt: str, *, chunk_size: int) -> Report:
+    """Write every user to ``stream``, reading ``chunk_size`` rows at a time."""
+    started = time.perf_counter()
+    report = Report()
+    rows = User.objects.order_by("pk").values_list(*FIELDS[:-1], "password")
+    writer = csv.writer(stream) if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(FIELDS)
+    # In a transaction, PostgreSQL keeps the cursor's rows where they are
+    # instead of copying out all of them when the statement's autocommit ends.
+    with transaction.atomic():
+        for row in rows.iterator(chunk_size=chunk_size):
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                line = orjson.dumps(dict(zip(FIELDS, row, strict=True)))
+                stream.write(line.decode() + "\n")
+            report.users += 1
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """
+    Django's Argon2 hasher with its parameters taken from ``ARGON2_TIME_COST``,
+    ``ARGON2_MEMORY_COST`` and ``ARGON2_PARALLELISM``.
+
+    The algorithm is still "argon2", so hashes made with other parameters keep
+    verifying, and Django rehashes them with the current ones when their users
+    log in. ``manage.py tune_argon2`` picks parameters for the hardware.
+    """
+
+    @property  # type: ignore[override]
+    def time_cost(self) -> int:
+        return settings.ARGON2_TIME_COST
+
+    @property  # type: ignore[override]
+    def memory_cost(self) -> int:
+        return settings.ARGON2_MEMORY_COST
+
+    @property  # type: ignore[override]
+    def parallelism(self) -> int:
+        return settings.ARGON2_PARALLELISM
@@ -0,0 +1,94 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+# KiB. OWASP's lowest recommended memory cost, 19 MiB with a time cost of 2.
+MIN_MEMORY_COST = 19 * 1024
+
+
+def _hash_ms(hasher: Argon2PasswordHasher, samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.encode("correct horse battery staple", hasher.salt())
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Time Argon2 hashes on this machine and print the ARGON2_* settings "
+        "with the highest time cost that stays within --target-ms. Starts from "
+        "the configured memory cost and halves it while even a time cost of 1 "
+        "is too slow. Run it where the web workers run, with nothing else busy."
+    )
+    requires_system_checks: list[str] = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=250.0,
+            help="Longest acceptable hash, in milliseconds.",
+        )
+        parser.add_argument(
+            "--memory-cost",
+            type=int,
+            default=settings.ARGON2_MEMORY_COST,
+            help="KiB to start from. Defaults to the ARGON2_MEMORY_COST setting.",
+        )
+        parser.add_argument(
+            "--parallelism",
+            type=int,
+            default=settings.ARGON2_PARALLELISM,
+            help="Defaults to the ARGON2_PARALLELISM setting.",
+        )
+        parser.add_argument("--max-time-cost", type=int, default=10)
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=5,
+            help="Hashes timed per candidate; the median counts.",
+        )
+
+    def handle(self, *args, **options):
+        hasher = Argon2PasswordHasher()
+        hasher.parallelism = options["parallelism"]
+        memory_cost = max(options["memory_cost"], MIN_MEMORY_COST)
+        target = options["target_ms"]
+        self.stdout.write(
+            f"{'time':>4} {'memory KiB':>10} {'parallelism':>11} {'ms':>8}",
+        )
+
+        best = None
+        while best is None:
+            hasher.memory_cost = memory_cost
+            for time_cost in range(1, options["max_time_cost"] + 1):
+                hasher.time_cost = time_cost
+                elapsed = _hash_ms(hasher, options["samples"])
+                self.stdout.write(
+                    f"{time_cost:>4} {memory_cost:>10} {hasher.parallelism:>11} "
+                    f"{elapsed:>8.1f}",
+                )
+                if elapsed > target:
+                    break
+                best = (time_cost, memory_cost, elapsed)
+            if best is None:
+                if memory_cost // 2 < MIN_MEMORY_COST:
+                    msg = (
+                        f"Even {MIN_MEMORY_COST} KiB with a time cost of 1 takes "
+                        f"over {target:g} ms; raise --target-ms."
+                    )
+                    raise CommandError(msg)
+                memory_cost //= 2
+
+        time_cost, memory_cost, elapsed = best
+        self.stdout.write("")
+        self.stdout.write(f"About {elapsed:.0f} ms per hash:")
+        self.stdout.write(f"DJANGO_ARGON2_TIME_COST={time_cost}")
+        self.stdout.write(f"DJANGO_ARGON2_MEMORY_COST={memory_cost}")
+        self.stdout.write(f"DJANGO_ARGON2_PARALLELISM={hasher.parallelism}")
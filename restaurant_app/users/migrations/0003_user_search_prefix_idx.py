@@ -0,0 +1,27 @@
+from django.db import migrations
+
+# The admin's prefix search on users: istartswith compares UPPER(column::text)
+# with LIKE 'PREFIX%', which only an index on that expression, with
+# text_pattern_ops, can serve. Raw SQL, as Django can't declare an operator
+# class on an expression without django.contrib.postgres installed.
+FIELDS = ["username", "name", "email"]
+
+
+class Migration(migrations.Migration):
+    # Users is a big table: build the indexes without blocking signups and logins.
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_user_updated'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "users_user_{field}_prefix_idx" '
+                f'ON "users_user" ((UPPER("{field}"::text)) text_pattern_ops)'
+            ),
+            reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS "users_user_{field}_prefix_idx"',
+        )
+        for field in FIELDS
+    ]
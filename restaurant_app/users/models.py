@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db.models import CharField
+from django.db.models import DateTimeField
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -15,6 +16,9 @@ class User(AbstractUser):
     name = CharField(_("Name of User"), blank=True, max_length=255)
     first_name = None  # type: ignore[assignment]
     last_name = None  # type: ignore[assignment]
+    # The profile's validator for conditional GETs. Logins only save last_login,
+    # which leaves it alone.
+    updated = DateTimeField(_("Updated"), auto_now=True)
 
     def get_absolute_url(self) -> str:
         """Get URL for user's detail view.
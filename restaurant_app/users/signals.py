@@ -0,0 +1,27 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_tokens
+from .authentication import invalidate_user_tokens
+from .models import User
+
+# Cached tokens are evicted after the commit, so that a request racing the
+# change can't put the old rows back into the cache.
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    transaction.on_commit(partial(invalidate_tokens, [instance.key]), robust=True)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    # Logging in only touches last_login, which the API doesn't rely on.
+    if created or (update_fields is not None and set(update_fields) <= {"last_login"}):
+        return
+    transaction.on_commit(partial(invalidate_user_tokens, instance.pk), robust=True)
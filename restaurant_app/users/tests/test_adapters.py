@@ -0,0 +1,64 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from allauth.account.models import EmailAddress
+from django.core import mail
+from django.test import Client
+from django.urls import reverse
+
+from restaurant_app.users.adapters import AccountAdapter
+from restaurant_app.users.models import User
+
+SIGNUP = {
+    "username": "cook",
+    "email": "cook@example.com",
+    "password1": "a-long-enough-password",
+    "password2": "a-long-enough-password",
+}
+
+
+@pytest.mark.django_db
+def test_signup_sends_confirmation_mail(client, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(reverse("account_signup"), SIGNUP)
+
+    assert response.status_code == HTTPStatus.FOUND
+    (message,) = mail.outbox
+    assert message.to == ["cook@example.com"]
+    assert "/accounts/confirm-email/" in message.body
+
+
+@pytest.mark.django_db(transaction=True)
+def test_no_confirmation_mail_when_signup_rolls_back(settings):
+    client = Client(raise_request_exception=False)
+
+    with mock.patch.object(
+        AccountAdapter,
+        "respond_email_verification_sent",
+        side_effect=RuntimeError,
+    ):
+        response = client.post(reverse("account_signup"), SIGNUP)
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert not User.objects.exists()
+    assert not EmailAddress.objects.exists()
+    # The 500 is mailed to ADMINS; the confirmation mail isn't sent.
+    assert [message.to for message in mail.outbox] == [
+        [email for _, email in settings.ADMINS],
+    ]
+
+
+@pytest.mark.parametrize(
+    ("num_proxies", "expected"),
+    [(0, "10.0.0.2"), (1, "192.0.2.1")],
+)
+def test_client_ip(rf, settings, num_proxies, expected):
+    settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "NUM_PROXIES": num_proxies}
+    request = rf.post(
+        "/",
+        REMOTE_ADDR="10.0.0.2",
+        HTTP_X_FORWARDED_FOR="203.0.113.9, 192.0.2.1",
+    )
+
+    assert AccountAdapter().get_client_ip(request) == expected
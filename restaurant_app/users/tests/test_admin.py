@@ -5,10 +5,13 @@ from importlib import reload
 import pytest
 from django.contrib import admin
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from pytest_django.asserts import assertRedirects
 
 from restaurant_app.users.models import User
+from restaurant_app.users.tests.factories import UserFactory
 
 
 class TestUserAdmin:
@@ -22,6 +25,31 @@ class TestUserAdmin:
         response = admin_client.get(url, data={"q": "test"})
         assert response.status_code == HTTPStatus.OK
 
+    def test_search_by_prefix(self, admin_client):
+        alice = UserFactory(username="alice", name="Alice", email="asmith@example.com")
+        UserFactory(username="bob", name="Bob", email="bob@example.com")
+        url = reverse("admin:users_user_changelist")
+
+        for query in ["ALI", "alice", "asm"]:
+            response = admin_client.get(url, data={"q": query})
+            assert list(response.context["cl"].result_list) == [alice]
+        response = admin_client.get(url, data={"q": "lice"})
+        assert not response.context["cl"].result_list
+
+    def test_changelist_queries(self, admin_client):
+        UserFactory.create_batch(3)
+        url = reverse("admin:users_user_changelist")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get(url, data={"q": "a"})
+
+        assert response.status_code == HTTPStatus.OK
+        sql = [query["sql"] for query in queries.captured_queries]
+        # The search's count only, not the whole table's too.
+        assert sum("COUNT(*)" in query for query in sql) == 1
+        assert '"users_user"."username"' in sql[-1]
+        assert '"users_user"."password"' not in sql[-1]
+
     def test_add(self, admin_client):
         url = reverse("admin:users_user_add")
         response = admin_client.get(url)
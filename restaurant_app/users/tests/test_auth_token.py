@@ -0,0 +1,120 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from django.contrib.auth.hashers import MD5PasswordHasher
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from restaurant_app.users.tests.factories import UserFactory
+
+PASSWORD = "a-long-enough-password"  # noqa: S105
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+def _obtain(api_client, username, password, **extra):
+    return api_client.post(
+        "/api/auth-token/",
+        {"username": username, "password": password},
+        **extra,
+    )
+
+
+@pytest.mark.django_db
+def test_obtain_token(api_client):
+    user = UserFactory(password=PASSWORD)
+
+    response = _obtain(api_client, user.username, PASSWORD)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["token"] == user.auth_token.key
+
+
+@pytest.mark.django_db
+def test_wrong_password(api_client):
+    user = UserFactory(password=PASSWORD)
+
+    response = _obtain(api_client, user.username, "wrong")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("exists", [True, False])
+def test_wrong_password_hashed_once(api_client, exists):
+    user = UserFactory.build(password=PASSWORD)
+    if exists:
+        user.save()
+    with mock.patch.object(
+        MD5PasswordHasher,
+        "encode",
+        autospec=True,
+        side_effect=MD5PasswordHasher.encode,
+    ) as encode:
+        response = _obtain(api_client, user.username, "wrong")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert encode.call_count == 1
+
+
+@pytest.mark.django_db
+def test_inactive_user(api_client):
+    user = UserFactory(password=PASSWORD, is_active=False)
+
+    response = _obtain(api_client, user.username, PASSWORD)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_limited_per_username_before_hashing(api_client, settings):
+    settings.ACCOUNT_RATE_LIMITS = {"login_failed": "2/m/key"}
+    user = UserFactory(password=PASSWORD)
+    for _ in range(2):
+        _obtain(api_client, user.username, "wrong")
+    with mock.patch("django.contrib.auth.base_user.check_password") as check:
+        response = _obtain(api_client, user.username, PASSWORD)
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    check.assert_not_called()
+    assert _obtain(api_client, "someone-else", "wrong").status_code == (
+        HTTPStatus.BAD_REQUEST
+    )
+
+
+@pytest.mark.django_db
+def test_limited_per_ip(api_client, settings):
+    settings.ACCOUNT_RATE_LIMITS = {"login_failed": "2/m/ip"}
+    for number in range(2):
+        _obtain(api_client, f"user{number}", "wrong")
+
+    assert _obtain(api_client, "user", "wrong").status_code == (
+        HTTPStatus.TOO_MANY_REQUESTS
+    )
+    other_ip = {"REMOTE_ADDR": "192.0.2.1"}
+    assert _obtain(api_client, "user", "wrong", **other_ip).status_code == (
+        HTTPStatus.BAD_REQUEST
+    )
+
+
+@pytest.mark.django_db
+def test_login_clears_attempts(api_client, settings):
+    settings.ACCOUNT_RATE_LIMITS = {"login_failed": "2/m/key"}
+    user = UserFactory(password=PASSWORD)
+    _obtain(api_client, user.username, "wrong")
+    _obtain(api_client, user.username, PASSWORD)
+
+    assert _obtain(api_client, user.username, "wrong").status_code == (
+        HTTPStatus.BAD_REQUEST
+    )
@@ -0,0 +1,143 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from restaurant_app.users.authentication import CachedTokenAuthentication
+from restaurant_app.users.authentication import _local_tokens
+from restaurant_app.users.authentication import token_cache_key
+from restaurant_app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    cache.clear()
+    _local_tokens.clear()
+
+
+@pytest.fixture
+def token(user: User) -> Token:
+    return Token.objects.create(user=user)
+
+
+def _me(client, token: Token):
+    return client.get(reverse("api:user-me"), HTTP_AUTHORIZATION=f"Token {token.key}")
+
+
+class TestCachedTokenAuthentication:
+    # SessionAuthentication comes first and sends no WWW-Authenticate header,
+    # so DRF rejects bad credentials with 403 rather than 401.
+
+    def test_queries_saved(self, client, token: Token, django_assert_num_queries):
+        # TokenAuthentication's token + user join, on the first request only.
+        with django_assert_num_queries(1):
+            assert _me(client, token).status_code == HTTPStatus.OK
+        with django_assert_num_queries(0):
+            response = _me(client, token)
+
+        assert response.json()["username"] == token.user.username
+
+    def test_shared_cache(self, client, token: Token, django_assert_num_queries):
+        _me(client, token)
+        _local_tokens.clear()
+
+        with django_assert_num_queries(0):
+            assert _me(client, token).status_code == HTTPStatus.OK
+
+    def test_no_password_in_cache(self, token: Token, django_assert_num_queries):
+        CachedTokenAuthentication().authenticate_credentials(token.key)
+        cached = cache.get(token_cache_key(token.key))
+
+        assert token.user.password not in cached.values()
+        _local_tokens.clear()
+        with django_assert_num_queries(0):
+            user, cached_token = CachedTokenAuthentication().authenticate_credentials(
+                token.key,
+            )
+        assert (user.pk, user.username, user.is_active) == (
+            token.user.pk,
+            token.user.username,
+            True,
+        )
+        assert cached_token.key == token.key
+        assert cached_token.user is user
+        assert user._state.db == "default"  # noqa: SLF001
+        # Deferred, and loaded from the database when needed.
+        assert user.get_deferred_fields() == {"password"}
+        assert user.password == token.user.password
+
+    @pytest.mark.parametrize("change", ["added", "removed"])
+    def test_entry_with_other_fields(
+        self,
+        client,
+        token: Token,
+        change,
+        django_assert_num_queries,
+    ):
+        # As cached by a release whose User had other columns.
+        _me(client, token)
+        cache_key = token_cache_key(token.key)
+        cached = cache.get(cache_key)
+        if change == "added":
+            cached = {**cached, "is_staff": True, "retired": True}
+        else:
+            del cached["updated"]
+        cache.set(cache_key, cached)
+        _local_tokens.clear()
+
+        with django_assert_num_queries(1):
+            response = _me(client, token)
+
+        assert response.status_code == HTTPStatus.OK
+        assert "retired" not in cache.get(cache_key)
+        assert "updated" in cache.get(cache_key)
+
+    def test_invalid_token(self, client, db):
+        response = client.get(reverse("api:user-me"), HTTP_AUTHORIZATION="Token nope")
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        assert response.json() == {"detail": "Invalid token."}
+
+    def test_token_deleted(
+        self,
+        client,
+        token: Token,
+        django_capture_on_commit_callbacks,
+    ):
+        _me(client, token)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            token.delete()
+
+        assert _me(client, token).json() == {"detail": "Invalid token."}
+
+    def test_user_deactivated(
+        self,
+        client,
+        token: Token,
+        django_capture_on_commit_callbacks,
+    ):
+        _me(client, token)
+        user = token.user
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save()
+
+        assert _me(client, token).json() == {"detail": "User inactive or deleted."}
+
+    def test_login_keeps_cache(
+        self,
+        client,
+        token: Token,
+        django_capture_on_commit_callbacks,
+    ):
+        user = token.user
+        _me(client, token)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            user.save(update_fields=["last_login"])
+
+        assert callbacks == []
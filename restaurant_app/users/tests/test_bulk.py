@@ -0,0 +1,157 @@
+from io import StringIO
+
+import orjson
+import pytest
+from allauth.account.models import EmailAddress
+from django.contrib.auth import authenticate
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from restaurant_app.users.models import User
+from restaurant_app.users.tests.factories import UserFactory
+
+PASSWORD = "a-long-enough-password"  # noqa: S105
+
+CSV = f"""username,email,name,is_staff,password
+Alice,ALICE@example.com,Alice Smith,yes,{PASSWORD}
+bob,bob@example.com,Bob,,
+carol,carol@example.com,Carol,maybe,
+,nobody@example.com,,,
+Alice,alice2@example.com,Alice Again,,
+dave,bob@example.com,Dave,,
+"""
+
+
+def _import(tmp_path, content: str, name: str = "users.csv", **options):
+    path = tmp_path / name
+    path.write_text(content)
+    out, err = StringIO(), StringIO()
+    call_command(
+        "import_users",
+        str(path),
+        stdout=out,
+        stderr=err,
+        **{"workers": 0, **options},
+    )
+    return out.getvalue(), err.getvalue()
+
+
+@pytest.mark.django_db
+class TestImportUsers:
+    def test_csv(self, tmp_path):
+        out, err = _import(tmp_path, CSV, batch_size=2)
+
+        assert "Imported 2 users (2 skipped, 2 invalid)" in out
+        assert err.splitlines() == [
+            "Line 4: 'maybe' isn't a boolean",
+            "Line 5: username: This field cannot be blank.",
+        ]
+        alice = User.objects.get(username="Alice")
+        assert alice.email == "alice@example.com"
+        assert alice.is_staff
+        assert alice.is_active
+        assert authenticate(username="Alice", password=PASSWORD) == alice
+        bob = User.objects.get(username="bob")
+        assert not bob.has_usable_password()
+        assert not EmailAddress.objects.exists()
+
+    def test_skips_existing_users(self, tmp_path):
+        UserFactory(username="bob")
+        UserFactory(email="alice@example.com")
+
+        out, _ = _import(tmp_path, CSV)
+
+        assert "Imported 2 users (2 skipped" in out
+        assert User.objects.get(username="Alice").email == "alice2@example.com"
+        assert User.objects.filter(username="dave").exists()
+
+    def test_jsonl_with_workers(self, tmp_path):
+        lines = [
+            {"username": f"user{number}", "password": f"{PASSWORD}{number}"}
+            for number in range(5)
+        ]
+        content = "\n".join(orjson.dumps(line).decode() for line in lines)
+
+        out, err = _import(
+            tmp_path,
+            content + "\n\n[]\n{oops\n",
+            name="users.jsonl",
+            batch_size=2,
+            workers=2,
+            verified=True,
+        )
+
+        assert "Imported 5 users (0 skipped, 2 invalid)" in out
+        assert err.splitlines() == [
+            "Line 7: not an object",
+            "Line 8: not JSON: unexpected character: line 1 column 2 (char 1)",
+        ]
+        for line in lines:
+            assert authenticate(None, **line)
+
+    def test_verified(self, tmp_path):
+        _import(tmp_path, CSV, verified=True)
+
+        emails = EmailAddress.objects.values_list("email", "primary", "verified")
+        assert set(emails) == {
+            ("alice@example.com", True, True),
+            ("bob@example.com", True, True),
+        }
+
+    def test_password_hash(self, tmp_path):
+        content = (
+            "username,password_hash\n"
+            f"alice,{UserFactory.build(password=PASSWORD).password}\n"
+            "bob,not-a-hash\n"
+        )
+
+        _, err = _import(tmp_path, content)
+
+        assert err.splitlines() == ["Line 3: password_hash isn't a known hash"]
+        assert authenticate(username="alice", password=PASSWORD)
+
+    def test_unknown_columns(self, tmp_path):
+        _, err = _import(tmp_path, "username,is_superuser\nalice,1\n")
+
+        assert err.splitlines() == ["Line 2: unknown columns is_superuser"]
+        assert not User.objects.exists()
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(CommandError, match="No such file"):
+            call_command("import_users", str(tmp_path / "missing.csv"))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", ["users.csv", "users.jsonl"])
+def test_export_round_trip(tmp_path, name):
+    UserFactory(username="alice", password=PASSWORD, is_staff=True)
+    UserFactory(username="bob", is_active=False)
+    path = tmp_path / name
+    out = StringIO()
+
+    call_command("export_users", str(path), chunk_size=1, stdout=out)
+    User.objects.all().delete()
+    _, err = _import(tmp_path, path.read_text(), name=name)
+
+    assert "Exported 2 users" in out.getvalue()
+    assert not err
+    assert list(
+        User.objects.order_by("username").values_list(
+            "username",
+            "is_active",
+            "is_staff",
+        ),
+    ) == [("alice", True, True), ("bob", False, False)]
+    assert authenticate(username="alice", password=PASSWORD)
+
+
+@pytest.mark.django_db
+def test_export_to_stdout():
+    UserFactory(username="alice")
+    out, err = StringIO(), StringIO()
+
+    call_command("export_users", format="jsonl", stdout=out, stderr=err)
+
+    (line,) = out.getvalue().splitlines()
+    assert orjson.loads(line)["username"] == "alice"
+    assert "Exported 1 users" in err.getvalue()
@@ -1,8 +1,14 @@
+from http import HTTPStatus
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+from rest_framework.test import APIClient
 from rest_framework.test import APIRequestFactory
 
 from restaurant_app.users.api.views import UserViewSet
 from restaurant_app.users.models import User
+from restaurant_app.users.tests.factories import UserFactory
 
 
 class TestUserViewSet:
@@ -26,10 +32,83 @@ class TestUserViewSet:
 
         view.request = request
 
-        response = view.me(request)  # type: ignore[call-arg, arg-type, misc]
+        response = async_to_sync(view.me)(request)  # type: ignore[call-arg, arg-type]
 
         assert response.data == {
             "username": user.username,
             "url": f"http://testserver/api/users/{user.username}/",
             "name": user.name,
         }
+
+    def test_me_sparse_fields(self, user: User, api_rf: APIRequestFactory):
+        view = UserViewSet()
+        request = api_rf.get("/fake-url/", {"fields": "username"})
+        request.user = user
+
+        view.request = request
+
+        response = async_to_sync(view.me)(request)  # type: ignore[call-arg, arg-type]
+
+        assert response.data == {"username": user.username}
+
+    def test_me_over_asgi(self, user: User, async_client):
+        async_client.force_login(user)
+        response = async_to_sync(async_client.get)(reverse("api:user-me"))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["username"] == user.username
+
+
+class TestConditionalGet:
+    @pytest.fixture
+    def api_client(self, user: User) -> APIClient:
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def test_not_modified(
+        self,
+        user: User,
+        api_client: APIClient,
+        django_assert_num_queries,
+    ):
+        url = reverse("api:user-detail", kwargs={"username": user.username})
+        response = api_client.get(url)
+        assert response["Cache-Control"] == "private, no-cache"
+        assert response["Last-Modified"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_changed(self, user: User, api_client: APIClient):
+        etag = api_client.get(reverse("api:user-me"))["ETag"]
+        user.name = "Renamed"
+        user.save()
+
+        response = api_client.get(reverse("api:user-me"), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["name"] == "Renamed"
+        assert response["ETag"] != etag
+
+    def test_representations(self, api_client: APIClient):
+        url = reverse("api:user-me")
+
+        etags = {
+            api_client.get(url)["ETag"],
+            api_client.get(url, {"fields": "name"})["ETag"],
+        }
+
+        assert len(etags) == 2  # noqa: PLR2004
+
+    def test_other_users(self, api_client: APIClient):
+        other = UserFactory()
+
+        response = api_client.get(
+            reverse("api:user-detail", kwargs={"username": other.username}),
+        )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert "ETag" not in response
@@ -0,0 +1,73 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import authenticate
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from restaurant_app.users.tests.factories import UserFactory
+
+PASSWORD = "a-long-enough-password"  # noqa: S105
+
+
+@pytest.fixture
+def argon2(settings):
+    settings.PASSWORD_HASHERS = ["restaurant_app.users.hashers.Argon2PasswordHasher"]
+    # As cheap as Argon2 gets.
+    settings.ARGON2_TIME_COST = 1
+    settings.ARGON2_MEMORY_COST = 64
+    settings.ARGON2_PARALLELISM = 1
+    return settings
+
+
+@pytest.mark.django_db
+def test_hashes_with_settings(argon2):
+    user = UserFactory(password=PASSWORD)
+
+    assert user.password.startswith("argon2$argon2id$v=19$m=64,t=1,p=1$")
+
+
+@pytest.mark.django_db
+def test_rehashes_on_login_when_settings_change(argon2):
+    user = UserFactory(password=PASSWORD)
+    argon2.ARGON2_TIME_COST = 2
+
+    assert authenticate(username=user.username, password=PASSWORD) == user
+    user.refresh_from_db()
+    assert user.password.startswith("argon2$argon2id$v=19$m=64,t=2,p=1$")
+    assert authenticate(username=user.username, password=PASSWORD) == user
+
+
+@pytest.mark.django_db
+def test_keeps_hash_when_settings_unchanged(argon2):
+    user = UserFactory(password=PASSWORD)
+    encoded = user.password
+
+    assert authenticate(username=user.username, password=PASSWORD) == user
+    user.refresh_from_db()
+    assert user.password == encoded
+
+
+def test_tune_argon2():
+    out = StringIO()
+    call_command(
+        "tune_argon2",
+        target_ms=10_000,
+        memory_cost=0,
+        parallelism=1,
+        max_time_cost=2,
+        samples=1,
+        stdout=out,
+    )
+
+    lines = out.getvalue().splitlines()
+    assert lines[-3:] == [
+        "DJANGO_ARGON2_TIME_COST=2",
+        "DJANGO_ARGON2_MEMORY_COST=19456",
+        "DJANGO_ARGON2_PARALLELISM=1",
+    ]
+
+
+def test_tune_argon2_unreachable_target():
+    with pytest.raises(CommandError, match="raise --target-ms"):
+        call_command("tune_argon2", target_ms=0.001, memory_cost=0, samples=1)
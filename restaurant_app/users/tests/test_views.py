@@ -1,6 +1,7 @@
 from http import HTTPStatus
 
 import pytest
+from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.models import AnonymousUser
@@ -82,20 +83,41 @@ class TestUserRedirectView:
         assert view.get_redirect_url() == f"/users/{user.username}/"
 
 
+def _auser(user):
+    async def auser():
+        return user
+
+    return auser
+
+
 class TestUserDetailView:
     def test_authenticated(self, user: User, rf: RequestFactory):
         request = rf.get("/fake-url/")
-        request.user = UserFactory()
-        response = user_detail_view(request, username=user.username)
+        request.auser = _auser(UserFactory())
+        response = async_to_sync(user_detail_view)(  # type: ignore[arg-type, var-annotated]
+            request,
+            username=user.username,
+        )
 
         assert response.status_code == HTTPStatus.OK
 
     def test_not_authenticated(self, user: User, rf: RequestFactory):
         request = rf.get("/fake-url/")
-        request.user = AnonymousUser()
-        response = user_detail_view(request, username=user.username)
+        request.auser = _auser(AnonymousUser())
+        response = async_to_sync(user_detail_view)(  # type: ignore[arg-type, var-annotated]
+            request,
+            username=user.username,
+        )
         login_url = reverse(settings.LOGIN_URL)
 
         assert isinstance(response, HttpResponseRedirect)
         assert response.status_code == HTTPStatus.FOUND
         assert response.url == f"{login_url}?next=/fake-url/"
+
+    def test_through_middleware(self, user: User, client):
+        """The async view must be reachable through TransactionURLResolver."""
+        client.force_login(user)
+        response = client.get(reverse("users:detail", args=[user.username]))
+
+        assert response.status_code == HTTPStatus.OK
+        assert user.username in response.content.decode()
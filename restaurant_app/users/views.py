@@ -1,6 +1,7 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
 from django.db.models import QuerySet
+from django.shortcuts import aget_object_or_404
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView
@@ -10,11 +11,37 @@ from django.views.generic import UpdateView
 from restaurant_app.users.models import User
 
 
-class UserDetailView(LoginRequiredMixin, DetailView):
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    """Async counterpart of ``LoginRequiredMixin``.
+
+    The user is resolved with ``request.auser()`` and stored on ``request.user``
+    so that templates rendered later don't hit the session again.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super(LoginRequiredMixin, self).dispatch(  # type: ignore[misc]
+            request,
+            *args,
+            **kwargs,
+        )
+
+
+class UserDetailView(AsyncLoginRequiredMixin, DetailView):
     model = User
     slug_field = "username"
     slug_url_kwarg = "username"
 
+    async def get(self, request, *args, **kwargs):
+        self.object = await aget_object_or_404(
+            self.model,
+            **{self.slug_field: kwargs[self.slug_url_kwarg]},
+        )
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
 
 user_detail_view = UserDetailView.as_view()
 